@@ -0,0 +1 @@
+"""Benchmarks of streamlit-reveal-slides decks (see `run.py` and `compare.py`)."""
@@ -0,0 +1,26 @@
+"""The app driven by `run.py --browser`.
+
+The deck is chosen with the BENCH_SIZE, BENCH_MIX and BENCH_MODE environment
+variables. The texts below the deck tell the benchmark when a rerun has
+finished and which position Python received.
+"""
+import os
+
+import streamlit as st
+
+import reveal_slides as rs
+from benchmarks.decks import MARKDOWN_PROPS, MIXES, generate_slides, plugins_for
+from benchmarks.run import KEY, MODES, deck_content
+
+size = int(os.environ.get("BENCH_SIZE", "100"))
+features = MIXES[os.environ.get("BENCH_MIX", "plain")]
+mode = os.environ.get("BENCH_MODE", "markdown")
+
+st.session_state["runs"] = st.session_state.get("runs", 0) + 1
+st.button("rerun")
+
+state = rs.slides(deck_content(generate_slides(size, features), mode), height=500, config={"plugins": plugins_for(features)},
+                  markdown_props=MARKDOWN_PROPS, report_on=["slidechanged"], key=KEY, **MODES[mode])
+
+st.text("runs: %d" % st.session_state["runs"])
+st.text("indexh: %d" % state["indexh"])
@@ -0,0 +1,51 @@
+"""Compare two benchmark result files (see `run.py`).
+
+    python -m benchmarks.compare baseline.json results.json --threshold 0.1
+
+Prints every metric of the cases both files have, with the ratio new/baseline,
+and exits with status 1 if any time, byte or memory metric grew by more than
+`--threshold` (e.g. to fail CI on a slower upgrade).
+"""
+import argparse
+import json
+import sys
+
+CASE_FIELDS = ("bridge", "size", "mix", "mode")
+
+
+def load(path):
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return data, {tuple(result[field] for field in CASE_FIELDS): result for result in data["results"]}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files.")
+    parser.add_argument("baseline")
+    parser.add_argument("results")
+    parser.add_argument("--threshold", type=float, default=0.1, help="relative growth reported as a regression")
+    args = parser.parse_args(argv)
+
+    baseline_data, baseline = load(args.baseline)
+    results_data, results = load(args.results)
+    print("baseline: %s" % json.dumps(baseline_data["environment"]))
+    print("results:  %s" % json.dumps(results_data["environment"]))
+
+    regressions = 0
+    for case in sorted(set(baseline) & set(results)):
+        print("\n%s %d slides %s %s" % case)
+        for metric, old in baseline[case].items():
+            new = results[case].get(metric)
+            if metric in CASE_FIELDS or not isinstance(old, (int, float)) or not isinstance(new, (int, float)):
+                continue
+            ratio = new / old if old else float("inf") if new else 1.0
+            regressed = ratio > 1 + args.threshold
+            regressions += regressed
+            print("  %-26s %14.1f %14.1f %8.2fx%s" % (metric, old, new, ratio, "  REGRESSION" if regressed else ""))
+
+    print("\n%d regression(s) over %d%%" % (regressions, args.threshold * 100))
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
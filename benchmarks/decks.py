@@ -0,0 +1,58 @@
+"""Synthetic decks for the benchmarks.
+
+Decks are generated deterministically from their parameters, so a run on a
+later version measures exactly the same content.
+"""
+
+FEATURES = ("math", "code", "fragments", "vertical")
+
+# Named feature mixes that can be passed to `run.py --mix`
+MIXES = {
+    "plain": (),
+    "math": ("math",),
+    "code": ("code",),
+    "fragments": ("fragments",),
+    "vertical": ("vertical",),
+    "all": FEATURES,
+}
+
+
+def generate_slide(index, features=()):
+    """Return the markdown of horizontal slide `index` (a vertical stack if "vertical" is in `features`)."""
+    lines = ["## Slide %d" % (index + 1), ""]
+    fragment = " <!-- .element: class=\"fragment\" -->" if "fragments" in features else ""
+    for point in range(3):
+        lines.append("- Point %d of slide %d with **bold** and `inline code`%s" % (point + 1, index + 1, fragment))
+    if "math" in features:
+        lines += ["", r"$$ \int_0^{%d} x^2 \, dx = \frac{%d^3}{3} $$" % (index + 1, index + 1), "",
+                  r"Inline \(e^{i\pi} + %d = %d\)" % (index, index + 1)]
+    if "code" in features:
+        lines += ["", "```python [1-2|3]", "def slide_%d(x):" % index, "    y = x * %d" % (index + 1), "    return y + 1", "```"]
+    lines += ["", "Note:", "Speaker notes for slide %d." % (index + 1)]
+    if "vertical" in features:
+        lines += ["", "--", "", "### Slide %d.2" % (index + 1), "", "Details of slide %d." % (index + 1)]
+    return "\n".join(lines)
+
+
+def generate_slides(size, features=()):
+    """Return the markdown of each of the `size` horizontal slides of a deck."""
+    return [generate_slide(index, features) for index in range(size)]
+
+
+def generate_deck(size, features=()):
+    """Return the markdown of a whole deck, slides separated by `---` (and `--` for vertical slides)."""
+    return "\n\n---\n\n".join(generate_slides(size, features))
+
+
+def plugins_for(features):
+    """The plugins a deck with `features` needs."""
+    plugins = ["notes"]
+    if "math" in features:
+        plugins.append("katex")
+    if "code" in features:
+        plugins.append("highlight")
+    return plugins
+
+
+# Passed as `markdown_props`, so "--" separates vertical slides
+MARKDOWN_PROPS = {"data-separator-vertical": "^--$"}
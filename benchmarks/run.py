@@ -0,0 +1,306 @@
+"""Benchmark decks of different sizes, plugin mixes and update modes.
+
+Two bridges are available:
+
+- "stub" (default) replaces the component frontend with a stub that records
+  what `slides` sends. It measures the Python side of every rerun: latency,
+  payload bytes and peak memory. It needs nothing but this package.
+- "browser" (`--browser`) starts a local Streamlit server with
+  `benchmarks/app.py` and drives it with headless Chromium. It measures time
+  to first slide, rerun latency, websocket bytes per rerun and the latency
+  from a navigation in the browser until Python receives it. It needs
+  playwright (`pip install playwright && playwright install chromium`).
+
+Results are written as JSON (see `--output`) and can be compared across
+versions with `benchmarks/compare.py`. Run from the repository root:
+
+    python -m benchmarks.run --sizes 10 100 1000 5000 --mix plain all --output results.json
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import re
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import streamlit as st
+
+import reveal_slides
+from reveal_slides import compiler, export
+
+from .decks import MARKDOWN_PROPS, MIXES, generate_slides, plugins_for
+
+# Arguments of `slides` for each update mode
+MODES = {
+    "markdown": {},
+    "precompile": {"precompile": True},
+    "incremental": {"incremental": True},
+    "prerender": {"prerender": True},
+    "window": {"window": 3},
+}
+
+APP = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+ROOT = os.path.dirname(os.path.dirname(APP))
+KEY = "bench"
+INITIAL_STATE = {"indexh": 0, "indexv": 0, "indexf": -1, "paused": False, "overview": False}
+
+
+class StubBridge(object):
+    """Stands in for the component frontend.
+
+    Records the arguments `slides` sends and returns the value the frontend
+    last set (see `set_value`), like the real component does.
+    """
+
+    def __init__(self):
+        self.args = None
+        self.value = None
+
+    def __call__(self, **kwargs):
+        default = kwargs.pop("default")
+        self.args = kwargs
+        return self.value if self.value is not None else default
+
+    def set_value(self, value):
+        # The frontend's value is what `slides` finds under its key in the session state
+        self.value = value
+        st.session_state[KEY] = value
+
+    @property
+    def payload_bytes(self):
+        return len(json.dumps(self.args, default=str).encode("utf-8"))
+
+
+def legacy_build():
+    # Whether the packaged frontend build predates the protocol of this version
+    return reveal_slides._PROTOCOL < reveal_slides.FRONTEND_PROTOCOL
+
+
+def unsupported(mode):
+    # Why `mode` cannot be measured with the packaged frontend build (None if it can)
+    if mode == "window" and legacy_build():
+        return "windowed decks need a frontend build with protocol %d" % reveal_slides.FRONTEND_PROTOCOL
+    return None
+
+
+def deck_content(slides, mode):
+    return slides if mode == "window" else "\n\n---\n\n".join(slides)
+
+
+def reset_session():
+    for name in ("_reveal_slides", KEY):
+        if name in st.session_state:
+            del st.session_state[name]
+    compiler.clear_cache()
+
+
+def call_slides(bridge, slides, features, mode):
+    start = time.perf_counter()
+    reveal_slides.slides(deck_content(slides, mode), config={"plugins": plugins_for(features)}, markdown_props=MARKDOWN_PROPS,
+                         report_on=["slidechanged"], key=KEY, **MODES[mode])
+    return (time.perf_counter() - start) * 1000, bridge.payload_bytes
+
+
+def run_stub_case(size, mix, mode, reruns):
+    features = MIXES[mix]
+    slides = generate_slides(size, features)
+    bridge = StubBridge()
+    component_func = reveal_slides._component_func
+    reveal_slides._component_func = bridge
+    try:
+        reset_session()
+        first_ms, first_bytes = call_slides(bridge, slides, features, mode)
+        bridge.set_value(dict(INITIAL_STATE))
+
+        rerun_ms = []
+        for _ in range(reruns):
+            elapsed, rerun_bytes = call_slides(bridge, slides, features, mode)
+            rerun_ms.append(elapsed)
+
+        # A live deck: one slide changes between reruns
+        edit_ms = []
+        for run in range(reruns):
+            slides[0] = slides[0] + "\n\nEdit %d" % run
+            elapsed, edit_bytes = call_slides(bridge, slides, features, mode)
+            edit_ms.append(elapsed)
+
+        # The viewer navigates: the frontend reports each new position (and windowed
+        # decks ask for the slides around it)
+        navigation_ms = []
+        for index in range(1, min(reruns, size - 1) + 1):
+            value = dict(INITIAL_STATE, indexh=index)
+            if mode == "window":
+                value["request"] = {"id": "bench-%d" % index, "type": "window", "index": index}
+            bridge.set_value(value)
+            elapsed, navigation_bytes = call_slides(bridge, slides, features, mode)
+            navigation_ms.append(elapsed)
+
+        # Peak memory of a cold first render, measured separately as tracing slows everything down
+        reset_session()
+        bridge.value = None
+        tracemalloc.start()
+        call_slides(bridge, generate_slides(size, features), features, mode)
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    finally:
+        reveal_slides._component_func = component_func
+        reset_session()
+
+    return {
+        "first_render_ms": first_ms,
+        "first_payload_bytes": first_bytes,
+        "rerun_ms": statistics.median(rerun_ms),
+        "rerun_payload_bytes": rerun_bytes,
+        "edit_rerun_ms": statistics.median(edit_ms),
+        "edit_payload_bytes": edit_bytes,
+        "navigation_rerun_ms": statistics.median(navigation_ms) if navigation_ms else None,
+        "navigation_payload_bytes": navigation_bytes if navigation_ms else None,
+        "peak_memory_bytes": peak_memory,
+    }
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def wait_for_server(port, timeout=60):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=1):
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError("The Streamlit server did not start on port %d." % port)
+
+
+def run_browser_case(size, mix, mode, reruns):
+    from playwright.sync_api import sync_playwright
+
+    port = free_port()
+    # The app imports the `benchmarks` package, so the server needs the repository on its path
+    env = dict(os.environ, BENCH_SIZE=str(size), BENCH_MIX=mix, BENCH_MODE=mode,
+               PYTHONPATH=os.pathsep.join(filter(None, [ROOT, os.environ.get("PYTHONPATH")])))
+    server = subprocess.Popen([sys.executable, "-m", "streamlit", "run", APP, "--server.headless", "true", "--server.port", str(port),
+                               "--browser.gatherUsageStats", "false"], env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        wait_for_server(port)
+        with sync_playwright() as playwright:
+            browser = playwright.chromium.launch()
+            page = browser.new_page()
+            received = []
+            page.on("websocket", lambda ws: ws.on("framereceived", lambda payload: received.append(len(payload))))
+
+            start = time.perf_counter()
+            page.goto("http://127.0.0.1:%d" % port)
+            deck = page.frame_locator("iframe[title*='reveal_slides']")
+            deck.locator(".reveal .slides section.present").first.wait_for(timeout=120000)
+            first_slide_ms = (time.perf_counter() - start) * 1000
+            page.get_by_text("runs: 1").wait_for()
+            first_bytes = sum(received)
+
+            rerun_ms = []
+            rerun_bytes = []
+            for run in range(2, reruns + 2):
+                del received[:]
+                start = time.perf_counter()
+                page.get_by_role("button", name="rerun").click()
+                page.get_by_text("runs: %d" % run).wait_for()
+                rerun_ms.append((time.perf_counter() - start) * 1000)
+                rerun_bytes.append(sum(received))
+
+            # From a key press in the deck until Python has the new position
+            navigation_ms = []
+            deck.locator(".reveal").click()
+            for index in range(1, min(reruns, size - 1) + 1):
+                start = time.perf_counter()
+                page.keyboard.press("ArrowRight")
+                page.get_by_text("indexh: %d" % index, exact=True).wait_for()
+                navigation_ms.append((time.perf_counter() - start) * 1000)
+
+            frame = next(frame for frame in page.frames if "reveal_slides" in frame.url)
+            js_heap = frame.evaluate("() => performance.memory ? performance.memory.usedJSHeapSize : null")
+            browser.close()
+    finally:
+        server.terminate()
+        server.wait()
+
+    return {
+        "first_slide_ms": first_slide_ms,
+        "first_payload_bytes": first_bytes,
+        "rerun_ms": statistics.median(rerun_ms),
+        "rerun_payload_bytes": statistics.median(rerun_bytes),
+        "navigation_callback_ms": statistics.median(navigation_ms) if navigation_ms else None,
+        "js_heap_bytes": js_heap,
+    }
+
+
+def environment():
+    with open(os.path.join(export.RUNTIME_DIR, "reveal.js"), encoding="utf-8") as f:
+        match = re.search(r"reveal\.js (\d+\.\d+\.\d+)", f.read(500))
+    try:
+        from importlib.metadata import version
+        package_version = version("streamlit-reveal-slides")
+    except Exception:
+        package_version = None
+    return {
+        "streamlit-reveal-slides": package_version,
+        "frontend_protocol": reveal_slides._PROTOCOL,
+        "reveal.js": match.group(1) if match else None,
+        "streamlit": st.__version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark streamlit-reveal-slides decks.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 5000], help="number of horizontal slides")
+    parser.add_argument("--mix", nargs="+", default=["plain", "all"], choices=sorted(MIXES), help="feature mixes of the slides")
+    parser.add_argument("--modes", nargs="+", default=["markdown", "precompile", "incremental", "window"], choices=sorted(MODES))
+    parser.add_argument("--reruns", type=int, default=5, help="reruns (and navigation steps) measured per case")
+    parser.add_argument("--browser", action="store_true", help="measure in headless Chromium against a local Streamlit server")
+    parser.add_argument("--output", default="benchmark-results.json")
+    args = parser.parse_args(argv)
+    if args.browser and legacy_build():
+        # The browser would measure how the old build falls back, not this version
+        parser.error("--browser needs a frontend build with protocol %d, the packaged build predates it. "
+                     "Rebuild the frontend first (`npm run build` in reveal_slides/frontend)." % reveal_slides.FRONTEND_PROTOCOL)
+
+    bridge = "browser" if args.browser else "stub"
+    run_case = run_browser_case if args.browser else run_stub_case
+    results = []
+    skipped = []
+    for size in args.sizes:
+        for mix in args.mix:
+            for mode in args.modes:
+                reason = unsupported(mode)
+                if reason:
+                    skipped.append(dict(bridge=bridge, size=size, mix=mix, mode=mode, reason=reason))
+                    print("%-7s %5d slides  %-9s %-11s skipped: %s" % (bridge, size, mix, mode, reason))
+                    continue
+                metrics = run_case(size, mix, mode, args.reruns)
+                results.append(dict(bridge=bridge, size=size, mix=mix, mode=mode, **metrics))
+                print("%-7s %5d slides  %-9s %-11s %s" % (bridge, size, mix, mode, "  ".join(
+                    "%s=%s" % (name, "%.1f" % value if isinstance(value, float) else value) for name, value in metrics.items())))
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({
+            "created": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "environment": environment(),
+            "results": results,
+            "skipped": skipped,
+        }, f, indent=2)
+    print("Results written to %s" % args.output)
+
+
+if __name__ == "__main__":
+    main()
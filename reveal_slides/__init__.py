@@ -1,6 +1,20 @@
+import json
 import os
+import time
+import warnings
+from functools import partial
+
+import streamlit as st
 import streamlit.components.v1 as components
 
+from . import callbacks, compiler, diff, media, prerender as prerendering, search as searching, styles, sync, window as windowing
+from .callbacks import on_fragment, on_slide
+from .deck import Deck, Slide
+from .capture import export_batch, export_images, export_pdf
+from .export import export_html
+from .profiling import Timings, aggregate_timings
+from .search import SearchIndex, search
+
 # Create a _RELEASE constant. We'll set this to False while we're developing
 # the component, and True when we're ready to package and distribute it.
 # (This is, of course, optional - there are innumerable ways to manage your
@@ -35,45 +49,475 @@ else:
     build_dir = os.path.join(parent_dir, "frontend/build")
     _component_func = components.declare_component("reveal_slides", path=build_dir)
 
+# The version of the protocol between `slides` and the frontend: compiled decks referred
+# to by digest, slide patches, `Deck` data and requests from the frontend. `npm run build`
+# copies it from `public/protocol.json` into the build.
+FRONTEND_PROTOCOL = 1
+
+
+def _build_protocol():
+    # The protocol the frontend build speaks. Builds that predate it have no protocol.json:
+    # they are sent every deck as plain markup, which any build renders.
+    if not _RELEASE:
+        return FRONTEND_PROTOCOL
+    try:
+        with open(os.path.join(build_dir, "protocol.json"), encoding="utf-8") as f:
+            return json.load(f)["protocol"]
+    except (OSError, ValueError, KeyError):
+        return 0
+
+
+_PROTOCOL = _build_protocol()
+
+
+def _legacy_fallback(argument, fallback):
+    # Say what an argument falls back to with a frontend build that predates it
+    warnings.warn("The frontend build predates `%s`: %s. Rebuild the frontend (`npm run build`) to use it." % (argument, fallback), RuntimeWarning, stacklevel=3)
+
+
+# The reveal.js events that can send the presentation state back to Streamlit
+# (see the `report_on` argument of `slides`).
+REPORT_EVENTS = ("slidechanged", "fragmentshown", "fragmenthidden", "overviewshown", "overviewhidden", "paused", "resumed")
+
+# The values of `performance_mode`
+PERFORMANCE_MODES = ("auto", "quality", "low_power")
+# reveal.js transitions that low power mode turns off
+_TRANSITIONS_3D = ("convex", "concave", "zoom")
+
 
 # Create a wrapper function for the component. This is an optional
 # best practice - we could simply expose the component function returned by
 # `declare_component` and call it done. The wrapper allows us to customize
 # our component's API: we can pre-process its input args, post-process its
 # output value, and add a docstring for users.
-def slides(content, height="auto", theme="black", css="", config={}, markdown_props={}, initial_state={}, allow_unsafe_html=False, display_only=False, key=None):
+def slides(content, height="auto", theme="black", css="", config={}, markdown_props={}, initial_state={}, allow_unsafe_html=False, display_only=False, key=None, *, height_hint=None, precompile=False, incremental=False, prerender=False, report_on=None, debounce=0, window=None, total=None, lazy_media=False, preload=None, private_notes=False, presenter=False, search_index=False, merge_css=False, performance_mode="quality", broadcast=None, follow=None, follow_interval=sync.DEFAULT_FOLLOW_INTERVAL, profile=False):
     """Create a new instance of "slides".
 
+    The arguments after `key` are keyword-only.
+
     Parameters
     ----------
-    name: str
-        The name of the thing we're saying hello to. The component will display
-        the text "Hello, {name}!"
+    content: str or Deck
+        The presentation content in markdown (or markup if `allow_unsafe_html` is True), or
+        a `Deck` of `Slide` objects, which is sent as a compact list of slides. For windowed decks (see `window`), a sequence, iterable or callable `get_slide(i)`
+        of the markdown (or `Slide`) of each horizontal slide.
+    height: int or "auto"
+        The height of the component in pixels. "auto" sizes the component to its content.
+    theme: str
+        The name of the reveal.js theme to use (e.g. "black", "white", "moon").
+    css: str
+        Custom css injected into the component.
+    config: dict
+        Any option you can pass to `Reveal.initialize`. Plugins are listed by name
+        in `config["plugins"]`.
+    markdown_props: dict
+        Attributes added to the markdown `<section>` (e.g. `data-separator-vertical`).
+    initial_state: dict
+        The state (`indexh`, `indexv`, `indexf`, `paused`, `overview`) the presentation starts in.
+    allow_unsafe_html: bool
+        Treat `content` as markup instead of markdown. The markup is not sanitized.
+    display_only: bool
+        If True, the component does not send its state back to Streamlit.
     key: str or None
         An optional key that uniquely identifies this component. If this is
         None, and the component's arguments are changed, the component will
         be re-mounted in the Streamlit frontend and lose its current state.
+        Callbacks registered with `on_slide` / `on_fragment` for this key run with
+        the deck in a fragment (Streamlit 1.37 or later), so navigating only reruns
+        the deck and its callbacks, not the script. With older versions of Streamlit,
+        they run with the deck on every run of the script.
+    height_hint: int, float, str or None
+        The height an "auto" sized component starts at, so that the first paint already has
+        the right size: a height in pixels, or an aspect ratio (width / height) as a float or
+        a "16:9" string. Defaults to the height the deck settled on when it was last shown
+        (remembered per `key`).
+    precompile: bool
+        If True, the markdown is compiled into slide markup in Python instead of in the
+        browser. Compiled decks are cached by content hash and, when `key` is set, a
+        deck the frontend already has is sent as a short digest instead of the full markup.
+    incremental: bool
+        If True (implies `precompile`, requires `key`), a change to `content` only sends the
+        slides that were added or changed. The frontend updates those slides in place and
+        keeps the current slide position instead of rebuilding the whole deck.
+    prerender: bool
+        If True (implies `precompile`), LaTeX is rendered to MathML (if a math plugin is in
+        `config["plugins"]`) and code blocks are syntax highlighted (if the highlight plugin is)
+        in Python (results are memoized per snippet). The math and highlight plugins are then not
+        needed and are dropped from `config["plugins"]`. Requires the `prerender` extra
+        (`pip install streamlit-reveal-slides[prerender]`).
+    report_on: list of str or None
+        The reveal.js events (see `REPORT_EVENTS`) that send the presentation state back
+        to Streamlit, e.g. `["slidechanged"]`. Every report reruns the script. Defaults to all of them.
+    debounce: int
+        Wait this many milliseconds after the last event before reporting the state, so that
+        a quick run of navigation steps only reruns the script once for the final position.
+    window: int or None
+        Windowed mode for very large decks (requires `key`). Only the current slide and `window`
+        slides on each side of it are compiled, sent and mounted. More slides are requested
+        as the viewer navigates. The reported `indexh` is the index in the whole deck.
+    total: int or None
+        The number of slides of a windowed deck. Required if `content` is a callable or an
+        iterator without a length.
+    lazy_media: bool
+        If True (implies `precompile`), images, videos, audio and iframes are only loaded when
+        their slide is within `preload` slides of the current one (backgrounds always are).
+        Media files on disk referred to by a relative or absolute path are served through
+        Streamlit's media endpoint, which supports range requests and caching.
+    preload: int or None
+        How many slides away from the current slide media is loaded (the reveal.js
+        `viewDistance` and `mobileViewDistance`). Defaults to the reveal.js defaults (3, and 2 on mobile).
+    private_notes: bool
+        If True (implies `precompile`), speaker notes are taken out of the slides sent to the
+        browser and kept in Python. While the speaker view (notes plugin) is open, the notes of
+        the current slide are requested from Python (requires `key` and `presenter`). Notes of
+        a compiled deck are also available with `compiler.compile_deck(...).notes_for(indexh, indexv)`
+        (or `Deck.notes_for`). Cannot be used with `allow_unsafe_html`.
+    presenter: bool
+        If True, this deck's speaker view gets the private notes (see `private_notes`). Only
+        pass it in the presenter's session (e.g. after checking who is logged in): the notes
+        requests of other decks are not answered, so viewers never receive the notes.
+    search_index: bool
+        If True (implies `precompile`), an index of the words of every slide is built in Python
+        (memoized per deck) and sent to the frontend once per session (when `key` is set). The
+        `search` plugin (Ctrl+Shift+F) then looks words up in the index instead of walking the
+        slides, and also finds the slides of a windowed deck that are not mounted (windowed
+        decks must then be given as a sequence). See also `search`.
+    merge_css: bool
+        If True, the theme and `css` are merged into one minified stylesheet in Python and
+        served by url (with the theme's fonts), so browsers cache it across reruns and
+        sessions and the deck only restyles when the theme or `css` change. Without a
+        Streamlit server, the theme and css are applied as usual.
+    performance_mode: str
+        "quality" (the default) renders the deck as configured. "low_power" turns down what is
+        costly to render: fewer slides kept rendered around the current one (`viewDistance`),
+        no 3D transitions, parallax backgrounds, auto-animate or background videos, and no
+        fragments rendered on the slides that are not shown. "auto" measures the frame rate in
+        the browser and switches to low power once the deck renders under 30 frames per second.
+        Both report the mode in effect and the measured frame rate (see Returns).
+    broadcast: str or None
+        Present to a channel: every state this deck reports (see `report_on`) is published to
+        the channel, for the decks that `follow` it in any session of the server.
+    follow: str or None
+        Follow the deck presenting to a channel (requires `key`). The deck moves to the
+        presenter's position (`indexh`, `indexv`, `indexf` and `overview`) and does not report
+        its own state. `initial_state` only applies until the presenter has published.
+    follow_interval: float or None
+        Seconds between two checks for a new position of the followed channel, when the
+        channel's backend may carry positions published in other server processes (see
+        `sync.set_backend`). With the default in-process backend, the deck is rerun when the
+        presenter publishes instead. Either way only the deck reruns (in a fragment, which
+        needs Streamlit 1.37 or later), not the script. With None, the deck only moves when
+        the script reruns.
+    profile: bool
+        If True, the returned dict also holds a `Timings` record under "profile": the size
+        of everything sent to the frontend, the Python compile time and the timings measured in the browser
+        (markdown parsing, plugin loading, typesetting, reveal.js initialization, theme loading).
+        Records can be summarized across sessions with `aggregate_timings`.
 
     Returns
     -------
-    int
-        The number of times the component's "Click Me" button has been clicked.
-        (This is the value passed to `Streamlit.setComponentValue` on the
-        frontend.)
+    dict
+        The current state of the presentation (`indexh`, `indexv`, `indexf`, `paused`
+        and `overview`). This is the value passed to `Streamlit.setComponentValue`
+        on the frontend. With `profile`, also the `Timings` record under "profile".
+        With `performance_mode` "auto" or "low_power", also {"mode", "fps"} (the mode in
+        effect and the last measured frame rate) under "performance"; switching to low
+        power reports it. A deck that runs in a fragment (callbacks or `follow`) only returns a new
+        state to the script on full reruns; use callbacks to act on navigation.
 
     """
+    arguments = dict(locals())
+    if key is not None and not callbacks.in_scope(key):
+        # Decks with callbacks (see `on_slide`) and followers rerun in a fragment: navigating
+        # or picking up a new position of the followed channel only reruns the deck and its
+        # callbacks, not the script
+        def run_deck():
+            with callbacks.scope(key):
+                state = slides(**arguments)
+            callbacks.dispatch(key, callbacks.position(state, initial_state, follow))
+            return state
+
+        active = callbacks.activate(key)
+        if hasattr(st, "fragment"):
+            follower = follow is not None and broadcast is None and follow_interval is not None
+            # Followers are rerun when their channel is published to or, when the hub cannot
+            # tell (positions published in other processes), check it every `follow_interval`
+            pushed = follower and sync.push_supported()
+            run_every = follow_interval if follower and not pushed else None
+            if active or pushed or run_every:
+                # Streamlit derives the id of a fragment from its function's module and qualified
+                # name (and where it is rendered). `run_deck` has the same name for every deck, so
+                # it is named after the deck's key to keep the fragments of several decks apart.
+                run_deck.__qualname__ = "slides.fragment.%s" % key
+                return st.fragment(run_every=run_every)(run_deck)()
+        elif active:
+            # Without fragments (Streamlit before 1.37) the callbacks run with the script
+            return run_deck()
+
+    if follow is not None:
+        if broadcast is not None:
+            raise ValueError("A deck cannot both broadcast and follow.")
+        if key is None:
+            raise ValueError("Following decks (`follow`) need a `key`.")
+        if callbacks.in_scope(key) and sync.push_supported():
+            store = _session_store(key)
+            store["follow"] = sync.follow_fragment(follow, store["follow"])
+        message = sync.get_hub().latest(follow)
+        if message is not None:
+            initial_state = dict(initial_state, **message["state"])
+        display_only = True
+        precompile = True
+
+    if performance_mode not in PERFORMANCE_MODES:
+        raise ValueError("Invalid performance_mode %r. Expected any of: %s." % (performance_mode, ", ".join(PERFORMANCE_MODES)))
+
+    if isinstance(content, Deck) and allow_unsafe_html:
+        raise TypeError("A Deck holds markdown slides, it cannot be used with allow_unsafe_html.")
+    if private_notes and allow_unsafe_html:
+        raise ValueError("Private speaker notes (`private_notes`) are taken out of compiled markdown, they cannot be used with allow_unsafe_html.")
+
+    legacy = _PROTOCOL < FRONTEND_PROTOCOL
+    if legacy:
+        # The frontend build does not know digests, patches or `Deck` data: decks are
+        # compiled and sent whole, as markup
+        if window is not None:
+            raise RuntimeError("Windowed decks (`window`) need a frontend build made from the current sources (`npm run build`).")
+        if (incremental or isinstance(content, Deck)) and not allow_unsafe_html:
+            precompile = True
+        if incremental and not allow_unsafe_html:
+            _legacy_fallback("incremental", "changed decks are sent whole instead of as patches")
+        if private_notes:
+            _legacy_fallback("private_notes", "speaker notes are left out of the slides and the speaker view shows none")
+        if performance_mode == "low_power":
+            _legacy_fallback("performance_mode", "low power mode only turns down the reveal.js options, background videos and the fragments of hidden slides still render")
+        elif performance_mode == "auto":
+            _legacy_fallback("performance_mode", "the frame rate is not measured and the deck renders as configured")
+        if merge_css:
+            _legacy_fallback("merge_css", "the theme and css are applied separately on every render")
+        if height_hint is not None:
+            _legacy_fallback("height_hint", "the component starts at its default height")
+        if report_on is not None or debounce:
+            _legacy_fallback("report_on" if report_on is not None else "debounce", "every navigation reports the state right away")
+
+    if report_on is not None:
+        unknown = [event for event in report_on if event not in REPORT_EVENTS]
+        if unknown:
+            raise ValueError("Unknown report_on event(s): %s. Expected any of: %s." % (", ".join(unknown), ", ".join(REPORT_EVENTS)))
+        report_on = list(report_on)
+    if isinstance(debounce, bool) or not isinstance(debounce, (int, float)) or debounce < 0:
+        raise ValueError("Invalid debounce %r. Expected a number of milliseconds (0 or more)." % (debounce,))
+
+    code_css = None
+    if prerender and not allow_unsafe_html:
+        precompile = True
+        # Only what the deck's plugins would render in the browser is pre-rendered
+        prerender = prerendering.prerender_steps(config.get("plugins", []))
+        config = dict(config, plugins=[name for name in config.get("plugins", []) if name not in prerendering.PRERENDERED_PLUGINS])
+        if "highlight" in prerender:
+            code_css = prerendering.code_stylesheet()
+    if code_css is not None and (merge_css or legacy):
+        # The colors of pre-rendered code go with the custom css (into the merged stylesheet)
+        css = css + "\n" + code_css if css else code_css
+        code_css = None
+
+    if (lazy_media or private_notes or search_index) and not allow_unsafe_html:
+        precompile = True
+    if preload is not None:
+        config = dict(config, viewDistance=preload, mobileViewDistance=preload)
+    if legacy and performance_mode == "low_power":
+        # The frontend build predates low power mode: its reveal.js options are set here
+        config = dict(config, **_low_power_config(config))
+
+    stylesheet = styles.serve_stylesheet(theme, css, key) if merge_css and not legacy else None
+    if stylesheet is not None:
+        # The custom css is part of the stylesheet, so it is not sent on every rerun
+        css = ""
+    frame_hint = _frame_hint(height_hint, _session_store(key) if key is not None else None)
+
+    digest = None
+    patch = None
+    deck_data = None
+    notes = None
+    notes_for = None
+    index = None
+    request = None
+    compile_start = time.perf_counter()
+    compiled = False
+    if key is not None and (precompile or incremental or window is not None or allow_unsafe_html):
+        store = _session_store(key)
+        request = _pending_request(store, st.session_state.get(key))
+        if request and request.get("type") == "digest":
+            store["digests"].discard(request.get("digest"))
+        elif request and request.get("type") == "slides":
+            # The frontend lost its slides (e.g. it was remounted): everything is sent
+            # again, marked with the request so the same digest is applied again
+            store["slides"] = set()
+            store["resent"] = request.get("id")
+        elif request and request.get("type") == "search":
+            store["indexes"].discard(request.get("digest"))
+        elif request and request.get("type") == "style":
+            store["styles"].discard(request.get("digest"))
+
+    if window is not None:
+        if key is None:
+            raise ValueError("Windowed decks (`window`) need a `key`.")
+        source = windowing.SlideSource(content, total)
+        if search_index:
+            if callable(content) or not hasattr(content, "__len__"):
+                raise ValueError("Searching a windowed deck (`search_index`) needs its slides as a sequence.")
+            index = searching.index_items(content, markdown_props, config.get("markdown"), prerender)
+        # Center the window on the slide the frontend asked for, or on the
+        # initial slide when the deck is first shown or `initial_state` changes
+        initial_index = initial_state.get("indexh", 0)
+        if request and request.get("type") == "window":
+            store["center"] = request.get("index", 0)
+        elif store["center"] is None or initial_index != store["initial"]:
+            store["center"] = initial_index
+        store["initial"] = initial_index
+        compiled = True
+        patch = windowing.window_patch(source, store["center"], window, markdown_props, config.get("markdown"), store["slides"], prerender, lazy_media)
+        if lazy_media:
+            store["media"] = media.serve_patch(patch, store["media"], key)
+        if private_notes:
+            for slide_id, markup in patch["slides"].items():
+                patch["slides"][slide_id] = compiler.split_notes_markup(markup)[0]
+            notes_for = partial(windowing.item_notes, source, markdown_props=markdown_props, options=config.get("markdown"), prerender=prerender, lazy_media=lazy_media)
+        store["slides"] = set(diff.flatten_ids(patch["layout"]))
+        digest = patch["digest"]
+        content = ""
+    elif (precompile or incremental) and not allow_unsafe_html:
+        compiled = True
+        deck = compiler.compile_deck(content, markdown_props, config.get("markdown"), prerender, lazy_media)
+        if lazy_media:
+            deck = media.serve_deck(deck, key)
+        if private_notes:
+            deck = deck.without_notes()
+            notes_for = deck.notes_for
+        if search_index:
+            index = searching.index_deck(deck)
+        digest = deck.digest
+        content = deck.html
+        if legacy:
+            allow_unsafe_html = True
+        elif key is not None:
+            if incremental:
+                content = ""
+                patch = diff.deck_patch(deck, store["slides"])
+                store["slides"] = set(diff.flatten_ids(deck.slide_ids))
+            elif digest in store["digests"]:
+                content = ""
+            else:
+                store["digests"].add(digest)
+    elif allow_unsafe_html and key is not None and not legacy:
+        # Markup from the script is sent like a compiled deck: once, then by its digest
+        digest = compiler.content_digest(content)
+        if digest in store["digests"]:
+            content = ""
+        else:
+            store["digests"].add(digest)
+    elif isinstance(content, Deck):
+        deck_data = content.serialize()
+        content = ""
+
+    if patch is not None:
+        patch["resend"] = store.get("resent")
+
+    # The speaker view asks for the notes of the slide it shows. Only the presenter's
+    # requests are answered: any viewer could send one
+    if notes_for is not None and presenter and key is not None:
+        if request and request.get("type") == "notes":
+            store["notes"] = (request.get("indexh", 0), request.get("indexv", 0), request.get("id"))
+        if store["notes"] is not None:
+            indexh, indexv, request_id = store["notes"]
+            notes = {"indexh": indexh, "indexv": indexv, "html": notes_for(indexh, indexv), "request": request_id}
+
+    # Like compiled decks, an index the frontend already has is only referred to by its digest
+    index_digest = index.digest if index is not None else None
+    index_data = None
+    if index is not None and (key is None or index_digest not in store["indexes"]):
+        index_data = index.serialize()
+        if key is not None:
+            store["indexes"].add(index_digest)
+
+    # So is the stylesheet of pre-rendered code
+    code_style = None
+    if code_css is not None:
+        code_style = {"digest": compiler.content_digest(code_css), "css": None}
+        if key is None or code_style["digest"] not in store["styles"]:
+            code_style["css"] = code_css
+            if key is not None:
+                store["styles"].add(code_style["digest"])
+
+    compile_time = (time.perf_counter() - compile_start) * 1000 if compiled else None
+
     # Call through to our private component function. Arguments we pass here
     # will be sent to the frontend, where they'll be available in an "args"
     # dictionary.
     #
     # "default" is a special argument that specifies the initial return
     # value of the component before the user has interacted with it.
-    component_value = _component_func(content=content, height=height, theme=theme, css=css, config=config, markdown_props=markdown_props, initial_state=initial_state, allow_unsafe_html=allow_unsafe_html, display_only=display_only, key=key, default={ "indexh": -1, "indexv": -1, "indexf": -1, "paused": False, "overview": False})
+    args = dict(content=content, height=height, theme=theme, css=css, config=config, markdown_props=markdown_props, initial_state=initial_state, allow_unsafe_html=allow_unsafe_html, display_only=display_only, height_hint=frame_hint, deck=deck_data, digest=digest, patch=patch, private_notes=private_notes, presenter=presenter, notes=notes, search_digest=index_digest, search_index=index_data, code_style=code_style, stylesheet=stylesheet, performance_mode=performance_mode, report_on=report_on, debounce=debounce, profile=profile)
+    component_value = _component_func(key=key, default={ "indexh": -1, "indexv": -1, "indexf": -1, "paused": False, "overview": False}, **args)
 
-    # We could modify the value returned from the component if we wanted.
-    # There's no need to do this in our simple example - but it's an option.
+    # Requests and timings from the frontend travel with the component value but
+    # are not part of the presentation state returned to the user.
+    if isinstance(component_value, dict):
+        report = component_value.get("profile")
+        if key is not None and component_value.get("frame_height"):
+            _session_store(key)["height"] = component_value["frame_height"]
+        component_value = {k: v for k, v in component_value.items() if k not in ("request", "profile", "frame_height")}
+        if profile:
+            # Streamlit sends the arguments to the frontend as one JSON document
+            payload_size = len(json.dumps(args).encode("utf-8"))
+            component_value["profile"] = Timings.from_report(report, payload_size, compile_time)
+        if broadcast is not None and component_value.get("indexh", -1) >= 0:
+            sync.get_hub().publish(broadcast, component_value)
     return component_value
 
+
+def _session_store(key):
+    # Per-session bookkeeping for the component instance identified by `key`
+    stores = st.session_state.setdefault("_reveal_slides", {})
+    return stores.setdefault(key, {"digests": set(), "slides": set(), "center": None, "initial": None, "handled": None, "media": {}, "height": None, "notes": None, "indexes": set(), "styles": set(), "resent": None, "follow": None})
+
+
+def _low_power_config(config):
+    # The reveal.js options of low power mode (same as `lowPowerOptions` in the frontend)
+    return {
+        "transition": "none" if config.get("transition") in _TRANSITIONS_3D else config.get("transition", "slide"),
+        "backgroundTransition": "none" if config.get("backgroundTransition") in _TRANSITIONS_3D else config.get("backgroundTransition", "fade"),
+        "viewDistance": min(config.get("viewDistance", 3), 1),
+        "mobileViewDistance": min(config.get("mobileViewDistance", 2), 1),
+        "parallaxBackgroundImage": "",
+        "autoAnimate": False,
+    }
+
+
+def _frame_hint(height_hint, store):
+    # The height hint as sent to the frontend: {"height": pixels} or {"aspect_ratio": width / height}
+    if height_hint is None:
+        return {"height": store["height"]} if store and store["height"] else None
+    if isinstance(height_hint, str):
+        try:
+            width, height = (float(part) for part in height_hint.split(":"))
+            return {"aspect_ratio": width / height}
+        except (ValueError, ZeroDivisionError):
+            raise ValueError("Invalid height_hint %r. Expected a height in pixels or an aspect ratio such as \"16:9\"." % height_hint)
+    if isinstance(height_hint, float):
+        return {"aspect_ratio": height_hint}
+    return {"height": int(height_hint)}
+
+
+def _pending_request(store, component_value):
+    # The frontend asks for things (e.g. a compiled deck it does not have) by
+    # attaching a `request` with a unique id to the component value. Each
+    # request is handled only once even though the value persists across reruns.
+    request = component_value.get("request") if isinstance(component_value, dict) else None
+    if not request or request.get("id") == store["handled"]:
+        return None
+    store["handled"] = request.get("id")
+    return request
+
 # Add some test code to play with the component while it's in development.
 # During development, we can run this just as we would any other Streamlit
 # app: `$ streamlit run slides/__init__.py`
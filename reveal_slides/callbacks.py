@@ -0,0 +1,120 @@
+"""Per-slide callbacks that rerun with the deck instead of the whole script.
+
+Navigation normally reaches Python as a new return value of `slides`, which
+reruns the whole script (data loading included). Callbacks registered for a
+deck with `on_slide` / `on_fragment` run together with the deck in a fragment
+(`st.fragment`), so a slide change only reruns the deck and the callbacks of
+the new position:
+
+    @rs.on_slide(2, key="sales")
+    def revenue_panel(state):
+        st.line_chart(revenue)
+
+    rs.slides(deck, key="sales")
+
+Callbacks are registered on every full script run, before the `slides` call
+of their deck (which picks them up), and render below the deck. They are
+called with the state of the presentation on every run of the deck, so the
+content of the current slide stays on the page. Versions of Streamlit without
+`st.fragment` (before 1.37) call them with the deck in the script run, so
+navigating reruns the script as it does without callbacks.
+"""
+import threading
+
+import streamlit as st
+
+from . import sync
+
+_SESSION_KEY = "_reveal_slides_callbacks"
+
+# The keys of the decks whose `slides` call is running inside its fragment
+_scopes = threading.local()
+
+
+def _registry(key):
+    registries = st.session_state.setdefault(_SESSION_KEY, {})
+    return registries.setdefault(key, {"registered": [], "active": []})
+
+
+def _register(key, indexh, indexv, indexf, fn):
+    if key is None:
+        raise ValueError("Callbacks are registered for a deck: pass the `key` of its `slides` call.")
+    if fn is None:
+        # Used as a decorator
+        def decorator(fn):
+            _register(key, indexh, indexv, indexf, fn)
+            return fn
+
+        return decorator
+    if not callable(fn):
+        raise TypeError("Callbacks must be callable, not %s." % type(fn).__name__)
+    _registry(key)["registered"].append((indexh, indexv, indexf, fn))
+    return fn
+
+
+def on_slide(indexh, indexv=None, fn=None, key=None):
+    """Call `fn(state)` while the deck `key` shows the slide at `(indexh, indexv)`.
+
+    With `indexv` None, every slide of the vertical stack at `indexh` matches.
+    Without `fn`, returns a decorator.
+    """
+    return _register(key, indexh, indexv, None, fn)
+
+
+def on_fragment(indexh, indexv, indexf, fn=None, key=None):
+    """Call `fn(state)` while the deck `key` shows fragment `indexf` of the slide at `(indexh, indexv)`.
+
+    Without `fn`, returns a decorator.
+    """
+    return _register(key, indexh, indexv, indexf, fn)
+
+
+def activate(key):
+    """Make the callbacks registered for `key` since its last `slides` call the active ones.
+
+    Called once per full script run. Returns the active callbacks.
+    """
+    registry = _registry(key)
+    registry["active"], registry["registered"] = registry["registered"], []
+    return registry["active"]
+
+
+def in_scope(key):
+    """Return True while the deck `key` is rendered inside its fragment."""
+    return key in getattr(_scopes, "keys", ())
+
+
+class scope(object):
+    """Marks the deck `key` as rendered inside its fragment (see `in_scope`)."""
+
+    def __init__(self, key):
+        self.key = key
+
+    def __enter__(self):
+        _scopes.keys = getattr(_scopes, "keys", frozenset()) | {self.key}
+        return self
+
+    def __exit__(self, *exc_info):
+        _scopes.keys = _scopes.keys - {self.key}
+
+
+def position(state, initial_state=None, follow=None):
+    """The position shown by a deck: the latest one of the followed channel, the state
+    reported by the frontend or, before the first report, the initial state."""
+    if follow is not None:
+        message = sync.get_hub().latest(follow)
+        if message is not None:
+            return dict(state, **message["state"])
+    if state.get("indexh", -1) >= 0:
+        return state
+    return dict(state, **dict({"indexh": 0, "indexv": 0, "indexf": -1}, **(initial_state or {})))
+
+
+def dispatch(key, state):
+    """Call the active callbacks of the deck `key` that match `state`."""
+    for indexh, indexv, indexf, fn in _registry(key)["active"]:
+        if indexh != state.get("indexh") or (indexv is not None and indexv != state.get("indexv", 0)):
+            continue
+        if indexf is not None and indexf != state.get("indexf"):
+            continue
+        fn(state)
@@ -0,0 +1,295 @@
+"""PDF and image export of decks through headless Chromium.
+
+Each deck is written as a static presentation with `export_html` (the same
+theme, css and config as `slides`, and only the packaged build assets) and
+opened from disk in a page of a local headless Chromium: with reveal.js's
+`?print-pdf` layout to print a PDF, or slide by slide to take PNG screenshots.
+Requests that would leave the machine are blocked, so exports run offline.
+
+Exports share a `BrowserPool`: one browser and a fixed number of pages that
+are reused from deck to deck, which bounds the number of decks rendered at
+once. `export_batch` renders a whole catalogue through one pool. Each output
+directory keeps a manifest of the hash (content, options and build assets) its
+files were rendered from, so decks that did not change are skipped.
+
+Requires the `export` extra (`pip install streamlit-reveal-slides[export]`)
+and Chromium (`playwright install chromium`).
+"""
+import asyncio
+import json
+import os
+import re
+import tempfile
+from functools import lru_cache
+
+from . import compiler, export
+
+# Plugins that fetch their library from a CDN when the deck loads
+ONLINE_PLUGINS = ("katex", "mathjax2", "mathjax3")
+
+DEFAULT_POOL_SIZE = 4
+# Milliseconds a deck has to get ready (theme, fonts and plugins loaded)
+DEFAULT_TIMEOUT = 30000
+
+MANIFEST = ".export-manifest.json"
+
+# reveal.js options for screenshots: every fragment shown, no transitions or controls
+_IMAGE_CONFIG = {"transition": "none", "backgroundTransition": "none", "fragments": False, "controls": False, "progress": False, "hash": False}
+_REMOTE_URL_REGEX = re.compile(r"^(?!file:|data:|blob:|about:)")
+# The names of the slide images an export writes (see `_render_images`)
+_SLIDE_IMAGE_REGEX = re.compile(r"^slide-\d+-\d+\.png$")
+
+
+def _require_playwright():
+    try:
+        from playwright.async_api import async_playwright
+    except ImportError:
+        raise ImportError("PDF and image export requires playwright. Install it with `pip install streamlit-reveal-slides[export]` "
+                          "and `playwright install chromium`.")
+    return async_playwright
+
+
+class BrowserPool(object):
+    """A headless Chromium with `size` pages that exports reuse (an async context manager).
+
+    At most `size` decks are rendered at once; an export waits for a free page.
+    """
+
+    def __init__(self, size=DEFAULT_POOL_SIZE, launch_options=None):
+        if size < 1:
+            raise ValueError("A browser pool needs at least one page.")
+        self.size = size
+        self.launch_options = launch_options or {}
+        self._playwright = None
+        self._browser = None
+        self._pages = None
+
+    async def __aenter__(self):
+        self._playwright = await _require_playwright()().start()
+        try:
+            self._browser = await self._playwright.chromium.launch(**self.launch_options)
+            self._pages = asyncio.Queue()
+            for _ in range(self.size):
+                page = await self._browser.new_page()
+                # Everything a deck needs is on disk
+                await page.route(_REMOTE_URL_REGEX, lambda route: route.abort())
+                self._pages.put_nowait(page)
+        except BaseException:
+            await self.__aexit__()
+            raise
+        return self
+
+    async def __aexit__(self, *exc_info):
+        if self._browser is not None:
+            await self._browser.close()
+        await self._playwright.stop()
+        self._browser = self._playwright = self._pages = None
+
+    async def open(self, path, query="", viewport=None, timeout=DEFAULT_TIMEOUT):
+        """Wait for a free page, load the presentation at `path` in it and return the page
+        once reveal.js is ready. Give the page back with `release`."""
+        page = await self._pages.get()
+        try:
+            if viewport:
+                await page.set_viewport_size(viewport)
+            await page.goto(_file_url(path) + query)
+            await page.wait_for_function("() => window.Reveal && Reveal.isReady()", timeout=timeout)
+            await page.evaluate("() => document.fonts.ready.then(() => undefined)")
+        except BaseException:
+            self.release(page)
+            raise
+        return page
+
+    def release(self, page):
+        """Give a page back to the pool."""
+        self._pages.put_nowait(page)
+
+
+def _file_url(path):
+    return "file://" + os.path.abspath(path).replace(os.sep, "/")
+
+
+@lru_cache(maxsize=None)
+def _build_digest():
+    # Exports depend on the component build (themes, fonts, reveal.js runtime)
+    with open(os.path.join(export.BUILD_DIR, "asset-manifest.json"), "rb") as f:
+        return compiler.content_digest(f.read().decode("utf-8"))
+
+
+def export_key(content, kind, options):
+    """The hash an export of `content` (with `options`, as `kind` "pdf" or "images") is cached under."""
+    content = content if isinstance(content, str) else [[child.digest for child in entry] if isinstance(entry, list) else entry.digest for entry in content]
+    return compiler.content_digest(content, kind, options, _build_digest())
+
+
+def _read_manifest(directory):
+    try:
+        with open(os.path.join(directory, MANIFEST), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_manifest(directory, manifest):
+    with open(os.path.join(directory, MANIFEST), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+
+
+def _options(theme, css, config, markdown_props, allow_unsafe_html, prerender):
+    online = [name for name in config.get("plugins", []) if name in ONLINE_PLUGINS]
+    if online and not (prerender and not allow_unsafe_html):
+        raise ValueError("The %s plugin(s) load from a CDN, which offline exports cannot reach. Pre-render the math "
+                         "instead (`prerender=True`)." % ", ".join(online))
+    return {"theme": theme, "css": css, "config": config, "markdown_props": markdown_props, "allow_unsafe_html": allow_unsafe_html, "prerender": prerender}
+
+
+async def _stage(content, directory, options):
+    # Compile and write the static deck in a thread, while other decks render
+    return await asyncio.get_running_loop().run_in_executor(None, lambda: export.export_html(content, directory, **options))
+
+
+async def _render_pdf(pool, content, path, options, timeout):
+    with tempfile.TemporaryDirectory() as staging:
+        index = await _stage(content, staging, options)
+        page = await pool.open(index, "?print-pdf", timeout=timeout)
+        try:
+            # reveal.js sets the page size of its print layout
+            await page.pdf(path=path, print_background=True, prefer_css_page_size=True)
+        finally:
+            pool.release(page)
+    return path
+
+
+async def _render_images(pool, content, directory, options, timeout):
+    config = dict(export.DEFAULT_CONFIG, **options["config"])
+    options = dict(options, config=dict(options["config"], **_IMAGE_CONFIG))
+    with tempfile.TemporaryDirectory() as staging:
+        index = await _stage(content, staging, options)
+        page = await pool.open(index, viewport={"width": int(config["width"]), "height": int(config["height"])}, timeout=timeout)
+        try:
+            paths = []
+            positions = await page.evaluate("() => Reveal.getSlides().map((slide) => Reveal.getIndices(slide))")
+            for position in positions:
+                indexh, indexv = position["h"], position.get("v") or 0
+                await page.evaluate("([h, v]) => Reveal.slide(h, v)", [indexh, indexv])
+                path = os.path.join(directory, "slide-%03d-%02d.png" % (indexh, indexv))
+                await page.screenshot(path=path)
+                paths.append(path)
+        finally:
+            pool.release(page)
+    return paths
+
+
+def _slide_images(directory):
+    return sorted(name for name in os.listdir(directory) if _SLIDE_IMAGE_REGEX.match(name))
+
+
+async def _export_images(pool, content, directory, manifest, entry, options, timeout):
+    # Render the slide images of `content` into `directory`, unless `manifest[entry]` shows they are
+    # up to date. Only slide images are replaced: other files in the directory are left alone.
+    key = export_key(content, "images", options)
+    os.makedirs(directory, exist_ok=True)
+    if manifest.get(entry) != key or not _slide_images(directory):
+        manifest.pop(entry, None)
+        for name in _slide_images(directory):
+            os.remove(os.path.join(directory, name))
+        await _render_images(pool, content, directory, options, timeout)
+        manifest[entry] = key
+    return [os.path.join(directory, name) for name in _slide_images(directory)]
+
+
+async def export_batch_async(decks, directory, pdf=True, images=False, theme="black", css="", config={}, markdown_props={},
+                             allow_unsafe_html=False, prerender=False, pool=None, pool_size=DEFAULT_POOL_SIZE, timeout=DEFAULT_TIMEOUT):
+    """The coroutine behind `export_batch`. Renders through `pool` if given (a `BrowserPool`
+    that has been entered), otherwise through a pool of `pool_size` pages of its own."""
+    options = _options(theme, css, config, markdown_props, allow_unsafe_html, prerender)
+    if pool is None:
+        async with BrowserPool(pool_size) as pool:
+            return await export_batch_async(decks, directory, pdf, images, theme, css, config, markdown_props, allow_unsafe_html,
+                                            prerender, pool, timeout=timeout)
+
+    os.makedirs(directory, exist_ok=True)
+    manifest = _read_manifest(directory)
+    results = dict((name, {}) for name in decks)
+
+    async def render(name, content, kind):
+        if kind == "pdf":
+            key = export_key(content, kind, options)
+            path = os.path.join(directory, name + ".pdf")
+            if manifest.get(name + ".pdf") != key or not os.path.isfile(path):
+                manifest.pop(name + ".pdf", None)
+                await _render_pdf(pool, content, path, options, timeout)
+                manifest[name + ".pdf"] = key
+            results[name]["pdf"] = path
+        else:
+            results[name]["images"] = await _export_images(pool, content, os.path.join(directory, name), manifest, name + "/", options, timeout)
+
+    kinds = (["pdf"] if pdf else []) + (["images"] if images else [])
+    try:
+        await asyncio.gather(*[render(name, content, kind) for name, content in decks.items() for kind in kinds])
+    finally:
+        # Keep what was rendered even if a deck failed
+        _write_manifest(directory, manifest)
+    return results
+
+
+def export_batch(decks, directory, pdf=True, images=False, theme="black", css="", config={}, markdown_props={},
+                 allow_unsafe_html=False, prerender=False, pool_size=DEFAULT_POOL_SIZE, timeout=DEFAULT_TIMEOUT):
+    """Export many decks as PDFs and/or slide images through one pool of browser pages.
+
+    Parameters
+    ----------
+    decks: dict
+        {name: content}, the content being markdown (or markup) or a `Deck`. Deck `name`
+        is written to `<directory>/<name>.pdf` and its images to `<directory>/<name>/`
+        (`slide-<indexh>-<indexv>.png`, every fragment shown). A new export only replaces the
+        slide images there, other files are kept.
+    directory: str
+        The output directory. Decks whose content, options and build assets did not
+        change since they were last exported there are skipped.
+    pdf, images: bool
+        What to export.
+    theme, css, config, markdown_props, allow_unsafe_html, prerender:
+        Same as the arguments of `slides`. Math plugins load from a CDN, so decks
+        with math need `prerender`.
+    pool_size: int
+        The number of browser pages, i.e. of decks rendered at once.
+    timeout: int
+        Milliseconds a deck has to get ready.
+
+    Returns
+    -------
+    dict
+        {name: {"pdf": path, "images": [paths]}}
+
+    """
+    return asyncio.run(export_batch_async(decks, directory, pdf, images, theme, css, config, markdown_props, allow_unsafe_html,
+                                          prerender, pool_size=pool_size, timeout=timeout))
+
+
+def export_pdf(content, path, theme="black", css="", config={}, markdown_props={}, allow_unsafe_html=False, prerender=False, timeout=DEFAULT_TIMEOUT):
+    """Export a deck as a PDF (reveal.js's print layout) to `path`. See `export_batch`."""
+    directory, name = os.path.split(os.path.abspath(path))
+    if not name.endswith(".pdf"):
+        raise ValueError("The path of a PDF export must end with .pdf, not %r." % name)
+    results = export_batch({name[:-len(".pdf")]: content}, directory, True, False, theme, css, config, markdown_props,
+                           allow_unsafe_html, prerender, pool_size=1, timeout=timeout)
+    return results[name[:-len(".pdf")]]["pdf"]
+
+
+def export_images(content, directory, theme="black", css="", config={}, markdown_props={}, allow_unsafe_html=False, prerender=False, timeout=DEFAULT_TIMEOUT):
+    """Export every slide of a deck as a PNG image to `directory`. Returns the paths of
+    the images, in deck order. Only the slide images in `directory` are replaced, and
+    its manifest is kept in it. See `export_batch`."""
+    options = _options(theme, css, config, markdown_props, allow_unsafe_html, prerender)
+    return asyncio.run(_export_images_async(content, directory, options, timeout))
+
+
+async def _export_images_async(content, directory, options, timeout):
+    os.makedirs(directory, exist_ok=True)
+    manifest = _read_manifest(directory)
+    try:
+        async with BrowserPool(1) as pool:
+            return await _export_images(pool, content, directory, manifest, "images", options, timeout)
+    finally:
+        _write_manifest(directory, manifest)
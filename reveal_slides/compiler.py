@@ -0,0 +1,651 @@
+"""Server-side compilation of markdown decks into reveal.js slide markup.
+
+This mirrors what the reveal.js markdown plugin does in the browser (slide
+splitting, speaker notes, `<!-- .slide: -->` / `<!-- .element: -->`
+annotations and the ```` ```lang [1-3|4] ```` line number syntax) so that a
+deck can be parsed once in Python and shipped to the frontend as ready-made
+`<section>` elements.
+"""
+import hashlib
+import json
+import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from html import escape
+from html.parser import HTMLParser
+
+from markdown_it import MarkdownIt
+
+from . import prerender as prerendering
+
+# Same defaults as reveal.js/plugin/markdown/plugin.js
+DEFAULT_SLIDE_SEPARATOR = r"\r?\n---\r?\n"
+DEFAULT_NOTES_SEPARATOR = r"notes?:"
+DEFAULT_ELEMENT_ATTRIBUTES_SEPARATOR = r"\.element\s*?(.+?)$"
+DEFAULT_SLIDE_ATTRIBUTES_SEPARATOR = r"\.slide:\s*?(\S.+?)$"
+
+# Maximum number of compiled decks kept in memory (see `set_cache_size`)
+DEFAULT_CACHE_SIZE = 32
+# Maximum number of compiled slides (of markdown decks and `Slide` objects) kept in memory
+DEFAULT_SLIDE_CACHE_SIZE = 4096
+
+# A separator that never matches
+NO_SEPARATOR = r"(?!)"
+
+_CODE_LINE_NUMBER_REGEX = re.compile(r"\[([\s\d,|-]*)\]")
+_ATTRIBUTE_REGEX = re.compile(r"([^\"= ]+?)=\"([^\"]+?)\"|(data-[^\"= ]+?)(?=[\" ])", re.M)
+_FORWARD_EXCLUDE_REGEX = re.compile(r"data\-(markdown|separator|vertical|notes)", re.I)
+_RAW_TEXT_ELEMENTS = frozenset(["pre", "code", "script", "style", "textarea"])
+_VOID_ELEMENTS = frozenset(["area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "param", "source", "track", "wbr"])
+# Elements reveal.js loads from `data-src` once their slide is within `viewDistance`
+_LAZY_ELEMENTS = frozenset(["img", "video", "audio", "iframe", "source"])
+# The speaker notes are the last element of a compiled slide
+_NOTES_OPEN = '<aside class="notes">'
+_NOTES_CLOSE = "</aside></section>"
+
+
+class CompiledDeck(object):
+    """The result of compiling a markdown deck.
+
+    `sections` holds one entry per horizontal slide: either the `<section>`
+    markup of that slide or, for a vertical stack, a list with the markup of
+    each of its slides.
+    """
+
+    __slots__ = ("digest", "sections", "attributes", "_html", "_slide_ids", "_notes")
+
+    def __init__(self, digest, sections, attributes="", notes=None):
+        self.digest = digest
+        self.sections = sections
+        self.attributes = attributes
+        self._html = None
+        self._slide_ids = None
+        # The notes taken out of the slides by `without_notes`, by (indexh, indexv)
+        self._notes = notes
+
+    @property
+    def html(self):
+        """The markup that goes inside the `<div class="slides">` element."""
+        if self._html is None:
+            parts = []
+            for section in self.sections:
+                if isinstance(section, list):
+                    parts.append(_open_section(self.attributes) + "".join(section) + "</section>")
+                else:
+                    parts.append(section)
+            self._html = "".join(parts)
+        return self._html
+
+    @property
+    def slide_ids(self):
+        """Stable ids for the slides, laid out like `sections`.
+
+        A slide's id is derived from its markup, so a slide keeps its id when
+        other slides are added, removed or edited.
+        """
+        if self._slide_ids is None:
+            seen = {}
+
+            def slide_id(markup):
+                base = content_digest(markup)
+                seen[base] = seen.get(base, 0) + 1
+                return base if seen[base] == 1 else "%s-%d" % (base, seen[base])
+
+            self._slide_ids = [
+                [slide_id(child) for child in section] if isinstance(section, list) else slide_id(section)
+                for section in self.sections
+            ]
+        return self._slide_ids
+
+    def slide_markup(self):
+        """Return a mapping of slide id to the `<section>` markup of that slide."""
+        markup = {}
+        for ids, section in zip(self.slide_ids, self.sections):
+            if isinstance(section, list):
+                markup.update(zip(ids, section))
+            else:
+                markup[ids] = section
+        return markup
+
+    def notes_for(self, indexh, indexv=0):
+        """Return the speaker notes (html) of the slide at `(indexh, indexv)`, or None."""
+        if self._notes is not None:
+            return self._notes.get((indexh, indexv))
+        if not 0 <= indexh < len(self.sections):
+            return None
+        section = self.sections[indexh]
+        if isinstance(section, list):
+            if not 0 <= indexv < len(section):
+                return None
+            section = section[indexv]
+        elif indexv != 0:
+            return None
+        return split_notes_markup(section)[1]
+
+    def without_notes(self):
+        """Return this deck with the speaker notes taken out of the slides.
+
+        The notes stay available through `notes_for` of the returned deck.
+        """
+        return _without_notes(self)
+
+    def __len__(self):
+        return len(self.sections)
+
+
+class _LRUCache(object):
+    """A small thread safe LRU mapping (Streamlit runs each session in its own thread)."""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def resize(self, maxsize):
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+_cache = _LRUCache(DEFAULT_CACHE_SIZE)
+_slide_cache = _LRUCache(DEFAULT_SLIDE_CACHE_SIZE)
+# Decks compiled ahead of time (see `set_store`)
+_store = None
+
+
+def set_cache_size(maxsize):
+    """Set the maximum number of compiled decks kept in memory."""
+    if maxsize < 1:
+        raise ValueError("The compiled deck cache size must be at least 1.")
+    _cache.resize(maxsize)
+
+
+def set_store(store):
+    """Load decks that are not in the in-memory cache from a `store.DeckStore` (or the
+    directory of one) before compiling them. None stops using a store."""
+    global _store
+    if isinstance(store, str):
+        from .store import DeckStore
+
+        store = DeckStore(store)
+    _store = store
+
+
+def _stored(digest):
+    # A deck compiled ahead of time, kept in memory like one compiled here
+    compiled = _store.load(digest) if _store is not None else None
+    if compiled is not None:
+        _cache.put(digest, compiled)
+    return compiled
+
+
+def clear_cache():
+    """Drop every compiled deck (and slide) from the in-memory cache."""
+    _cache.clear()
+    _slide_cache.clear()
+
+
+def content_digest(*parts):
+    """Return a short, stable hex digest of the given JSON serializable parts."""
+    data = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(data.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def normalize_markdown(text):
+    """Strip the common leading indentation of a markdown string.
+
+    Equivalent to `getMarkdownFromSlide` in the reveal.js markdown plugin.
+    """
+    leading_ws = len(re.match(r"^\n?(\s*)", text).group(1))
+    leading_tabs = len(re.match(r"^\n?(\t*)", text).group(1))
+    if leading_tabs > 0:
+        text = re.sub(r"\n?\t{%d}(.*)" % leading_tabs, lambda m: "\n" + m.group(1), text)
+    elif leading_ws > 1:
+        text = re.sub(r"\n? {%d}(.*)" % leading_ws, lambda m: "\n" + m.group(1), text)
+    return text
+
+
+def forwarded_attributes(markdown_props):
+    """Return the `markdown_props` that are forwarded to every horizontal slide."""
+    result = []
+    for name, value in (markdown_props or {}).items():
+        if _FORWARD_EXCLUDE_REGEX.search(name):
+            continue
+        if value:
+            result.append('%s="%s"' % (name, escape(str(value))))
+        else:
+            result.append(name)
+    return " ".join(result)
+
+
+def split_slides(markdown, markdown_props=None):
+    """Split a markdown deck into slides.
+
+    Returns a list with one entry per horizontal slide. Each entry is either
+    the markdown of that slide or a list with the markdown of every slide in a
+    vertical stack.
+    """
+    markdown_props = markdown_props or {}
+    separator = markdown_props.get("data-separator") or DEFAULT_SLIDE_SEPARATOR
+    vertical_separator = markdown_props.get("data-separator-vertical")
+
+    separator_regex = re.compile(separator + ("|" + vertical_separator if vertical_separator else ""), re.M)
+    horizontal_regex = re.compile(separator)
+
+    stack = []
+    last_index = 0
+    was_horizontal = True
+    for match in separator_regex.finditer(markdown):
+        is_horizontal = horizontal_regex.search(match.group(0)) is not None
+        if not is_horizontal and was_horizontal:
+            stack.append([])
+        content = markdown[last_index:match.start()]
+        if is_horizontal and was_horizontal:
+            stack.append(content)
+        else:
+            stack[-1].append(content)
+        last_index = match.end()
+        was_horizontal = is_horizontal
+
+    (stack if was_horizontal else stack[-1]).append(markdown[last_index:])
+    return stack
+
+
+def split_notes(markdown, markdown_props=None):
+    """Split the markdown of a single slide into `(content, notes)`.
+
+    `notes` is None when the slide has no speaker notes.
+    """
+    notes_separator = (markdown_props or {}).get("data-separator-notes") or DEFAULT_NOTES_SEPARATOR
+    parts = re.split(notes_separator, markdown, flags=re.M | re.I)
+    if len(parts) == 2:
+        return parts[0], parts[1].strip()
+    return markdown, None
+
+
+def split_notes_markup(markup):
+    """Split the compiled markup of a slide into `(markup without notes, notes html or None)`."""
+    start = markup.rfind(_NOTES_OPEN)
+    if start == -1 or not markup.endswith(_NOTES_CLOSE):
+        return markup, None
+    return markup[:start] + "</section>", markup[start + len(_NOTES_OPEN):-len(_NOTES_CLOSE)]
+
+
+@lru_cache(maxsize=DEFAULT_CACHE_SIZE)
+def _without_notes(deck):
+    notes = {}
+    sections = []
+    for indexh, section in enumerate(deck.sections):
+        children = []
+        for indexv, markup in enumerate(section if isinstance(section, list) else [section]):
+            markup, notes[(indexh, indexv)] = split_notes_markup(markup)
+            children.append(markup)
+        sections.append(children if isinstance(section, list) else children[0])
+    return CompiledDeck(content_digest(deck.digest, "without notes"), sections, deck.attributes,
+                        dict((position, html) for position, html in notes.items() if html is not None))
+
+
+def render_markdown(markdown, options=None):
+    """Render markdown to HTML the way the reveal.js markdown plugin configures marked.
+
+    If `options["prerender"]` includes "highlight", code fences are syntax highlighted (see `prerender`).
+    """
+    options = options or {}
+    animate_lists = bool(options.get("animateLists"))
+    return _markdown_renderer(animate_lists).render(markdown, {"prerender": _prerenders(options, "highlight")})
+
+
+def compile_slide(markdown, markdown_props=None, options=None, attributes="", notes=None):
+    """Compile the markdown of a single slide into a `<section>` element.
+
+    `notes` are speaker notes given separately from the markdown (otherwise they are
+    split from the markdown with the notes separator).
+    """
+    markdown_props = markdown_props or {}
+    content, split = split_notes(markdown, markdown_props)
+    notes = split if notes is None else notes
+
+    section = _Node("section")
+    _parse_into(section, render_markdown(content, options))
+    if _prerenders(options, "math"):
+        _prerender_math(section)
+    _add_attributes(
+        section,
+        section,
+        None,
+        markdown_props.get("data-element-attributes") or DEFAULT_ELEMENT_ATTRIBUTES_SEPARATOR,
+        markdown_props.get("data-attributes") or DEFAULT_SLIDE_ATTRIBUTES_SEPARATOR,
+    )
+    if (options or {}).get("lazyMedia"):
+        _lazy_media(section)
+    inner = "".join(child.serialize() for child in section.children)
+    if notes is not None:
+        notes_html = render_markdown(notes, options)
+        if _prerenders(options, "math"):
+            notes_html = "".join(child.serialize() for child in _prerender_math(_parse_into(_Node("aside"), notes_html)).children)
+        inner += '<aside class="notes">' + notes_html + "</aside>"
+
+    slide_attributes = " ".join(_serialize_attribute(name, value) for name, value in section.attrs)
+    return _open_section(" ".join(a for a in (attributes, slide_attributes) if a)) + inner + "</section>"
+
+
+def compile_deck(content, markdown_props=None, options=None, prerender=False, lazy_media=False):
+    """Compile a markdown deck, reusing a cached result when the same deck was compiled before.
+
+    Parameters
+    ----------
+    content: str or Deck
+        The markdown deck (what you would pass to `slides`), or a `Deck` (or any sequence
+        of `Slide` objects and lists of them for vertical stacks).
+    markdown_props: dict
+        The `markdown_props` passed to `slides` (separators and forwarded attributes).
+    options: dict or None
+        The `markdown` section of the reveal.js config (only `animateLists` is used).
+    prerender: bool or sequence of str
+        Render math to MathML and syntax highlight code blocks (see `prerender`). A sequence
+        lists the steps to run ("highlight", "math"; see `prerender.prerender_steps`).
+    lazy_media: bool
+        Turn the `src` of images, videos, audio and iframes into `data-src`, so reveal.js
+        only loads them when their slide is within `viewDistance` of the current slide.
+
+    Returns
+    -------
+    CompiledDeck
+    """
+    markdown_props = markdown_props or {}
+    options = _compile_options(options, prerender, lazy_media)
+    if not isinstance(content, str):
+        return _compile_slide_objects(content, markdown_props, options)
+    digest = content_digest(content, markdown_props, options)
+
+    compiled = _cache.get(digest) or _stored(digest)
+    if compiled is None:
+        compiled = CompiledDeck(digest, _markdown_sections(content, markdown_props, options), forwarded_attributes(markdown_props))
+        _cache.put(digest, compiled)
+    return compiled
+
+
+def _compile_options(options, prerender, lazy_media):
+    # The options a compiled slide depends on (part of every cache key)
+    steps = sorted(prerendering.STEP_PLUGINS) if prerender is True else sorted(prerender or ())
+    return {"animateLists": bool((options or {}).get("animateLists")), "prerender": steps, "lazyMedia": bool(lazy_media)}
+
+
+def _prerenders(options, step):
+    # Whether the compile `options` pre-render `step` (True pre-renders everything)
+    prerender = (options or {}).get("prerender")
+    return prerender is True or step in (prerender or ())
+
+
+def _markdown_sections(content, markdown_props, options):
+    # Like `Slide` objects, the slides of a markdown deck are compiled and cached one by one,
+    # so editing one slide of a large deck only recompiles that slide
+    attributes = forwarded_attributes(markdown_props)
+    sections = []
+    for slide in split_slides(normalize_markdown(content), markdown_props):
+        if isinstance(slide, list):
+            sections.append([_compile_markdown_slide(child, markdown_props, options) for child in slide])
+        else:
+            sections.append(_compile_markdown_slide(slide, markdown_props, options, attributes))
+    return sections
+
+
+def _compile_markdown_slide(markdown, markdown_props, options, attributes=""):
+    key = content_digest(markdown, markdown_props, options, attributes)
+    markup = _slide_cache.get(key)
+    if markup is None:
+        markup = compile_slide(markdown, markdown_props, options, attributes)
+        _slide_cache.put(key, markup)
+    return markup
+
+
+def compile_slide_object(slide, markdown_props=None, options=None, attributes=""):
+    """Compile a `Slide` into a `<section>` element, reusing the markup of an identical slide.
+
+    Compiled slides are cached by the slide's digest, so a deck that changes
+    only recompiles the slides that changed.
+    """
+    markdown_props = markdown_props or {}
+    key = content_digest(slide.digest, markdown_props, options, attributes)
+    markup = _slide_cache.get(key)
+    if markup is None:
+        # The notes of a slide object are never part of its markdown
+        props = dict(markdown_props)
+        props["data-separator-notes"] = NO_SEPARATOR
+        slide_attributes = " ".join(_serialize_attribute(name, None if value is None else str(value))
+                                    for name, value in (slide.attributes or {}).items())
+        markup = compile_slide(slide.body, props, options, " ".join(a for a in (attributes, slide_attributes) if a), slide.notes)
+        _slide_cache.put(key, markup)
+    return markup
+
+
+def _compile_slide_objects(slides, markdown_props, options):
+    layout = [[child.digest for child in entry] if isinstance(entry, list) else entry.digest for entry in slides]
+    digest = content_digest(layout, markdown_props, options)
+    compiled = _cache.get(digest) or _stored(digest)
+    if compiled is None:
+        compiled = CompiledDeck(digest, _slide_object_sections(slides, markdown_props, options), forwarded_attributes(markdown_props))
+        _cache.put(digest, compiled)
+    return compiled
+
+
+def _slide_object_sections(slides, markdown_props, options):
+    attributes = forwarded_attributes(markdown_props)
+    sections = []
+    for entry in slides:
+        if isinstance(entry, list):
+            sections.append([compile_slide_object(child, markdown_props, options) for child in entry])
+        else:
+            sections.append(compile_slide_object(entry, markdown_props, options, attributes))
+    return sections
+
+
+@lru_cache(maxsize=None)
+def _markdown_renderer(animate_lists):
+    md = MarkdownIt("commonmark", {"html": True}).enable(["table", "strikethrough"])
+    md.add_render_rule("fence", _render_fence)
+    if animate_lists:
+        md.add_render_rule("list_item_open", _render_fragment_list_item)
+    return md
+
+
+def _render_fence(self, tokens, idx, options, env):
+    token = tokens[idx]
+    language = token.info.strip()
+    line_numbers = ""
+
+    # ```javascript []        show line numbers
+    # ```javascript [1,4-8]   highlights lines 1 and 4-8
+    match = _CODE_LINE_NUMBER_REGEX.search(language)
+    if match:
+        line_numbers = 'data-line-numbers="%s"' % match.group(1).strip()
+        language = _CODE_LINE_NUMBER_REGEX.sub("", language, count=1).strip()
+
+    code = token.content[:-1] if token.content.endswith("\n") else token.content
+    if env.get("prerender"):
+        return prerendering.highlight_code(code, language, match.group(1).strip() if match else None)
+    return '<pre><code %s class="%s">%s</code></pre>\n' % (line_numbers, escape(language), escape(code))
+
+
+def _render_fragment_list_item(self, tokens, idx, options, env):
+    tokens[idx].attrSet("class", "fragment")
+    return self.renderToken(tokens, idx, options, env)
+
+
+def _open_section(attributes):
+    return "<section %s>" % attributes if attributes else "<section>"
+
+
+def _serialize_attribute(name, value):
+    return name if value is None else '%s="%s"' % (name, escape(value))
+
+
+class _Node(object):
+    """A minimal DOM node, just enough to apply reveal.js attribute comments."""
+
+    __slots__ = ("tag", "attrs", "children", "data")
+
+    TEXT = "#text"
+    COMMENT = "#comment"
+
+    def __init__(self, tag, attrs=None, data=None):
+        self.tag = tag
+        self.attrs = attrs or []
+        self.children = []
+        self.data = data
+
+    @property
+    def is_element(self):
+        return self.tag not in (_Node.TEXT, _Node.COMMENT)
+
+    def set_attribute(self, name, value):
+        for pair in self.attrs:
+            if pair[0] == name:
+                pair[1] = value
+                return
+        self.attrs.append([name, value])
+
+    def serialize(self):
+        if self.tag == _Node.TEXT:
+            return self.data
+        if self.tag == _Node.COMMENT:
+            return "<!--" + self.data + "-->"
+        attributes = "".join(" " + _serialize_attribute(name, value) for name, value in self.attrs)
+        if self.tag in _VOID_ELEMENTS:
+            return "<%s%s>" % (self.tag, attributes)
+        return "<%s%s>%s</%s>" % (self.tag, attributes, "".join(c.serialize() for c in self.children), self.tag)
+
+
+class _TreeBuilder(HTMLParser):
+
+    def __init__(self, root):
+        HTMLParser.__init__(self, convert_charrefs=False)
+        self.stack = [root]
+
+    def handle_starttag(self, tag, attrs):
+        node = _Node(tag, [[name, value] for name, value in attrs])
+        self.stack[-1].children.append(node)
+        if tag not in _VOID_ELEMENTS:
+            self.stack.append(node)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in _VOID_ELEMENTS:
+            self.stack.pop()
+
+    def handle_endtag(self, tag):
+        # Close the nearest matching open element, ignore stray end tags
+        for i in range(len(self.stack) - 1, 0, -1):
+            if self.stack[i].tag == tag:
+                del self.stack[i:]
+                return
+
+    def handle_data(self, data):
+        self._text(data)
+
+    def handle_entityref(self, name):
+        self._text("&%s;" % name)
+
+    def handle_charref(self, name):
+        self._text("&#%s;" % name)
+
+    def handle_comment(self, data):
+        self.stack[-1].children.append(_Node(_Node.COMMENT, data=data))
+
+    def handle_decl(self, decl):
+        self._text("<!%s>" % decl)
+
+    def handle_pi(self, data):
+        self._text("<?%s>" % data)
+
+    def unknown_decl(self, data):
+        self._text("<![%s]>" % data)
+
+    def _text(self, data):
+        children = self.stack[-1].children
+        if children and children[-1].tag == _Node.TEXT:
+            children[-1].data += data
+        else:
+            children.append(_Node(_Node.TEXT, data=data))
+
+
+def _parse_into(root, html):
+    builder = _TreeBuilder(root)
+    builder.feed(html)
+    builder.close()
+    return root
+
+
+def _prerender_math(element):
+    # Replace formulas in text nodes, leaving code and other raw text alone
+    for child in element.children:
+        if child.tag == _Node.TEXT:
+            child.data = prerendering.replace_math(child.data)
+        elif child.is_element and child.tag not in _RAW_TEXT_ELEMENTS:
+            _prerender_math(child)
+    return element
+
+
+def _lazy_media(element):
+    # Speaker notes are compiled separately, their media is never loaded lazily
+    for child in element.children:
+        if not child.is_element:
+            continue
+        if child.tag in _LAZY_ELEMENTS:
+            attributes = dict((name, value) for name, value in child.attrs)
+            if attributes.get("src") and "data-src" not in attributes:
+                child.attrs = [["data-src", value] if name == "src" else [name, value] for name, value in child.attrs]
+        _lazy_media(child)
+    return element
+
+
+def _add_attribute_in_element(node, target, separator):
+    match = re.search(separator, node.data, re.M)
+    if match is None or target is None:
+        return False
+    node.data = node.data[:match.start()] + node.data[match.end():]
+    for attribute in _ATTRIBUTE_REGEX.finditer(match.group(1)):
+        if attribute.group(2):
+            target.set_attribute(attribute.group(1), attribute.group(2))
+        else:
+            target.set_attribute(attribute.group(3), "")
+    return True
+
+
+def _add_attributes(section, element, previous, element_separator, slide_separator):
+    # Port of `addAttributes` from the reveal.js markdown plugin: a comment
+    # applies to the closest preceding element sibling (or its parent) and
+    # falls back to the enclosing section for slide attributes.
+    previous_parent = element
+    for child in element.children:
+        if child.is_element or child.tag == _Node.COMMENT:
+            _add_attributes(section, child, previous_parent, element_separator, slide_separator)
+        if child.is_element and child.tag != "br":
+            previous_parent = child
+
+    if element.tag == _Node.COMMENT:
+        if not _add_attribute_in_element(element, previous, element_separator):
+            _add_attribute_in_element(element, section, slide_separator)
@@ -0,0 +1,145 @@
+"""Decks built from python objects instead of one markdown string.
+
+A `Deck` holds `Slide` objects (and lists of them for vertical stacks). Each
+slide carries its own markdown, fragments, speaker notes and `<section>`
+attributes and has a digest of its own, so slides are compiled, cached and
+diffed one by one. The component receives a deck as a compact list of slides
+instead of a markdown string it has to split on `---` / `--` separators.
+
+    deck = Deck()
+    deck.add("## Revenue", notes="Mention the Q3 dip.", attributes={"data-background-color": "#283747"})
+    deck.add_stack("## Regions", Slide("## EMEA", fragments=["Up 4%", "Down in the UK"]))
+    rs.slides(deck, key="deck")
+"""
+from types import MappingProxyType
+
+from . import compiler
+
+_FRAGMENT = '%s <!-- .element: class="fragment" -->'
+
+
+class Slide(object):
+    """One slide of a `Deck`.
+
+    Parameters
+    ----------
+    content: str
+        The markdown of the slide.
+    notes: str or None
+        The speaker notes (markdown).
+    attributes: dict or None
+        Attributes of the slide's `<section>` (e.g. `data-background-color`, `data-auto-animate`).
+        A value of None gives an attribute without a value. The slide keeps a read-only copy:
+        assign new attributes to change them.
+    fragments: sequence of str
+        Markdown paragraphs shown after the content, one step at a time.
+    """
+
+    __slots__ = ("content", "notes", "attributes", "fragments", "_digest")
+
+    def __init__(self, content="", notes=None, attributes=None, fragments=()):
+        self.content = content
+        self.notes = notes
+        self.attributes = attributes
+        self.fragments = tuple(fragments)
+
+    def __setattr__(self, name, value):
+        # The digest is computed once, and again after the slide is changed. Attributes are
+        # copied into a read-only mapping, so they cannot change behind the digest's back.
+        if name == "attributes":
+            value = MappingProxyType(dict(value)) if value else None
+        object.__setattr__(self, name, value)
+        if name != "_digest":
+            object.__setattr__(self, "_digest", None)
+
+    @property
+    def digest(self):
+        """A short hash of the slide's content, notes, attributes and fragments."""
+        if self._digest is None:
+            self._digest = compiler.content_digest(self.content, self.notes, self._attributes(), self.fragments)
+        return self._digest
+
+    @property
+    def body(self):
+        """The markdown of the slide with its fragments (without the notes)."""
+        return "\n\n".join(part for part in [self.content] + [_FRAGMENT % fragment for fragment in self.fragments] if part)
+
+    def serialize(self):
+        """The wire form of the slide: `[body]`, `[body, notes]` or `[body, notes, attributes]`."""
+        data = [self.body, self.notes, self._attributes()]
+        while len(data) > 1 and data[-1] is None:
+            data.pop()
+        return data
+
+    def _attributes(self):
+        return dict(self.attributes) if self.attributes is not None else None
+
+    def __repr__(self):
+        return "Slide(%r)" % (self.content if len(self.content) <= 40 else self.content[:37] + "...")
+
+
+def _slide(slide):
+    return Slide(slide) if isinstance(slide, str) else slide
+
+
+class Deck(object):
+    """A presentation made of `Slide` objects.
+
+    `slides` may hold `Slide` objects, markdown strings (turned into slides) and
+    lists of either for vertical stacks. A deck can be passed to `slides`,
+    `export_html` and, being a sequence of horizontal slides, to windowed decks.
+    """
+
+    __slots__ = ("slides",)
+
+    def __init__(self, slides=()):
+        self.slides = []
+        for entry in slides:
+            self.append(entry)
+
+    def append(self, entry):
+        """Add a horizontal slide (a `Slide` or markdown) or a vertical stack (a list of them)."""
+        self.slides.append([_slide(child) for child in entry] if isinstance(entry, (list, tuple)) else _slide(entry))
+
+    def add(self, content="", notes=None, attributes=None, fragments=()):
+        """Add a horizontal slide and return it."""
+        slide = Slide(content, notes, attributes, fragments)
+        self.slides.append(slide)
+        return slide
+
+    def add_stack(self, *slides):
+        """Add a vertical stack of slides (`Slide` objects or markdown) and return it."""
+        stack = [_slide(slide) for slide in slides]
+        self.slides.append(stack)
+        return stack
+
+    @property
+    def digest(self):
+        """A short hash of the deck, derived from the digests of its slides."""
+        return compiler.content_digest([[child.digest for child in entry] if isinstance(entry, list) else entry.digest for entry in self.slides])
+
+    def notes_for(self, indexh, indexv=0):
+        """Return the speaker notes (markdown) of the slide at `(indexh, indexv)`, or None."""
+        if not 0 <= indexh < len(self.slides):
+            return None
+        entry = self.slides[indexh]
+        if isinstance(entry, list):
+            return entry[indexv].notes if 0 <= indexv < len(entry) else None
+        return entry.notes if indexv == 0 else None
+
+    def serialize(self):
+        """The wire form of the deck: one entry per horizontal slide (see `Slide.serialize`),
+        a list of those for a vertical stack."""
+        return [[child.serialize() for child in entry] if isinstance(entry, list) else entry.serialize() for entry in self.slides]
+
+    def __len__(self):
+        return len(self.slides)
+
+    def __iter__(self):
+        return iter(self.slides)
+
+    def __getitem__(self, index):
+        return self.slides[index]
+
+    def __repr__(self):
+        return "Deck(%d slides)" % len(self.slides)
@@ -0,0 +1,74 @@
+"""Incremental updates of compiled decks.
+
+Instead of re-sending (and re-initializing) a whole deck when its content
+changes, the frontend receives a patch: the new layout of slide ids and the
+markup of the slides it does not have yet. Slides it already has are reused
+as they are.
+"""
+
+
+def flatten_ids(layout):
+    """Return every slide id in a (possibly nested) layout of slide ids."""
+    ids = []
+    for entry in layout:
+        if isinstance(entry, list):
+            ids.extend(entry)
+        else:
+            ids.append(entry)
+    return ids
+
+
+def diff_decks(old, new):
+    """Compare two compiled decks slide by slide.
+
+    Returns a dict with the ids of the `added` and `removed` slides and the
+    `changed` positions, i.e. `(indexh, indexv)` coordinates whose slide is
+    different in `new`. `indexv` is 0 for slides that are not in a vertical stack.
+    """
+    old_ids = set(flatten_ids(old.slide_ids)) if old is not None else set()
+    new_ids = set(flatten_ids(new.slide_ids))
+    old_positions = _positions(old.slide_ids) if old is not None else {}
+    changed = [position for position, slide_id in sorted(_positions(new.slide_ids).items()) if old_positions.get(position) != slide_id]
+    return {
+        "added": [slide_id for slide_id in flatten_ids(new.slide_ids) if slide_id not in old_ids],
+        "removed": [slide_id for slide_id in flatten_ids(old.slide_ids) if slide_id not in new_ids] if old is not None else [],
+        "changed": changed,
+    }
+
+
+def deck_patch(deck, known_ids=()):
+    """Build the patch that turns a frontend holding `known_ids` into `deck`.
+
+    Parameters
+    ----------
+    deck: CompiledDeck
+        The deck the frontend should display.
+    known_ids: iterable of str
+        Ids of the slides the frontend currently holds.
+
+    Returns
+    -------
+    dict
+        `digest` and `layout` (slide ids laid out like the deck), `attributes`
+        (the attributes of vertical stack sections) and `slides` (the markup
+        of every slide not in `known_ids`).
+    """
+    known_ids = set(known_ids)
+    markup = deck.slide_markup()
+    return {
+        "digest": deck.digest,
+        "layout": deck.slide_ids,
+        "attributes": deck.attributes,
+        "slides": {slide_id: html for slide_id, html in markup.items() if slide_id not in known_ids},
+    }
+
+
+def _positions(layout):
+    positions = {}
+    for h, entry in enumerate(layout):
+        if isinstance(entry, list):
+            for v, slide_id in enumerate(entry):
+                positions[(h, v)] = slide_id
+        else:
+            positions[(h, 0)] = entry
+    return positions
@@ -0,0 +1,210 @@
+"""Static export of decks.
+
+`export_html` compiles a deck once and writes it to a directory as a plain
+reveal.js presentation: an `index.html` plus the stylesheets, fonts and
+plugin scripts the deck uses. Every asset has a content-hashed file name, so
+the directory can be served (e.g. from a CDN or Streamlit's static file
+serving) with long-lived cache headers and embedded in an app instead of
+rendering the deck through the component in every session.
+"""
+import hashlib
+import json
+import os
+import re
+from functools import lru_cache
+from html import escape
+
+from . import compiler, prerender as prerendering
+
+BUILD_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "frontend", "build")
+
+# The standalone reveal.js runtime and plugin scripts (copied from the
+# reveal.js distribution into the frontend's public folder)
+RUNTIME_DIR = os.path.join(BUILD_DIR, "reveal")
+
+# Plugin name -> (script in RUNTIME_DIR, the global the script defines)
+PLUGIN_SCRIPTS = {
+    "highlight": ("plugin/highlight/highlight.js", "RevealHighlight"),
+    "katex": ("plugin/math/math.js", "RevealMath.KaTeX"),
+    "mathjax2": ("plugin/math/math.js", "RevealMath.MathJax2"),
+    "mathjax3": ("plugin/math/math.js", "RevealMath.MathJax3"),
+    "search": ("plugin/search/search.js", "RevealSearch"),
+    "notes": ("plugin/notes/notes.js", "RevealNotes"),
+    "zoom": ("plugin/zoom/zoom.js", "RevealZoom"),
+}
+
+# Same as `defaultConfig` in the frontend
+DEFAULT_CONFIG = {
+    "width": 900,
+    "height": 860,
+    "margin": 0.05,
+    "minScale": 0.1,
+    "maxScale": 3.0,
+    "controlsTutorial": True,
+    "controlsLayout": "edges",
+}
+
+ASSETS_DIR = "assets"
+
+_MEDIA_URL_REGEX = re.compile(r"""url\((['"]?)(?:\.\./)*static/media/([^)'"?#]+)([^)'"]*)\1\)""")
+_SOURCE_MAP_REGEX = re.compile(r"/\*# sourceMappingURL=[^*]*\*/")
+# Webpack adds an 8 character hash to the name of the files it emits
+_WEBPACK_HASH_REGEX = re.compile(r"\.[0-9a-f]{8}(?=\.[^.]+$)")
+
+_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+  <head>
+    <meta charset="utf-8" />
+    <meta name="viewport" content="width=device-width, initial-scale=1" />
+    <title>{title}</title>
+{stylesheets}
+  </head>
+  <body>
+    <div class="reveal">
+      <div class="slides">
+{slides}
+      </div>
+    </div>
+{scripts}
+    <script>
+      Reveal.initialize(Object.assign({config}, {{ plugins: [{plugins}] }}));
+    </script>
+  </body>
+</html>
+"""
+
+
+def export_html(content, directory, theme="black", css="", config={}, markdown_props={}, allow_unsafe_html=False, prerender=False, title="Slides"):
+    """Write a deck to `directory` as a self-contained static presentation.
+
+    Parameters
+    ----------
+    content: str or Deck
+        The presentation content in markdown (or markup if `allow_unsafe_html` is True),
+        or a `Deck` of `Slide` objects.
+    directory: str
+        The directory the deck is written to (created if needed). Assets go to
+        its `assets` subdirectory and are never overwritten, so several decks
+        (or versions of a deck) can share one directory.
+    theme, css, config, markdown_props, allow_unsafe_html, prerender:
+        Same as the arguments of `slides`. The markdown is always compiled in
+        Python, so the markdown plugin is never included.
+    title: str
+        The title of the html page.
+
+    Returns
+    -------
+    str
+        The path of the deck's `index.html`.
+
+    """
+    if prerender and not allow_unsafe_html:
+        prerender = prerendering.prerender_steps(config.get("plugins", []))
+        if "highlight" in prerender:
+            css = css + "\n" + prerendering.code_stylesheet() if css else prerendering.code_stylesheet()
+    if not allow_unsafe_html:
+        deck = compiler.compile_deck(content, markdown_props, config.get("markdown"), prerender)
+        content = deck.html
+
+    plugins = [name for name in config.get("plugins", []) if name != "markdown"]
+    if prerender and not allow_unsafe_html:
+        plugins = [name for name in plugins if name not in prerendering.PRERENDERED_PLUGINS]
+    unknown = [name for name in plugins if name not in PLUGIN_SCRIPTS]
+    if unknown:
+        raise ValueError("Unknown plugin(s): %s. Expected any of: %s." % (", ".join(unknown), ", ".join(PLUGIN_SCRIPTS)))
+
+    assets_dir = os.path.join(directory, ASSETS_DIR)
+    os.makedirs(assets_dir, exist_ok=True)
+
+    manifest = _theme_manifest()
+    if theme not in manifest["themes"]:
+        raise ValueError("Unknown theme: %s. Expected any of: %s." % (theme, ", ".join(sorted(manifest["themes"]))))
+    stylesheets = [
+        _write_css(assets_dir, "reveal.css", _read_build_file(manifest["base"]["css"])),
+        _write_css(assets_dir, theme + ".css", _read_build_file(manifest["themes"][theme]["css"])),
+    ]
+    if css:
+        stylesheets.append(_write_asset(assets_dir, "deck.css", css.encode("utf-8")))
+
+    scripts = [_write_asset(assets_dir, "reveal.js", _read_runtime_file("reveal.js"))]
+    for name in plugins:
+        script = _write_asset(assets_dir, os.path.basename(PLUGIN_SCRIPTS[name][0]), _read_runtime_file(PLUGIN_SCRIPTS[name][0]))
+        if script not in scripts:
+            scripts.append(script)
+
+    options = dict(DEFAULT_CONFIG, **{k: v for k, v in config.items() if k != "plugins"})
+    html = _TEMPLATE.format(
+        title=escape(title),
+        stylesheets="\n".join('    <link rel="stylesheet" href="%s" />' % escape(href) for href in stylesheets),
+        slides=content,
+        scripts="\n".join('    <script src="%s"></script>' % escape(src) for src in scripts),
+        # Keep the config from closing the script element early
+        config=json.dumps(options).replace("</", "<\\/"),
+        plugins=", ".join(PLUGIN_SCRIPTS[name][1] for name in plugins),
+    )
+    path = os.path.join(directory, "index.html")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(html)
+    return path
+
+
+@lru_cache(maxsize=None)
+def _theme_manifest():
+    # The build splits every theme into its own (numbered) css chunk. Optimized
+    # builds (see frontend/scripts/optimize_build.py) list the chunk and fonts
+    # of each theme in a manifest. In other builds, the source maps tell which
+    # chunk was built from which reveal.js stylesheet.
+    try:
+        with open(os.path.join(BUILD_DIR, "theme-manifest.json"), encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        pass
+    chunks = {}
+    css_dir = os.path.join(BUILD_DIR, "static", "css")
+    for name in sorted(os.listdir(css_dir)):
+        if name.endswith(".css.map"):
+            with open(os.path.join(css_dir, name), encoding="utf-8") as f:
+                sources = json.load(f).get("sources", [])
+            for source in sources:
+                match = re.search(r"reveal\.js/dist/(.+\.css)$", source)
+                if match:
+                    chunks.setdefault(match.group(1), os.path.join("static", "css", name[:-len(".map")]))
+
+    def entry(stylesheet):
+        text = _read_build_file(stylesheet).decode("utf-8")
+        fonts = sorted(set(os.path.join("static", "media", match.group(2)) for match in _MEDIA_URL_REGEX.finditer(text)))
+        return {"css": stylesheet, "fonts": fonts}
+
+    themes = {name[len("theme/"):-len(".css")]: entry(chunk) for name, chunk in chunks.items() if name.startswith("theme/") and "/fonts/" not in name}
+    return {"base": entry(chunks["reveal.css"]), "themes": themes}
+
+
+def _read_build_file(path):
+    with open(os.path.join(BUILD_DIR, path), "rb") as f:
+        return f.read()
+
+
+def _read_runtime_file(path):
+    with open(os.path.join(RUNTIME_DIR, path), "rb") as f:
+        return f.read()
+
+
+def _write_css(assets_dir, name, data):
+    # Copy the fonts a stylesheet refers to and point the stylesheet at the copies
+    def copy_media(match):
+        media = _write_asset(assets_dir, _WEBPACK_HASH_REGEX.sub("", match.group(2)), _read_build_file(os.path.join("static", "media", match.group(2))))
+        return "url(%s%s)" % (os.path.basename(media), match.group(3))
+
+    text = _SOURCE_MAP_REGEX.sub("", data.decode("utf-8"))
+    return _write_asset(assets_dir, name, _MEDIA_URL_REGEX.sub(copy_media, text).encode("utf-8"))
+
+
+def _write_asset(assets_dir, name, data):
+    # Write `data` under a content-hashed name and return its url relative to the deck
+    stem, extension = os.path.splitext(name)
+    hashed_name = "%s.%s%s" % (stem, hashlib.blake2b(data, digest_size=8).hexdigest(), extension)
+    path = os.path.join(assets_dir, hashed_name)
+    if not os.path.exists(path):
+        with open(path, "wb") as f:
+            f.write(data)
+    return ASSETS_DIR + "/" + hashed_name
@@ -0,0 +1,305 @@
+"""Post-build optimization of the component build (run by `npm run build`).
+
+    python scripts/optimize_build.py [build directory]
+
+- Files changed by the steps below get a new content hash in their name (and
+  the references to them are updated), so long-lived caches stay correct.
+- Source maps are moved out of the build (to `sourcemaps/`), so they are
+  neither shipped in the package nor on the path the component is served from.
+- Fonts are converted to woff2 and the legacy formats (`.eot`, `.ttf`) are
+  dropped; the theme stylesheets list woff2 first with woff as a fallback.
+- `theme-manifest.json` lists the stylesheet and fonts of every theme (and the
+  base reveal.js stylesheet), so a page or CDN only needs to fetch (or
+  preload) the assets of the selected theme. `reveal_slides.export` uses it too.
+- Every text asset gets pre-compressed `.gz` and `.br` siblings for servers and
+  proxies that serve static files pre-compressed (e.g. nginx `gzip_static`).
+
+The build is checked first: it must have the `protocol.json` of the sources
+(copied from `public/`, see `FRONTEND_PROTOCOL` in `reveal_slides/__init__.py`),
+and every reveal.js plugin the sources import on demand must have its own chunk
+(`plugin-<name>`). A build that fails the check is left as it is and the script
+exits with an error, so stale files are never re-hashed and compressed as if
+they were a new build.
+
+woff2 and brotli need `fonttools` and `brotli`; without them those steps are skipped.
+"""
+import gzip
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+from io import BytesIO
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    from fontTools.ttLib import TTFont
+except ImportError:
+    TTFont = None
+
+FRONTEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCE_FILE = os.path.join(FRONTEND_DIR, "src", "RevealSlides.tsx")
+PROTOCOL_FILE = os.path.join(FRONTEND_DIR, "public", "protocol.json")
+
+COMPRESSED_EXTENSIONS = (".js", ".css", ".html", ".json", ".svg", ".txt")
+# Smaller files are not worth a compressed variant
+MIN_COMPRESSED_SIZE = 1024
+
+_SOURCE_MAP_COMMENT_REGEX = re.compile(r"\n?(?://|/\*)# sourceMappingURL=\S+?(?: \*/)?(?=\n|$)")
+_FONT_FACE_REGEX = re.compile(r"@font-face\s*\{[^}]*\}")
+_SRC_REGEX = re.compile(r"src\s*:\s*([^;}]+)[;]?")
+_FONT_URL_REGEX = re.compile(r"url\(([^)]+)\)(?:\s*format\(([^)]+)\))?")
+_MEDIA_REGEX = re.compile(r"static/media/[^)\"'?#]+")
+_HASHED_NAME_REGEX = re.compile(r"^(.+)\.([0-9a-f]{8})(\.chunk)?(\.[a-z0-9]+)$")
+_PLUGIN_IMPORT_REGEX = re.compile(r'webpackChunkName:\s*"(plugin-[^"]+)"')
+_CHUNK_NAME_REGEX = re.compile(r"^(.+)\.[0-9a-f]{8}\.chunk\.js$")
+
+
+def check_build(build_dir, source_file=SOURCE_FILE):
+    """Return the problems of a build that was not made from the current sources (empty if none)."""
+    problems = []
+    with open(PROTOCOL_FILE, encoding="utf-8") as f:
+        protocol = json.load(f)
+    try:
+        with open(os.path.join(build_dir, "protocol.json"), encoding="utf-8") as f:
+            built = json.load(f)
+    except FileNotFoundError:
+        built = None
+    if built != protocol:
+        problems.append("protocol.json is %s, the sources have %s" % (json.dumps(built), json.dumps(protocol)))
+    with open(source_file, encoding="utf-8") as f:
+        expected = set(_PLUGIN_IMPORT_REGEX.findall(f.read()))
+    js_dir = os.path.join(build_dir, "static", "js")
+    chunks = set(match.group(1) for match in map(_CHUNK_NAME_REGEX.match, os.listdir(js_dir) if os.path.isdir(js_dir) else []) if match)
+    for name in sorted(expected - chunks):
+        problems.append("no %s chunk in static/js" % name)
+    return problems
+
+
+def _content_hash(data):
+    # Same as the hashes webpack puts in file names
+    return hashlib.md5(data).hexdigest()[:8]
+
+
+def move_source_maps(build_dir, maps_dir):
+    """Move the source maps out of the build and drop the comments that point to them.
+
+    Returns the `sources` of each css map (by the path of its stylesheet), which
+    tell which stylesheet a (numbered) chunk was built from, and the files that changed.
+    """
+    css_sources = {}
+    changed = set()
+    for root, _, files in os.walk(build_dir):
+        for name in files:
+            path = os.path.join(root, name)
+            relative = os.path.relpath(path, build_dir)
+            if name.endswith(".map"):
+                if name.endswith(".css.map"):
+                    with open(path, encoding="utf-8") as f:
+                        css_sources[relative[:-len(".map")].replace(os.sep, "/")] = json.load(f).get("sources", [])
+                target = os.path.join(maps_dir, relative)
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                shutil.move(path, target)
+            elif name.endswith((".js", ".css")):
+                with open(path, encoding="utf-8") as f:
+                    text = f.read()
+                stripped = _SOURCE_MAP_COMMENT_REGEX.sub("", text)
+                if stripped != text:
+                    with open(path, "w", encoding="utf-8") as f:
+                        f.write(stripped)
+                    changed.add(relative.replace(os.sep, "/"))
+    return css_sources, changed
+
+
+def convert_fonts(build_dir):
+    """Add a woff2 copy of every woff font. Returns {woff path: woff2 path} (relative to the build)."""
+    converted = {}
+    media_dir = os.path.join(build_dir, "static", "media")
+    if TTFont is None or brotli is None or not os.path.isdir(media_dir):
+        print("fonttools/brotli not installed: fonts are not converted to woff2")
+        return converted
+    for name in sorted(os.listdir(media_dir)):
+        if not name.endswith(".woff"):
+            continue
+        # Keep the timestamps, so the same font always converts to the same file
+        font = TTFont(os.path.join(media_dir, name), recalcTimestamp=False)
+        font.flavor = "woff2"
+        data = BytesIO()
+        font.save(data)
+        data = data.getvalue()
+        # Same naming scheme as webpack: name.<8 character content hash>.ext
+        stem = re.sub(r"\.[0-9a-f]{8}$", "", name[:-len(".woff")])
+        woff2_name = "%s.%s.woff2" % (stem, _content_hash(data))
+        with open(os.path.join(media_dir, woff2_name), "wb") as f:
+            f.write(data)
+        converted["static/media/" + name] = "static/media/" + woff2_name
+    return converted
+
+
+def _rewrite_src(match, converted):
+    entries = []
+    for url, font_format in _FONT_URL_REGEX.findall(match.group(1)):
+        media = _MEDIA_REGEX.search(url)
+        if media and media.group(0) in converted:
+            entries.append('url(%s) format("woff2")' % url.replace(media.group(0), converted[media.group(0)]))
+        if url.split("?")[0].endswith((".woff", ".woff2")):
+            entries.append("url(%s)%s" % (url, ' format(%s)' % font_format if font_format else ""))
+    # Running the script again must not list a font twice
+    entries = sorted(set(entries), key=entries.index)
+    return "src:" + ",".join(entries) + ";" if entries else ""
+
+
+def rewrite_font_faces(build_dir, converted):
+    """Make the stylesheets refer to woff2 (then woff) only and delete the legacy font files.
+
+    Returns the stylesheets that changed.
+    """
+    changed = set()
+    css_dir = os.path.join(build_dir, "static", "css")
+    for name in os.listdir(css_dir):
+        if not name.endswith(".css"):
+            continue
+        path = os.path.join(css_dir, name)
+        with open(path, encoding="utf-8") as f:
+            text = f.read()
+        rewritten = _FONT_FACE_REGEX.sub(lambda face: _SRC_REGEX.sub(lambda src: _rewrite_src(src, converted), face.group(0)), text)
+        if rewritten != text:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(rewritten)
+            changed.add("static/css/" + name)
+
+    media_dir = os.path.join(build_dir, "static", "media")
+    if converted and os.path.isdir(media_dir):
+        for name in os.listdir(media_dir):
+            if name.endswith((".eot", ".ttf")):
+                os.remove(os.path.join(media_dir, name))
+    return changed
+
+
+def rehash(build_dir, changed):
+    """Rename the changed files after their new content and update the references to them.
+
+    Chunks are referenced by their hash from the webpack runtime (which is both
+    a file and inlined in `index.html`) and by their name from `index.html` and
+    `asset-manifest.json`. Returns {old path: new path}.
+    """
+    renamed = {}
+    runtime = [name for name in changed if os.path.basename(name).startswith("runtime-")]
+    # The runtime refers to the other chunks, so it is renamed last
+    for group in ([name for name in changed if name not in runtime], runtime):
+        replacements = {}
+        for relative in sorted(group):
+            match = _HASHED_NAME_REGEX.match(os.path.basename(relative))
+            if not match:
+                continue
+            with open(os.path.join(build_dir, relative), "rb") as f:
+                new_hash = _content_hash(f.read())
+            new_name = "%s.%s%s%s" % (match.group(1), new_hash, match.group(3) or "", match.group(4))
+            new_relative = os.path.join(os.path.dirname(relative), new_name).replace(os.sep, "/")
+            os.rename(os.path.join(build_dir, relative), os.path.join(build_dir, new_relative))
+            renamed[relative] = new_relative
+            replacements[os.path.basename(relative)] = new_name
+            replacements['"%s"' % match.group(2)] = '"%s"' % new_hash
+
+            # The license comments extracted from a chunk follow it (and the chunk points to them)
+            license_path = os.path.join(build_dir, relative + ".LICENSE.txt")
+            if os.path.exists(license_path):
+                os.rename(license_path, os.path.join(build_dir, new_relative + ".LICENSE.txt"))
+                _replace_in_file(os.path.join(build_dir, new_relative), {os.path.basename(relative): new_name})
+
+        references = ["index.html", "asset-manifest.json"]
+        references += ["static/js/" + name for name in os.listdir(os.path.join(build_dir, "static", "js")) if name.startswith("runtime-") and name.endswith(".js")]
+        for relative in references:
+            _replace_in_file(os.path.join(build_dir, relative), replacements)
+    return renamed
+
+
+def _replace_in_file(path, replacements):
+    if not os.path.exists(path):
+        return
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    for old, new in replacements.items():
+        text = text.replace(old, new)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+def update_asset_manifest(build_dir):
+    """List the files the build now has (woff2 fonts added, legacy fonts and maps removed)."""
+    path = os.path.join(build_dir, "asset-manifest.json")
+    if not os.path.exists(path):
+        return
+    with open(path, encoding="utf-8") as f:
+        manifest = json.load(f)
+    files = {name: file for name, file in manifest.get("files", {}).items() if os.path.exists(os.path.join(build_dir, file))}
+    media_dir = os.path.join(build_dir, "static", "media")
+    if os.path.isdir(media_dir):
+        for name in sorted(os.listdir(media_dir)):
+            if name.endswith(".woff2"):
+                files["static/media/" + name] = "./static/media/" + name
+    manifest["files"] = files
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+
+
+def write_manifest(build_dir, css_sources):
+    """Write `theme-manifest.json`: the stylesheet and fonts of each theme."""
+    manifest = {"base": None, "themes": {}}
+    for stylesheet, sources in sorted(css_sources.items()):
+        with open(os.path.join(build_dir, stylesheet), encoding="utf-8") as f:
+            fonts = sorted(set(url for url in _MEDIA_REGEX.findall(f.read()) if url.endswith(".woff2")))
+        for source in sources:
+            match = re.search(r"reveal\.js/dist/(?:theme/([^/]+)\.css|(reveal)\.css)$", source)
+            if match and match.group(2):
+                manifest["base"] = {"css": stylesheet, "fonts": fonts}
+            elif match:
+                manifest["themes"][match.group(1)] = {"css": stylesheet, "fonts": fonts}
+    with open(os.path.join(build_dir, "theme-manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+
+def compress(build_dir):
+    """Write `.gz` and `.br` siblings of the text assets the component is served from."""
+    for root, _, files in os.walk(build_dir):
+        relative = os.path.relpath(root, build_dir).replace(os.sep, "/")
+        # `reveal/` holds the standalone runtime used by `export_html`, which is never served
+        if relative != "." and relative.split("/")[0] != "static":
+            continue
+        for name in files:
+            if not name.endswith(COMPRESSED_EXTENSIONS):
+                continue
+            path = os.path.join(root, name)
+            with open(path, "rb") as f:
+                data = f.read()
+            if len(data) < MIN_COMPRESSED_SIZE:
+                continue
+            with open(path + ".gz", "wb") as f:
+                # mtime=0 keeps the output reproducible
+                f.write(gzip.compress(data, compresslevel=9, mtime=0))
+            if brotli is not None:
+                with open(path + ".br", "wb") as f:
+                    f.write(brotli.compress(data, quality=11))
+
+
+def optimize(build_dir, maps_dir):
+    css_sources, changed = move_source_maps(build_dir, maps_dir)
+    changed |= rewrite_font_faces(build_dir, convert_fonts(build_dir))
+    renamed = rehash(build_dir, changed)
+    update_asset_manifest(build_dir)
+    if css_sources:
+        write_manifest(build_dir, {renamed.get(name, name): sources for name, sources in css_sources.items()})
+    compress(build_dir)
+
+
+if __name__ == "__main__":
+    build = sys.argv[1] if len(sys.argv) > 1 else os.path.join(FRONTEND_DIR, "build")
+    problems = check_build(build)
+    if problems:
+        sys.exit("%s was not built from the current sources (run `npm run build`):\n- %s" % (build, "\n- ".join(problems)))
+    optimize(build, os.path.join(FRONTEND_DIR, "sourcemaps"))
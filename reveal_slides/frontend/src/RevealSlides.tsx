@@ -4,19 +4,12 @@ import {
   withStreamlitConnection,
   Theme,
 } from "streamlit-component-lib"
-import { MutableRefObject, useEffect, useMemo, useRef, lazy} from "react"
+import { MutableRefObject, useEffect, useLayoutEffect, useMemo, useRef, lazy} from "react"
 import { createGlobalStyle } from "styled-components/macro"
 
 import Reveal from 'reveal.js';
-import RevealMarkdown from 'reveal.js/plugin/markdown/markdown';
-import RevealHighlight from 'reveal.js/plugin/highlight/highlight';
-import RevealMath from 'reveal.js/plugin/math/math';
-import RevealSearch from 'reveal.js/plugin/search/search';
-import RevealNotes from 'reveal.js/plugin/notes/notes';
-import RevealZoom from 'reveal.js/plugin/zoom/zoom';
 
 import 'reveal.js/dist/reveal.css';
-import 'reveal.js/plugin/highlight/monokai.css';
 
 interface RevealSlidesProps extends ComponentProps {
   args: any
@@ -30,6 +23,24 @@ interface DangerousDivProps extends React.HTMLAttributes<HTMLDivElement> {
   innerRef: React.Ref<HTMLDivElement>;
 }
 
+// A patch computed in Python (see reveal_slides/diff.py). `layout` lists slide ids
+// the way the slides are laid out (vertical stacks are nested lists) and `slides`
+// holds the markup of the slides the frontend does not have yet.
+// Patches of windowed decks (see reveal_slides/window.py) also carry the index of the
+// first mounted slide (`offset`), the number of slides in the whole deck and the window size.
+// `resend` is the id of the last request for all slides, so a patch that sends them again
+// under the same digest is still applied.
+type SlidePatch = {
+  digest: string,
+  layout: (string | string[])[],
+  attributes: string,
+  slides: {[id: string]: string},
+  resend?: string | null,
+  offset?: number,
+  total?: number,
+  size?: number
+}
+
 type SymbolPerSlideProgressType = {
   id: string, 
   init: Function, 
@@ -39,11 +50,355 @@ type SymbolPerSlideProgressType = {
 
 let RevealSymbolPerSlideProgress: SymbolPerSlideProgressType
 
+// Slide markup compiled in Python (or passed with `allow_unsafe_html`), keyed by digest. Once a deck has been
+// received, Streamlit only sends its digest on subsequent reruns.
+const compiledDecks: {[digest: string]: string} = {}
+
+// Search indexes built in Python (see reveal_slides/search.py), keyed by digest and,
+// like compiled decks, only sent once. `postings` (parallel to the sorted `tokens`)
+// holds the numbers of the `positions` each word appears on.
+type SearchIndex = {
+  positions: [number, number][],
+  tokens: string[],
+  postings: number[][]
+}
+const searchIndexes: {[digest: string]: SearchIndex} = {}
+
+// Stylesheets of code blocks highlighted in Python (see reveal_slides/prerender.py), keyed
+// by digest and only sent once. The code blocks only carry class names.
+const codeStyles: {[digest: string]: string} = {}
+
+let requestCount = 0
+
+// Measurements sent back to Streamlit with the presentation state when `profile` is
+// set (see reveal_slides/profiling.py). Durations are in milliseconds.
+type Timings = {
+  plugin_load?: number,
+  plugin_init: {[id: string]: number},
+  initialize?: number,
+  theme_load?: number,
+  frame_height_calls: number
+}
+
+// Everything that belongs to one deck. Each component creates its own reveal.js
+// instance (instead of driving the global `Reveal`), so decks mount, lay out and
+// tear down independently of each other.
+type DeckInstance = {
+  deck: Reveal.Api | null,
+  // Windowed decks only mount some of the slides. Reveal.js indices are local to the
+  // mounted slides while Streamlit deals with indices in the whole deck.
+  windowOffset: number,
+  windowTotal: number | null,
+  windowSize: number,
+  requestedWindow: number | null,
+  // Layout is suspended while the deck is hidden (e.g. in an inactive `st.tabs` tab)
+  visible: boolean,
+  disableLayout: boolean,
+  // Frame height updates are coalesced per animation frame (see `scheduleFrameHeight`)
+  frameHeight: number | null,
+  pendingHeight: number | null,
+  frameRequest: number | null,
+  holdFrame: boolean,
+  // Private notes (see `showNotes`), by "indexh/indexv" in the whole deck
+  speakerView: boolean,
+  notes: {[position: string]: string | null},
+  requestedNotes: string | null,
+  // The search index of the deck, and a search hit ([indexh, indexv] in the whole deck)
+  // to move to once the window around it is mounted
+  searchDigest: string | null,
+  pendingSlide: [number, number] | null,
+  // The performance mode in effect ("quality" or "low_power", null unless `performance_mode`
+  // is "auto" or "low_power"), the last frame rate measured and the frame monitor
+  performanceMode: string | null,
+  fps: number | null,
+  frameMonitor: number | null,
+  timings: Timings | null
+}
+
+const createInstance = () : DeckInstance => ({
+  deck: null,
+  windowOffset: 0,
+  windowTotal: null,
+  windowSize: 0,
+  requestedWindow: null,
+  visible: true,
+  disableLayout: false,
+  frameHeight: null,
+  pendingHeight: null,
+  frameRequest: null,
+  holdFrame: false,
+  speakerView: false,
+  notes: {},
+  requestedNotes: null,
+  searchDigest: null,
+  pendingSlide: null,
+  performanceMode: null,
+  fps: null,
+  frameMonitor: null,
+  timings: null
+})
+
+// Returns the reveal.js instance of a deck once it is initialized (null before that)
+const readyDeck = (instance: DeckInstance) : Reveal.Api | null => {
+  return instance.deck && instance.deck.isReady() ? instance.deck : null
+}
+
+const toGlobalState = (instance: DeckInstance, state: any) => {
+  return instance.windowOffset && 'indexh' in state ? {...state, indexh: state.indexh + instance.windowOffset} : state
+}
+
+const toLocalState = (instance: DeckInstance, state: any) => {
+  return instance.windowOffset && 'indexh' in state ? {...state, indexh: state.indexh - instance.windowOffset} : state
+}
+
+// The component value for `state`, with the timings of the deck when it is profiled, the
+// frame height (remembered by Python as the height hint of the next render) and the
+// performance mode in effect
+const componentValue = (instance: DeckInstance, state: any) => {
+  let value = instance.timings ? {...state, profile: instance.timings} : state
+  if (instance.performanceMode) {
+    value = {...value, performance: {mode: instance.performanceMode, fps: instance.fps}}
+  }
+  return instance.frameHeight !== null ? {...value, frame_height: instance.frameHeight} : value
+}
+
+// Wrap a plugin so that the time its initialization takes is recorded in `timings`
+// (plugins may be given as objects or as functions that create them)
+const timePlugin = (plugin: any, timings: Timings) => () => {
+  const instance = typeof plugin === 'function' ? plugin() : plugin
+  if (!instance || typeof instance.init !== 'function') {
+    return instance
+  }
+  const timed = Object.create(instance)
+  timed.init = (deck: Reveal.Api) => {
+    const start = performance.now()
+    return Promise.resolve(instance.init(deck)).then(() => {
+      timings.plugin_init[instance.id] = performance.now() - start
+    })
+  }
+  return timed
+}
+
+// An inactive tab hides the component's iframe, which leaves the document without any width
+const isHidden = () => document.hidden || document.documentElement.clientWidth === 0
+
+// Config passed to reveal.js: the user's `disableLayout` is kept aside so that
+// layout can be disabled while the deck is hidden and restored when it is shown.
+// In low power mode, the costly options are turned down (see `lowPowerOptions`).
+const layoutConfig = (instance: DeckInstance, config: any) => {
+  instance.disableLayout = !!config.disableLayout
+  const options = instance.performanceMode === 'low_power' ? {...config, ...lowPowerOptions(config)} : config
+  return {...options, disableLayout: instance.disableLayout || !instance.visible}
+}
+
+// With `performance_mode="auto"`, the frame rate is measured over windows of FPS_WINDOW
+// milliseconds and the deck switches to low power mode after SLOW_WINDOWS windows in a
+// row below LOW_FPS frames per second.
+const LOW_FPS = 30
+const FPS_WINDOW = 2000
+const SLOW_WINDOWS = 2
+const TRANSITIONS_3D = ['convex', 'concave', 'zoom']
+
+// The reveal.js options of low power mode: fewer slides kept rendered around the current
+// one, no 3D transitions, no parallax background and no auto-animate
+const lowPowerOptions = (config: any) => ({
+  transition: TRANSITIONS_3D.includes(config.transition) ? 'none' : config.transition,
+  backgroundTransition: TRANSITIONS_3D.includes(config.backgroundTransition) ? 'none' : config.backgroundTransition,
+  viewDistance: Math.min(config.viewDistance ?? 3, 1),
+  mobileViewDistance: Math.min(config.mobileViewDistance ?? 2, 1),
+  parallaxBackgroundImage: '',
+  autoAnimate: false
+})
+
+// Background videos are turned into (unused) attributes, so reveal.js does not create them
+const stripBackgroundVideos = (container: Element) => {
+  container.querySelectorAll('section[data-background-video]').forEach((section) => {
+    section.setAttribute('data-background-video-disabled', section.getAttribute('data-background-video') as string)
+    section.removeAttribute('data-background-video')
+  })
+}
+
+// Switch a deck to low power mode (the `low-power` class hides the fragments of the
+// slides that are not shown, see `LowPowerCSS`)
+const enterLowPower = (instance: DeckInstance) => {
+  instance.performanceMode = 'low_power'
+  const deck = readyDeck(instance)
+  if (!deck) {
+    return
+  }
+  const root = deck.getRevealElement() as Element
+  root.classList.add('low-power')
+  stripBackgroundVideos(deck.getSlidesElement() as Element)
+  deck.configure(lowPowerOptions(deck.getConfig()))
+  deck.sync()
+}
+
+// Measure the frame rate of a visible deck and pass it to `onWindow` after every window
+const monitorFrames = (instance: DeckInstance, onWindow: (fps: number) => void) => {
+  let frames = 0
+  let start = performance.now()
+  const tick = (now: number) => {
+    if (!instance.visible || document.hidden) {
+      frames = 0
+      start = now
+    }
+    else {
+      frames += 1
+      if (now - start >= FPS_WINDOW) {
+        onWindow(frames * 1000 / (now - start))
+        frames = 0
+        start = now
+      }
+    }
+    instance.frameMonitor = window.requestAnimationFrame(tick)
+  }
+  instance.frameMonitor = window.requestAnimationFrame(tick)
+}
+
+const layoutDeck = (instance: DeckInstance) => {
+  const deck = readyDeck(instance)
+  if (deck && instance.visible) {
+    deck.layout()
+  }
+}
+
+// Suspend (or resume) layout work when the deck is hidden (or shown again).
+// Returns true if the deck has just become visible.
+const updateVisibility = (instance: DeckInstance) : boolean => {
+  const visible = !isHidden()
+  if (visible === instance.visible) {
+    return false
+  }
+  instance.visible = visible
+  const deck = readyDeck(instance)
+  if (deck) {
+    deck.configure({disableLayout: instance.disableLayout || !visible})
+    if (visible) {
+      deck.layout()
+    }
+  }
+  return visible
+}
+
+// Theme css, fonts and plugin typesetting each resize the deck while it starts up. Resize
+// observations are coalesced: the frame height is set at most once per animation frame
+// (and only while the deck is not held, see `holdFrame`) and only when it actually changes.
+const scheduleFrameHeight = (instance: DeckInstance, height: number) => {
+  instance.pendingHeight = height
+  if (instance.frameRequest === null && !instance.holdFrame) {
+    instance.frameRequest = window.requestAnimationFrame(() => flushFrameHeight(instance))
+  }
+}
+
+const flushFrameHeight = (instance: DeckInstance) => {
+  if (instance.frameRequest !== null) {
+    window.cancelAnimationFrame(instance.frameRequest)
+    instance.frameRequest = null
+  }
+  const height = instance.pendingHeight === null ? null : Math.ceil(instance.pendingHeight)
+  instance.pendingHeight = null
+  if (height === null || height === instance.frameHeight) {
+    return
+  }
+  instance.frameHeight = height
+  if (instance.timings) {
+    instance.timings.frame_height_calls += 1
+  }
+  Streamlit.setFrameHeight(height)
+  layoutDeck(instance)
+}
+
+// The frame height to start with, from the hint sent by Python: a height (e.g. the one
+// the same deck settled on before) or an aspect ratio of the frame width
+const hintedHeight = (hint: any) : number | null => {
+  if (hint && hint.height > 0) {
+    return hint.height
+  }
+  const width = document.documentElement.clientWidth
+  if (hint && hint.aspect_ratio > 0 && width > 0) {
+    return Math.ceil(width / hint.aspect_ratio)
+  }
+  return null
+}
+
+// A slide of a deck built from `Slide` objects in Python: [markdown, notes, attributes]
+// (see reveal_slides/deck.py), and a vertical stack is a list of those
+type WireSlide = [string, (string | null)?, ({[name: string]: string | null} | null)?]
+type WireEntry = WireSlide | WireSlide[]
+
+// Each slide gets its own markdown section whose separators never match, so the
+// markdown plugin does not search the slides for `---` / `--` separators. The notes
+// (if any) follow the markdown after a marker line.
+const NO_SEPARATOR = "(?!)"
+const NOTES_MARKER = "<!-- notes -->"
+
+const wireSlide = (slide: WireSlide, key: number, markdownProps: any) => {
+  const [markdown, notes, attributes] = slide
+  const sectionAttributes: {[name: string]: string} = {}
+  Object.entries(attributes ?? {}).forEach(([name, value]) => {
+    sectionAttributes[name] = value ?? ""
+  })
+  return (
+    <section key={key} {...markdownProps} {...sectionAttributes} data-markdown={""} data-separator={NO_SEPARATOR}
+             data-separator-vertical={NO_SEPARATOR} data-separator-notes={notes ? "^" + NOTES_MARKER + "$" : NO_SEPARATOR}>
+      <script type={"text/template"}>
+        {notes ? markdown + "\n" + NOTES_MARKER + "\n" + notes : markdown}
+      </script>
+    </section>
+  )
+}
+
+const wireEntry = (entry: WireEntry, key: number, markdownProps: any) => {
+  return typeof entry[0] === "string"
+    ? wireSlide(entry as WireSlide, key, markdownProps)
+    : <section key={key} {...markdownProps}>{(entry as WireSlide[]).map((slide, index) => wireSlide(slide, index, {}))}</section>
+}
+
 const GlobalCSS = createGlobalStyle<{ inject: string}>`
   ${props => props.inject}
 `
 
-const includedPlugins = {"markdown": RevealMarkdown, "highlight": RevealHighlight, "katex": RevealMath.KaTeX, "mathjax2": RevealMath.MathJax2, "mathjax3": RevealMath.MathJax3, "search": RevealSearch, "notes": RevealNotes, "zoom": RevealZoom}
+const LowPowerCSS = createGlobalStyle`
+  .reveal.low-power .slides section.past .fragment,
+  .reveal.low-power .slides section.future .fragment {
+    visibility: hidden;
+  }
+`
+
+// The reveal.js events that send the presentation state back to Streamlit (unless `report_on` says otherwise)
+const reportEvents = ['slidechanged', 'fragmentshown', 'fragmenthidden', 'overviewshown', 'overviewhidden', 'paused', 'resumed']
+
+// Each plugin is split into its own chunk and only fetched when a deck lists it
+// in config["plugins"] (the same way themes are loaded on demand).
+const includedPlugins: {[name: string]: () => Promise<any>} = {
+  "markdown": () => import(/* webpackChunkName: "plugin-markdown" */ 'reveal.js/plugin/markdown/markdown').then((module) => module.default),
+  "highlight": () => Promise.all([
+    import(/* webpackChunkName: "plugin-highlight" */ 'reveal.js/plugin/highlight/highlight'),
+    import(/* webpackChunkName: "plugin-highlight" */ 'reveal.js/plugin/highlight/monokai.css'),
+  ]).then(([module]) => module.default),
+  "katex": () => import(/* webpackChunkName: "plugin-math" */ 'reveal.js/plugin/math/math').then((module) => module.default.KaTeX),
+  "mathjax2": () => import(/* webpackChunkName: "plugin-math" */ 'reveal.js/plugin/math/math').then((module) => module.default.MathJax2),
+  "mathjax3": () => import(/* webpackChunkName: "plugin-math" */ 'reveal.js/plugin/math/math').then((module) => module.default.MathJax3),
+  "search": () => import(/* webpackChunkName: "plugin-search" */ 'reveal.js/plugin/search/search').then((module) => module.default),
+  "notes": () => import(/* webpackChunkName: "plugin-notes" */ 'reveal.js/plugin/notes/notes').then((module) => module.default),
+  "zoom": () => import(/* webpackChunkName: "plugin-zoom" */ 'reveal.js/plugin/zoom/zoom').then((module) => module.default),
+}
+const loadedPlugins: {[name: string]: Promise<any>} = {}
+
+// Resolves to the plugin named `name` (or null if there is no such plugin or it failed to load)
+const loadPlugin = (name: string) : Promise<any> => {
+  if (!(name in includedPlugins)) {
+    return Promise.resolve(null)
+  }
+  if (!(name in loadedPlugins)) {
+    loadedPlugins[name] = includedPlugins[name]().catch((err) => {
+      console.warn("Failed plugin import: ", name, err);
+      delete loadedPlugins[name];
+      return null;
+    });
+  }
+  return loadedPlugins[name]
+}
 // const simpleCommands = {"left": Reveal.left, "right": () => {Reveal.right()}, "up": Reveal.up, "down": Reveal.down, "prev": Reveal.prev, "next": Reveal.next, "prevFragment": Reveal.prevFragment, "nextFragment": Reveal.nextFragment, "togglePause": Reveal.togglePause, "toggleAutoSlide": Reveal.toggleAutoSlide, "toggleHelp": Reveal.toggleHelp, "toggleOverview": Reveal.toggleOverview, "shuffle": Reveal.shuffle}
 // const commandsWithArgs = {slide: Reveal.slide, togglePause: Reveal.togglePause, toggleAutoSlide: Reveal.toggleAutoSlide, toggleHelp: Reveal.toggleHelp, toggleOverview: Reveal.toggleOverview}
 
@@ -103,60 +458,353 @@ const DangerousDiv = ({html, innerRef, ...rest}: DangerousDivProps) => {
   )
 }
 
+// Ask Streamlit for something (e.g. a compiled deck we do not have) by attaching
+// a uniquely identified request to the current state. Python handles each request once.
+const sendRequest = (instance: DeckInstance, request: object) => {
+  const deck = readyDeck(instance)
+  const state = deck ? toGlobalState(instance, deck.getState()) : { indexh: -1, indexv: -1, indexf: -1, paused: false, overview: false }
+  requestCount += 1
+  Streamlit.setComponentValue(componentValue(instance, {...state, request: {id: Date.now() + "-" + requestCount, ...request}}))
+}
+
+// Update the slides in `container` to match `patch`. Slides that are already in
+// the DOM are moved (not re-created) and slides that are no longer in the layout
+// are removed. Returns false (and leaves the DOM untouched) if the patch refers
+// to slides that are neither in the DOM nor in the patch.
+const applyPatch = (container: HTMLElement, patch: SlidePatch) : boolean => {
+  const existing: {[id: string]: Element} = {}
+  container.querySelectorAll('section[data-slide-id]').forEach((element) => {
+    existing[element.getAttribute('data-slide-id') as string] = element
+  })
+
+  const ids = ([] as string[]).concat(...patch.layout)
+  if (ids.some((id) => !(id in existing) && !(id in patch.slides))) {
+    return false
+  }
+
+  const template = document.createElement('template')
+  const createElement = (html: string) : Element => {
+    template.innerHTML = html
+    return template.content.firstElementChild as Element
+  }
+  const getSlide = (id: string) : Element => {
+    if (id in existing) {
+      return existing[id]
+    }
+    const slide = createElement(patch.slides[id])
+    slide.setAttribute('data-slide-id', id)
+    return slide
+  }
+
+  const fragment = document.createDocumentFragment()
+  patch.layout.forEach((entry) => {
+    if (Array.isArray(entry)) {
+      const stack = createElement(patch.attributes ? '<section ' + patch.attributes + '></section>' : '<section></section>')
+      entry.forEach((id) => stack.appendChild(getSlide(id)))
+      fragment.appendChild(stack)
+    }
+    else {
+      fragment.appendChild(getSlide(entry))
+    }
+  })
+  while (container.firstChild) {
+    container.removeChild(container.firstChild)
+  }
+  container.appendChild(fragment)
+  return true
+}
+
+// Ask Streamlit for the slides around the current one when the viewer gets close
+// to the first or last mounted slide of a windowed deck.
+const checkWindow = (instance: DeckInstance) => {
+  const deck = readyDeck(instance)
+  if (!deck || instance.windowTotal === null) {
+    return
+  }
+  const indexh = deck.getState().indexh
+  const mounted = deck.getHorizontalSlides().length
+  const margin = Math.floor(instance.windowSize / 2)
+  const nearStart = indexh <= margin && instance.windowOffset > 0
+  const nearEnd = indexh >= mounted - 1 - margin && instance.windowOffset + mounted < instance.windowTotal
+  const index = indexh + instance.windowOffset
+  if ((nearStart || nearEnd) && instance.requestedWindow !== index) {
+    instance.requestedWindow = index
+    sendRequest(instance, {type: "window", index: index})
+  }
+}
+
+// With `private_notes`, the slides come without their speaker notes. Once the speaker view
+// of the presenter's deck (`presenter`) is open, the notes of the current slide are requested from Python (once per slide) and
+// added to the slide, and the speaker view is told to show them.
+const showNotes = (instance: DeckInstance) => {
+  const deck = readyDeck(instance)
+  if (!deck || !instance.speakerView) {
+    return
+  }
+  const state = toGlobalState(instance, deck.getState())
+  const position = state.indexh + "/" + state.indexv
+  if (!(position in instance.notes)) {
+    if (instance.requestedNotes !== position) {
+      instance.requestedNotes = position
+      sendRequest(instance, {type: "notes", indexh: state.indexh, indexv: state.indexv})
+    }
+    return
+  }
+  const slide = deck.getCurrentSlide() as HTMLElement
+  const html = instance.notes[position]
+  if (!slide || html === null || slide.querySelector(':scope > aside.notes')) {
+    return
+  }
+  const aside = document.createElement('aside')
+  aside.className = 'notes'
+  aside.innerHTML = html
+  slide.appendChild(aside);
+  // The notes plugin posts the current slide to the speaker view when the slide changes
+  (deck as any).dispatchEvent({target: slide, type: 'slidechanged', data: {indexh: deck.getState().indexh, indexv: state.indexv, previousSlide: null, currentSlide: slide}})
+}
+
+// The speaker view (notes plugin) announces itself to the deck's window once it is open
+const isSpeakerViewMessage = (event: MessageEvent) => {
+  try {
+    const data = typeof event.data === 'string' ? JSON.parse(event.data) : null
+    return !!data && data.namespace === 'reveal-notes' && data.type === 'connected'
+  }
+  catch (e) {
+    return false
+  }
+}
+
+// Words are split the same way as in Python, so queries match the words of the index.
+// The "u" flag makes the ranges code points, like in Python, instead of UTF-16 code units
+// (a constructor, since the "u" flag of a literal is not allowed by the es5 target).
+const WORD_REGEX = new RegExp("[0-9a-z_\\u{c0}-\\u{10ffff}]+", "gu")
+const tokenize = (text: string) : string[] => text.toLowerCase().match(WORD_REGEX) ?? []
+
+// The positions of the slides that contain all the words of `query` (the last one
+// also matches as a prefix), in deck order. See `SearchIndex.search` in Python.
+const searchSlides = (index: SearchIndex, query: string) : [number, number][] => {
+  const terms = tokenize(query)
+  let result: number[] | null = null
+  for (let i = 0; i < terms.length && (result === null || result.length > 0); i++) {
+    const term = terms[i]
+    const prefix = i === terms.length - 1
+    // Binary search for the first token not before the term
+    let low = 0
+    let high = index.tokens.length
+    while (low < high) {
+      const middle = (low + high) >> 1
+      if (index.tokens[middle] < term) {
+        low = middle + 1
+      }
+      else {
+        high = middle
+      }
+    }
+    const matches: {[number: number]: boolean} = {}
+    for (let t = low; t < index.tokens.length && (prefix ? index.tokens[t].startsWith(term) : index.tokens[t] === term); t++) {
+      index.postings[t].forEach((number) => { matches[number] = true })
+    }
+    const previous: number[] | null = result
+    result = previous === null ? Object.keys(matches).map(Number) : previous.filter((number) => matches[number])
+  }
+  return (result ?? []).sort((a, b) => a - b).map((number) => index.positions[number])
+}
+
+// Move to a slide given by its position in the whole deck. A slide of a windowed deck
+// that is not mounted is moved to once Python has sent the window around it.
+const goToSlide = (instance: DeckInstance, indexh: number, indexv: number) => {
+  const deck = readyDeck(instance)
+  if (!deck) {
+    return
+  }
+  const local = indexh - instance.windowOffset
+  if (instance.windowTotal !== null && (local < 0 || local >= deck.getHorizontalSlides().length)) {
+    instance.pendingSlide = [indexh, indexv]
+    instance.requestedWindow = indexh
+    sendRequest(instance, {type: "window", index: indexh})
+    return
+  }
+  instance.pendingSlide = null
+  deck.slide(local, indexv)
+}
+
+// Stands in for the search plugin when the deck has a search index (`search_index`):
+// the same search box (Ctrl/Cmd + Shift + F), but queries are looked up in the index
+// instead of walking the slides, and Enter moves to the next matching slide.
+const indexedSearch = (instance: DeckInstance) => {
+  let box: HTMLDivElement | null = null
+  let input: HTMLInputElement | null = null
+  let query: string | null = null
+  let hits: [number, number][] = []
+  let current = -1
+
+  const next = () => {
+    const index = instance.searchDigest ? searchIndexes[instance.searchDigest] : undefined
+    if (!input || !index) {
+      return
+    }
+    if (input.value !== query) {
+      query = input.value
+      hits = searchSlides(index, query)
+      current = -1
+    }
+    if (hits.length > 0) {
+      current = (current + 1) % hits.length
+      goToSlide(instance, hits[current][0], hits[current][1])
+    }
+  }
+
+  const render = (deck: Reveal.Api) => {
+    box = document.createElement('div')
+    box.className = 'searchbox'
+    box.style.cssText = 'position: absolute; top: 10px; right: 10px; z-index: 10; display: none;'
+    box.innerHTML = '<input type="search" class="searchinput" placeholder="Search..." style="vertical-align: top;"/>'
+    input = box.querySelector('.searchinput') as HTMLInputElement
+    input.style.cssText = 'width: 240px; font-size: 14px; padding: 4px 6px; color: #000; background: #fff; border-radius: 2px; ' +
+      'border: 0; outline: 0; box-shadow: 0 2px 18px rgba(0, 0, 0, 0.2); -webkit-appearance: none;'
+    input.addEventListener('keyup', (event) => {
+      if (event.key === 'Enter') {
+        event.preventDefault()
+        next()
+      }
+    })
+    const root = deck.getRevealElement() as Element
+    root.appendChild(box)
+  }
+
+  const toggle = () => {
+    if (!box || !input) {
+      return
+    }
+    const open = box.style.display !== 'inline'
+    box.style.display = open ? 'inline' : 'none'
+    if (open) {
+      input.focus()
+      input.select()
+    }
+  }
+
+  const onKeyDown = (event: KeyboardEvent) => {
+    if (event.key === 'F' && (event.ctrlKey || event.metaKey)) {
+      event.preventDefault()
+      toggle()
+    }
+  }
+
+  return {
+    id: 'search',
+    init: (deck: Reveal.Api) => {
+      render(deck)
+      deck.registerKeyboardShortcut('CTRL + Shift + F', 'Search')
+      document.addEventListener('keydown', onKeyDown, false)
+    },
+    open: () => {
+      if (box && box.style.display !== 'inline') {
+        toggle()
+      }
+    },
+    destroy: () => {
+      document.removeEventListener('keydown', onKeyDown, false)
+      box?.remove()
+    }
+  }
+}
+
 // RevealSlides is the main component.
 const RevealSlides = ({ args, disabled }: RevealSlidesProps) => {   
 
   let configStr = JSON.stringify(args["config"])
   let initStateStr = JSON.stringify(args["initial_state"])
+
+  const digest: string | null = args["digest"] ?? null
+  if (digest && args["content"]) {
+    compiledDecks[digest] = args["content"]
+  }
+  const compiledHtml = digest ? compiledDecks[digest] : undefined
+
+  const patch: SlidePatch | null = args["patch"] ?? null
+  const instanceRef = useRef<DeckInstance>(createInstance())
+
+  const searchDigest: string | null = args["search_digest"] ?? null
+  if (searchDigest && args["search_index"]) {
+    searchIndexes[searchDigest] = args["search_index"]
+  }
+  instanceRef.current.searchDigest = searchDigest
+
+  const codeStyle: {digest: string, css: string | null} | null = args["code_style"] ?? null
+  if (codeStyle && codeStyle.css) {
+    codeStyles[codeStyle.digest] = codeStyle.css
+  }
+  const codeCss = codeStyle ? codeStyles[codeStyle.digest] : ""
+  const revealRef = useRef<HTMLDivElement | null>(null)
+  if (args["profile"] && !instanceRef.current.timings) {
+    instanceRef.current.timings = {plugin_init: {}, frame_height_calls: 0}
+  }
+  const slidesRef = useRef<HTMLDivElement | null>(null)
   // const commandStr = JSON.stringify(args["commands"])
 
   // This function takes the config object passed in from Streamlit and
   // adjusts it to work with the reveal.js api. The appropriate plugin module
-  // is substituted in for each plugin name found in the 'plugins' attribute.
-  // Markdown plugin is always included regardless if it is in the config object or not.
-  const setupConfig = (configString: string) : object => {
-    const config = {...defaultConfig, ...JSON.parse(configStr)}
-    // code to run after render goes here
-    if (args["allow_unsafe_html"]) {
-      if ('plugins' in config){
-        var arr = config['plugins'];
-        arr.forEach(function(moduleName: string, index: number) {
-          if (moduleName in includedPlugins){
-            arr[index] = (includedPlugins as any)[moduleName];
-          }
-          else {
-            arr[index] = null;
-          }
-        });
-        config['plugins'] = arr.filter((x:any) => !!x) as any[];
-      }
+  // is loaded and substituted in for each plugin name found in the 'plugins' attribute.
+  // Markdown plugin is always included for markdown content (unless it was compiled in Python).
+  // A deck with a search index gets the indexed search instead of the search plugin.
+  // With `timings`, the plugin loading and initialization times are recorded.
+  const setupConfig = (configString: string, timings?: Timings | null) : Promise<any> => {
+    const config = {...defaultConfig, ...JSON.parse(configString)}
+    let names: string[] = config['plugins'] || []
+    if (!args["allow_unsafe_html"] && !args["digest"] && !names.includes("markdown")) {
+      names = names.concat(["markdown"])
     }
-    else {
-      if ('plugins' in config){
-        arr = config['plugins'];
-        arr.forEach(function(moduleName: string, index: number) {
-          if (moduleName in includedPlugins){
-            arr[index] = (includedPlugins as any)[moduleName];
-          }
-          else {
-            arr[index] = null;
-          }
-        });
-        config['plugins'] = arr.filter((x:any) => !!x) as any[];
-        if(!config['plugins'].includes(RevealMarkdown)){
-          config['plugins'].push(RevealMarkdown);
-        }
+    if (args["search_digest"]) {
+      names = names.filter((name) => name !== "search")
+    }
+    const start = performance.now()
+    return Promise.all(names.map(loadPlugin)).then((plugins) => {
+      config['plugins'] = plugins.filter((x: any) => !!x);
+      if (args["search_digest"]) {
+        config['plugins'].push(() => indexedSearch(instanceRef.current))
       }
-      else {
-        config['plugins'] = [RevealMarkdown];
+      if (timings) {
+        timings.plugin_load = performance.now() - start
+        config['plugins'] = config['plugins'].map((plugin: any) => timePlugin(plugin, timings))
       }
+      return config;
+    });
+  }
+
+  // Once the theme's stylesheet is loaded, the deck is laid out again
+  const themeLoaded = (themeStart: number) => {
+    if (instanceRef.current.timings) {
+      instanceRef.current.timings.theme_load = performance.now() - themeStart
+    }
+    const deck = readyDeck(instanceRef.current)
+    if (!deck) {
+      return
+    }
+    try{
+      layoutDeck(instanceRef.current);
+
+      // Force the symbol-per-slide-progress plugin to update its colors if the plugin is loaded
+      if( RevealSymbolPerSlideProgress && "externalPlugins" in (deck.getConfig() as any) && ((deck.getConfig() as any).externalPlugins as string[]).includes("symbolperslideprogress")){ 
+        RevealSymbolPerSlideProgress.updateColors((deck.getConfig() as any).symbolperslideprogress || {});
+        RevealSymbolPerSlideProgress.updateNavigation()
+      }
+    }
+    catch (e){
+      console.warn("reveal.js layout() call failed.")
     }
-    return config;
   }
 
+  // A stylesheet merged in Python (theme and `css`, see reveal_slides/styles.py) replaces
+  // the theme import and the injected css
+  const stylesheet: string | null = args["stylesheet"] ?? null
+
   // This function handles `theme` changes. It imports the appropriate css file 
   // according to the theme name passed in from Streamlit.
   useMemo(()=>{
+    if (stylesheet) {
+      return
+    }
     // To do: remove or disable previously imported css. When the list of
     // css imports exceed about 25, the page no longer updates.
     // NOTE: According to the webpack.config.js file found in the react-scripts node_module, 
@@ -166,19 +814,9 @@ const RevealSlides = ({ args, disabled }: RevealSlidesProps) => {
     // (and adding link elements to header with href pointing to files) in production mode.
     // It may be possible to alter settings/options to force these loaders to replace the css 
     // added for previous themes with the css for the current.
+    const themeStart = performance.now()
     import('../node_modules/reveal.js/dist/theme/' + args.theme + '.css').then((css) => {
-      try{
-        Reveal.layout();
-
-        // Force the symbol-per-slide-progress plugin to update its colors if the plugin is loaded
-        if( RevealSymbolPerSlideProgress && "externalPlugins" in (Reveal.getConfig() as any) && ((Reveal.getConfig() as any).externalPlugins as string[]).includes("symbolperslideprogress")){ 
-          RevealSymbolPerSlideProgress.updateColors((Reveal.getConfig() as any).symbolperslideprogress || {});
-          RevealSymbolPerSlideProgress.updateNavigation()
-        }
-      }
-      catch (e){
-        console.warn("Reveal.layout() call failed.")
-      }
+      themeLoaded(themeStart)
 
       // const tempList = Array.from(document.head.childNodes)
       // console.log(([] as ChildNode[]).concat(tempList))
@@ -188,16 +826,91 @@ const RevealSlides = ({ args, disabled }: RevealSlidesProps) => {
 
   }, [args.theme]);
 
+  // The merged stylesheet is linked by url (cached by the browser) and only swapped when
+  // the url changes. The previous stylesheet stays until the new one has loaded.
+  const stylesheetRef = useRef<HTMLLinkElement | null>(null)
+  useEffect(() => {
+    if (!stylesheet) {
+      return
+    }
+    const previous = stylesheetRef.current
+    const link = document.createElement('link')
+    link.rel = 'stylesheet'
+    link.href = stylesheet
+    const themeStart = performance.now()
+    link.onload = () => {
+      previous?.remove()
+      themeLoaded(themeStart)
+    }
+    link.onerror = () => console.warn("Failed stylesheet load: ", stylesheet)
+    document.head.appendChild(link)
+    stylesheetRef.current = link
+  }, [stylesheet]);
+
+  useEffect(() => {
+    return () => stylesheetRef.current?.remove()
+  }, []);
+
   // Initialize reveal.js
   useEffect(() => {
-    const config = setupConfig(configStr)
-    
-    try {
-      Reveal.destroy();
+    const instance = instanceRef.current
+    let unmounted = false
+    let reportTimer: number | undefined
+    let lastReportedState: string | undefined
+
+    // Resume layout (and resize the frame) when a hidden deck is shown again
+    const onVisibilityChange = () => {
+      if (updateVisibility(instance) && frameRef.current) {
+        updateFrame(frameRef.current.getBoundingClientRect().height)
+      }
+    }
+    instance.visible = !isHidden()
+    // Start at the hinted height and leave the frame alone until reveal.js is ready
+    // instead of following every intermediate size of the unstyled deck
+    if (typeof args["height"] !== "number") {
+      const hint = hintedHeight(args["height_hint"])
+      if (hint !== null) {
+        instance.pendingHeight = hint
+        flushFrameHeight(instance)
+      }
+      instance.holdFrame = true
     }
-    catch (e) {
+    const releaseFrame = () => {
+      instance.holdFrame = false
+      flushFrameHeight(instance)
+    }
+    window.addEventListener('resize', onVisibilityChange)
+    document.addEventListener('visibilitychange', onVisibilityChange)
+    const onMessage = (event: MessageEvent) => {
+      if (args["private_notes"] && args["presenter"] && isSpeakerViewMessage(event)) {
+        instance.speakerView = true
+        showNotes(instance)
+      }
+    }
+    window.addEventListener('message', onMessage)
+
+    const performanceMode = args["performance_mode"] ?? "quality"
+    if (performanceMode !== "quality") {
+      instance.performanceMode = performanceMode === "low_power" ? "low_power" : "quality"
     }
-    Reveal.initialize(config).then(() => {
+
+    let initializeStart = 0
+    setupConfig(configStr, instance.timings).then((config) => {
+      if (unmounted || !revealRef.current) {
+        return
+      }
+      instance.deck = new Reveal(revealRef.current, layoutConfig(instance, config))
+      initializeStart = performance.now()
+      return instance.deck.initialize()
+    }).then(() => {
+      const deck = readyDeck(instance)
+      if (unmounted || !deck) {
+        return
+      }
+      if (instance.timings) {
+        instance.timings.initialize = performance.now() - initializeStart
+      }
+      releaseFrame()
       // reveal.js is ready
       
       // For some yet to be determined reason, the highlight plugin is not initialized.
@@ -205,124 +918,260 @@ const RevealSlides = ({ args, disabled }: RevealSlidesProps) => {
       // does not work
       // To Do: make sure the highlight plugin only changes the HTML involving the code once instead of many times.
       // Possible solution is to make a change to the plugin init function.
-      let highlighter = Reveal.getPlugin('highlight') as any;
+      let highlighter = deck.getPlugin('highlight') as any;
       if (highlighter){
-        highlighter.init(Reveal);
+        highlighter.init(deck);
       }
       
       const initState = JSON.parse(initStateStr);
       if(Object.keys(initState).length !== 0){
-        Reveal.setState(initState);
+        deck.setState(toLocalState(instance, initState));
+      }
+      deck.on('slidechanged', () => checkWindow(instance));
+      deck.on('slidechanged', () => showNotes(instance));
+
+      if (instance.performanceMode === 'low_power') {
+        enterLowPower(instance)
+      }
+      if (instance.performanceMode) {
+        // Auto mode switches to low power (once) when the deck renders too few frames,
+        // and reports the switch with the measured frame rate
+        let slowWindows = 0
+        monitorFrames(instance, (fps) => {
+          instance.fps = Math.round(fps * 10) / 10
+          if (performanceMode !== 'auto' || instance.performanceMode !== 'quality') {
+            return
+          }
+          slowWindows = fps < LOW_FPS ? slowWindows + 1 : 0
+          if (slowWindows >= SLOW_WINDOWS) {
+            enterLowPower(instance)
+            Streamlit.setComponentValue(componentValue(instance, toGlobalState(instance, deck.getState())));
+          }
+        })
       }
 
-      if("externalPlugins" in (Reveal.getConfig() as any) && ((Reveal.getConfig() as any).externalPlugins as string[]).includes("symbolperslideprogress")){
+      if("externalPlugins" in (deck.getConfig() as any) && ((deck.getConfig() as any).externalPlugins as string[]).includes("symbolperslideprogress")){
         import('reveal.js-symbol-per-slide-progress').then((plugin) => {
           RevealSymbolPerSlideProgress = plugin.default
-          RevealSymbolPerSlideProgress.init(Reveal);
+          RevealSymbolPerSlideProgress.init(deck);
         });        
       }
 
       if(!args['display_only']){
-        // Send slide position indecies back to Streamlit on initialization and on slide change
-        const currState = Reveal.getState();
-        Streamlit.setComponentValue(currState);
-        Reveal.on( 'slidechanged', event => {
+        // Send slide position indecies back to Streamlit on initialization and whenever one
+        // of the `report_on` events fires. Every report reruns the Streamlit script, so reports
+        // are debounced (a quick run of key presses only reports the final position) and a
+        // state identical to the last one reported is not sent again.
+        const reportState = () => {
+          reportTimer = undefined
+          const currState = toGlobalState(instance, deck.getState());
+          const currStateStr = JSON.stringify(currState)
+          if (currStateStr !== lastReportedState) {
+            lastReportedState = currStateStr
+            Streamlit.setComponentValue(componentValue(instance, currState));
+          }
+        }
+        const scheduleReport = () => {
+          if (args["debounce"] > 0) {
+            window.clearTimeout(reportTimer)
+            reportTimer = window.setTimeout(reportState, args["debounce"])
+          }
+          else {
+            reportState()
+          }
+        }
 
-          const tempState = Reveal.getState();
-          Streamlit.setComponentValue({indexh: (event as any).indexh, indexv: (event as any).indexv, indexf: tempState.indexf, paused: tempState.paused, overview: tempState.overview});
+        reportState();
+        ((args["report_on"] ?? reportEvents) as string[]).forEach((eventName) => {
+          deck.on(eventName, scheduleReport);
         });
-        
-        Reveal.on( 'fragmentshown', event => {
-          // event.fragment = the fragment DOM element
-          const tempState = Reveal.getState();
-          Streamlit.setComponentValue(tempState);
-        } );
-        Reveal.on( 'fragmenthidden', event => {
-          // event.fragment = the fragment DOM element
-          const tempState = Reveal.getState();
-          Streamlit.setComponentValue(tempState);
-        } );
-        Reveal.on( 'overviewshown', event => {
-          // event.overview = the overview DOM element
-          const tempState = Reveal.getState();
-          Streamlit.setComponentValue(tempState);
-        } );
-        Reveal.on( 'overviewhidden', event => {
-          // event.overview = the overview DOM element
-          const tempState = Reveal.getState();
-          Streamlit.setComponentValue(tempState);
-        } );
-        Reveal.on( 'paused', event => {
-          // event.fragment = the fragment DOM element
-          const tempState = Reveal.getState();
-          Streamlit.setComponentValue(tempState);
-        } );
-        Reveal.on( 'resumed', event => {
-          // event.fragment = the fragment DOM element
-          const tempState = Reveal.getState();
-          Streamlit.setComponentValue(tempState);
-        } );
+      }
+      else if (instance.timings) {
+        // Display only decks do not report their state, but a profiled deck sends its timings once
+        Streamlit.setComponentValue(componentValue(instance, toGlobalState(instance, deck.getState())));
       }
 
+    }).finally(() => {
+      if (!unmounted) {
+        releaseFrame()
+      }
     });
 
     return () => {
       // code to run on component unmount goes here
-      Reveal.destroy();  
+      unmounted = true
+      window.clearTimeout(reportTimer)
+      if (instance.frameRequest !== null) {
+        window.cancelAnimationFrame(instance.frameRequest)
+        instance.frameRequest = null
+      }
+      if (instance.frameMonitor !== null) {
+        window.cancelAnimationFrame(instance.frameMonitor)
+        instance.frameMonitor = null
+      }
+      window.removeEventListener('resize', onVisibilityChange)
+      document.removeEventListener('visibilitychange', onVisibilityChange)
+      window.removeEventListener('message', onMessage)
+      if (instance.deck) {
+        instance.deck.destroy();
+        instance.deck = null
+      }
     }
   }, []);
 
   // Reconfigure reveal.js if config changes
   useEffect(() => {
-    const existingPlugins = Reveal.getPlugins();
-    const config = setupConfig(configStr)
-
-    // Add and register plugins that are not already loaded
-    let existingPluginsList : string[] = Object.values(existingPlugins).map((plugin: any) => plugin.id);
-    if('plugins' in args["config"]){
-      const plugins = args["config"]["plugins"];
-      (plugins as string[]).forEach((plugin: string) => {
-        if (plugin && existingPluginsList.indexOf(plugin) === -1){
-          Reveal.registerPlugin((includedPlugins as any)[plugin]);
-        }
-      });
-
-      //// Remove plugins that are no longer in the list (does not work yet..some signs there is a bug in Reveal.Plugin)
-      // Object.values(existingPlugins as {[id: string]: Reveal.Plugin;}).forEach((plugin: any) => {
-      //   if (plugin.id && plugin.id !=='markdown' && plugins.indexOf(plugin.id) === -1){
-      //     console.log("destroy plugin: " + plugin.id);
-      //     if( typeof plugin.destroy === 'function' ) {
-      //       plugin.destroy();
-      //     }
-      //   }
-      // });
-    }
-    // Reconfigure reveal.js
-    Reveal.configure(config);
+    setupConfig(configStr).then((config) => {
+      // Plugins are registered on initialization, so there is nothing to add yet
+      const instance = instanceRef.current
+      const deck = readyDeck(instance)
+      if (!deck) {
+        return
+      }
+      const existingPlugins = deck.getPlugins();
+
+      // Add and register plugins that are not already loaded
+      let existingPluginsList : string[] = Object.values(existingPlugins).map((plugin: any) => plugin.id);
+      if('plugins' in args["config"]){
+        const plugins = args["config"]["plugins"];
+        (plugins as string[]).forEach((plugin: string) => {
+          if (plugin && existingPluginsList.indexOf(plugin) === -1){
+            loadPlugin(plugin).then((module) => {
+              if (module) {
+                deck.registerPlugin(module);
+              }
+            });
+          }
+        });
+
+        //// Remove plugins that are no longer in the list (does not work yet..some signs there is a bug in Reveal.Plugin)
+        // Object.values(existingPlugins as {[id: string]: Reveal.Plugin;}).forEach((plugin: any) => {
+        //   if (plugin.id && plugin.id !=='markdown' && plugins.indexOf(plugin.id) === -1){
+        //     console.log("destroy plugin: " + plugin.id);
+        //     if( typeof plugin.destroy === 'function' ) {
+        //       plugin.destroy();
+        //     }
+        //   }
+        // });
+      }
+      // Reconfigure reveal.js
+      deck.configure(layoutConfig(instance, config));
+    });
   }, [configStr, args["allow_unsafe_html"]]);
 
+  // Notes requested by the speaker view (see `showNotes`). The notes of a deck that
+  // changed are requested again.
+  useEffect(() => {
+    instanceRef.current.notes = {}
+    instanceRef.current.requestedNotes = null
+    showNotes(instanceRef.current)
+  }, [digest]);
+
+  const notesStr = JSON.stringify(args["notes"] ?? null)
+  useEffect(() => {
+    const notes = JSON.parse(notesStr)
+    if (notes) {
+      const instance = instanceRef.current
+      instance.notes[notes.indexh + "/" + notes.indexv] = notes.html
+      showNotes(instance)
+    }
+  }, [notesStr]);
+
+  // Request the search index if Streamlit only sent the digest of one we do not have
+  useEffect(() => {
+    if (searchDigest && !(searchDigest in searchIndexes)) {
+      sendRequest(instanceRef.current, {type: "search", digest: searchDigest})
+    }
+  }, [searchDigest]);
+
+  // Likewise for the stylesheet of pre-rendered code
+  useEffect(() => {
+    if (codeStyle && codeCss === undefined) {
+      sendRequest(instanceRef.current, {type: "style", digest: codeStyle.digest})
+    }
+  }, [codeStyle?.digest, codeCss]);
+
   // When reveal.js is ready (after initialization or reconfiguration), 
   // set the initial state if it is passed in from Streamlit.
   useEffect(() => {
+    const instance = instanceRef.current
+    const deck = readyDeck(instance)
     const initState = JSON.parse(initStateStr);
-    if (Reveal.isReady() && Object.keys(initState).length !== 0){
-      Reveal.setState(initState);
+    if (deck && Object.keys(initState).length !== 0){
+      deck.setState(toLocalState(instance, initState));
     }
   }, [initStateStr]);
 
+  // Precompiled decks: the markup is replaced by React, so reveal.js needs to pick up
+  // the new slides. If Streamlit only sent the digest of a deck we do not have
+  // (e.g. the component was remounted), request the full markup.
+  useEffect(() => {
+    if (!digest || patch) {
+      return
+    }
+    const deck = readyDeck(instanceRef.current)
+    if (compiledHtml === undefined) {
+      sendRequest(instanceRef.current, {type: "digest", digest: digest})
+    }
+    else if (deck) {
+      const state = deck.getState();
+      if (instanceRef.current.performanceMode === 'low_power') {
+        stripBackgroundVideos(deck.getSlidesElement() as Element)
+      }
+      deck.sync();
+      deck.setState(state);
+    }
+  }, [digest, compiledHtml]);
+
+  // Incremental updates: apply the patch before reveal.js is initialized (on mount)
+  // or synced (on later updates) and keep the current slide position.
+  useLayoutEffect(() => {
+    if (!patch || !slidesRef.current) {
+      return
+    }
+    const instance = instanceRef.current
+    if (!applyPatch(slidesRef.current, patch)) {
+      sendRequest(instance, {type: "slides"})
+      return
+    }
+    // Windowed decks: the same slide has a different local index if the window moved
+    const offset = patch.offset ?? 0
+    const deck = readyDeck(instance)
+    if (deck) {
+      const state = deck.getState();
+      state.indexh += instance.windowOffset - offset;
+      if (instance.performanceMode === 'low_power') {
+        stripBackgroundVideos(slidesRef.current)
+      }
+      deck.sync();
+      deck.setState(state);
+    }
+    instance.windowOffset = offset
+    instance.windowTotal = patch.total ?? null
+    instance.windowSize = patch.size ?? 0
+    instance.requestedWindow = null
+    // A search hit that was outside of the previous window (moved to once, without asking again)
+    const pending = instance.pendingSlide
+    instance.pendingSlide = null
+    if (deck && pending && pending[0] >= offset && pending[0] - offset < deck.getHorizontalSlides().length) {
+      deck.slide(pending[0] - offset, pending[1])
+    }
+  }, [patch?.digest, patch?.resend]);
+
   // Disable reveal.js if disabled is true
   useEffect(() => {
-    if (Reveal.isReady()){
+    const deck = readyDeck(instanceRef.current)
+    if (deck){
       if (disabled){
-        Reveal.togglePause(true);
-        let viewport = Reveal.getViewportElement();
+        deck.togglePause(true);
+        let viewport = deck.getViewportElement();
         if (viewport){
           viewport.style.pointerEvents = "none";
         }
       }
       else {  
-        Reveal.togglePause(false);
-        let viewport = Reveal.getViewportElement();
+        deck.togglePause(false);
+        let viewport = deck.getViewportElement();
         if (viewport){
           viewport.style.pointerEvents = "auto";
         }
@@ -338,50 +1187,72 @@ const RevealSlides = ({ args, disabled }: RevealSlidesProps) => {
    * to communicate to streamlit the height of the component that has changed
    * so that streamlit can adjust the iframe containing the component accordingly.
    */
-  const resizeObserver = new ResizeObserver((entries: any) => {
+  const frameRef = useRef<HTMLDivElement | null>(null)
+
+  const updateFrame = (height: number) => {
     // If we know that the body will always fully contain our component (without cutting it off)
     // then we can use docuemnt.body height instead
     if (args["height"] === "auto" || typeof args["height"] !== "number"){
-      Streamlit.setFrameHeight((entries[0].contentBoxSize.blockSize ?? entries[0].contentRect.height)); 
-      if (Reveal.isReady()){
-        Reveal.layout();
-      }
+      scheduleFrameHeight(instanceRef.current, height);
     }
     else {
-      Streamlit.setFrameHeight(args["height"]);
-      if (Reveal.isReady()){
-        Reveal.layout();
-      }
+      scheduleFrameHeight(instanceRef.current, args["height"]);
+    }
+  }
+
+  const resizeObserver = new ResizeObserver((entries: any) => {
+    // A hidden deck has no meaningful size: leave the frame as it is until the deck is shown again
+    if (isHidden()) {
+      return
     }
-    
+    updateFrame(entries[0].contentBoxSize.blockSize ?? entries[0].contentRect.height)
   })
 
   const observe = (divElem: any) => {
+    frameRef.current = divElem
     divElem ? resizeObserver.observe(divElem as HTMLDivElement) : resizeObserver.disconnect();
   }
 
+  let slides
   if (args["allow_unsafe_html"]) {
-    return (
-      <>
-        <GlobalCSS inject={args.css}/>
-        <DangerousDiv innerRef={observe} className="slides" html={args["content"]} />
-      </>
+    // Markup from the script is cached by digest like compiled decks
+    slides = <DangerousDiv innerRef={observe} className="slides" html={digest ? compiledHtml ?? "" : args["content"]} />
+  }
+  else if (patch) {
+    slides = <div ref={(element) => {slidesRef.current = element; observe(element)}} className="slides" />
+  }
+  else if (digest) {
+    slides = <div ref={observe} className="slides" dangerouslySetInnerHTML={{__html: compiledHtml ?? ""}} />
+  }
+  else if (args["deck"]) {
+    slides = (
+      <div ref={observe} className="slides">
+        {(args["deck"] as WireEntry[]).map((entry, index) => wireEntry(entry, index, args["markdown_props"]))}
+      </div>
     )
   }
   else {
-    return (
-      <>
-        <GlobalCSS inject={args.css}/>
-        <div ref={observe} className="slides">
-          <section data-markdown={""} {...args["markdown_props"]}>
-            <script type={"text/template"}>
-              {args["content"]}
-            </script>
-          </section>
-        </div>
-      </>
+    slides = (
+      <div ref={observe} className="slides">
+        <section data-markdown={""} {...args["markdown_props"]}>
+          <script type={"text/template"}>
+            {args["content"]}
+          </script>
+        </section>
+      </div>
     )
   }
+
+  // Each component renders (and initializes reveal.js on) its own presentation root
+  return (
+    <>
+      <GlobalCSS inject={(stylesheet ? "" : args.css) + (codeCss ? "\n" + codeCss : "")}/>
+      <LowPowerCSS/>
+      <div ref={revealRef} className="reveal">
+        {slides}
+      </div>
+    </>
+  )
 }
 
 // "withStreamlitConnection" is a wrapper function. It bootstraps the
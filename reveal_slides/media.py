@@ -0,0 +1,175 @@
+"""Serving the local images and videos of a deck.
+
+Slides may refer to files on disk, e.g. `![](images/chart.png)` or
+`<!-- .slide: data-background-video="intro.mp4" -->`. The browser cannot load
+those paths from the component, so they are registered with Streamlit's media
+file manager (the endpoint `st.image` and `st.video` use) and the slides are
+pointed at it. The endpoint answers range requests, so videos stream and seek
+instead of downloading in full, and its urls are named after the file content,
+so a browser can cache them for good and an edited file gets a new url.
+
+Only media files (see `MEDIA_EXTENSIONS`) under the media root are served: the
+directory Streamlit runs from, or the one set with `set_media_root`. Relative
+paths are relative to the media root. Paths are resolved (`..` and symbolic
+links included) before they are checked, and any other path is left in the
+slide as it is.
+"""
+import mimetypes
+import os
+import re
+from functools import lru_cache
+from html import escape, unescape
+
+from . import compiler, diff
+
+# The attributes of compiled slides that load a file
+MEDIA_ATTRIBUTES = ("src", "data-src", "poster", "data-background-image", "data-background-video")
+# The extensions of the files that are served: images, videos, audio and subtitles
+MEDIA_EXTENSIONS = frozenset([
+    ".apng", ".avif", ".bmp", ".gif", ".ico", ".jpeg", ".jpg", ".png", ".svg", ".webp",
+    ".m4v", ".mov", ".mp4", ".ogv", ".webm",
+    ".aac", ".flac", ".m4a", ".mp3", ".oga", ".ogg", ".opus", ".wav",
+    ".vtt",
+])
+
+_MEDIA_ATTRIBUTE_REGEX = re.compile(r'(\s(?:%s)=")([^"]*)(")' % "|".join(re.escape(name) for name in MEDIA_ATTRIBUTES))
+# A url scheme (a one letter "scheme" is a Windows drive)
+_SCHEME_REGEX = re.compile(r"^[a-zA-Z][a-zA-Z0-9+.-]+:")
+# Urls returned by the media file manager are absolute paths of the Streamlit server,
+# the component is served two levels down (`/component/<name>/index.html`)
+_COMPONENT_ROOT = "../.."
+
+# The directory local media is served from (see `set_media_root`), None for the working directory
+_media_root = None
+
+
+def set_media_root(directory):
+    """Only serve local media from under `directory` (None: the working directory, the default).
+    Relative paths in slides are relative to `directory`."""
+    global _media_root
+    _media_root = directory
+
+
+def _paths(value, name):
+    # `data-background-video` takes a comma separated list of sources
+    return [path.strip() for path in value.split(",")] if name.endswith("data-background-video=\"") else [value]
+
+
+def is_local(path):
+    """Return True if `path` (as written in a slide) names a media file under the media root."""
+    return _resolve(path) is not None
+
+
+def _resolve(path):
+    # The real path of the media file `path` names, or None if it is not one that is served
+    if not path or path.startswith(("#", "//")) or _SCHEME_REGEX.match(path):
+        return None
+    root = os.path.realpath(_media_root or os.getcwd())
+    real = os.path.realpath(os.path.join(root, path))
+    try:
+        if os.path.commonpath([root, real]) != root:
+            return None
+    except ValueError:
+        # On another drive
+        return None
+    if os.path.splitext(real)[1].lower() not in MEDIA_EXTENSIONS or not os.path.isfile(real):
+        return None
+    return real
+
+
+def local_media(markup):
+    """Return the local files `markup` refers to, in order of appearance."""
+    # Checked on every call: files may be added or removed while the app runs
+    return tuple(path for path in _references(markup) if is_local(path))
+
+
+@lru_cache(maxsize=256)
+def _references(markup):
+    # The distinct paths in the media attributes of `markup`, in order of appearance
+    paths = []
+    for match in _MEDIA_ATTRIBUTE_REGEX.finditer(markup):
+        for path in _paths(unescape(match.group(2)), match.group(1)):
+            if path not in paths:
+                paths.append(path)
+    return tuple(paths)
+
+
+@lru_cache(maxsize=64)
+def _read(path, mtime, size):
+    # Keyed by modification time and size, so an edited file is read again
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def serve(paths, key=None):
+    """Register local files with Streamlit's media file manager.
+
+    Files are registered for the current script run only (like the files of
+    `st.image`), so `serve` is called on every rerun. Paths that are not media
+    files under the media root are skipped. Returns {path: url}, or an empty
+    dict when there is no Streamlit server (e.g. in bare mode).
+    """
+    from streamlit import runtime
+
+    if not paths or not runtime.exists():
+        return {}
+    manager = runtime.get_instance().media_file_mgr
+    urls = {}
+    for path in paths:
+        real = _resolve(path)
+        if real is None:
+            continue
+        stat = os.stat(real)
+        data = _read(real, stat.st_mtime_ns, stat.st_size)
+        mimetype = mimetypes.guess_type(real)[0] or "application/octet-stream"
+        url = manager.add(data, mimetype, "reveal_slides.%s.%s" % (key, real))
+        urls[path] = _COMPONENT_ROOT + url
+    return urls
+
+
+def rewrite(markup, urls):
+    """Replace the local paths in the media attributes of `markup` by their `urls`."""
+    if not urls:
+        return markup
+
+    def replace(match):
+        paths = _paths(unescape(match.group(2)), match.group(1))
+        return match.group(1) + escape(",".join(urls.get(path, path) for path in paths)) + match.group(3)
+
+    return _MEDIA_ATTRIBUTE_REGEX.sub(replace, markup)
+
+
+def serve_deck(deck, key=None):
+    """Serve the local media of a compiled deck and return the deck pointing at it.
+
+    The returned deck has its own digest and slide ids, so a frontend holding
+    the deck with older urls (e.g. before a file was edited) gets the new one.
+    """
+    urls = serve(local_media(deck.html), key)
+    return _rewrite_deck(deck, tuple(sorted(urls.items()))) if urls else deck
+
+
+@lru_cache(maxsize=32)
+def _rewrite_deck(deck, urls):
+    urls = dict(urls)
+    sections = [[rewrite(markup, urls) for markup in section] if isinstance(section, list) else rewrite(section, urls)
+                for section in deck.sections]
+    return compiler.CompiledDeck(compiler.content_digest(deck.digest, sorted(urls.items())), sections, deck.attributes)
+
+
+def serve_patch(patch, known_media, key=None):
+    """Serve the local media of the slides mounted by a window patch.
+
+    `known_media` maps the ids of the slides the frontend already has to their
+    local files, which are registered again for this run. The markup in
+    `patch["slides"]` is rewritten in place. Returns the mapping for the slides
+    of the patch.
+    """
+    media = {}
+    for slide_id in diff.flatten_ids(patch["layout"]):
+        markup = patch["slides"].get(slide_id)
+        media[slide_id] = local_media(markup) if markup is not None else known_media.get(slide_id, ())
+    urls = serve(sorted(set(path for paths in media.values() for path in paths)), key)
+    for slide_id, markup in patch["slides"].items():
+        patch["slides"][slide_id] = rewrite(markup, urls)
+    return media
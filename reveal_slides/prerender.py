@@ -0,0 +1,205 @@
+"""Pre-rendering of math and code blocks in Python.
+
+With `slides(..., prerender=True)` LaTeX is converted to MathML and code
+fences are syntax highlighted while the deck is compiled, so the browser
+receives final markup and needs neither the math nor the highlight plugin.
+The output mirrors what those plugins produce (including the line number
+table and one fragment per ```` ```lang [1-3|2-4] ```` highlight step), so
+the reveal.js styles apply unchanged. Highlighted tokens carry class names
+and their colors come with `code_stylesheet`.
+
+Requires the optional dependencies `pygments` and `latex2mathml`
+(`pip install streamlit-reveal-slides[prerender]`).
+"""
+import re
+from functools import lru_cache
+from html import escape, unescape
+
+try:
+    from pygments.lexers import get_lexer_by_name
+    from pygments.styles import get_style_by_name
+    from pygments.token import STANDARD_TYPES, Token
+    from pygments.util import ClassNotFound
+except ImportError:  # pragma: no cover
+    get_lexer_by_name = None
+
+try:
+    from latex2mathml.converter import convert as latex_to_mathml
+except ImportError:  # pragma: no cover
+    latex_to_mathml = None
+
+# The plugins that are made redundant by pre-rendering
+PRERENDERED_PLUGINS = ("highlight", "katex", "mathjax2", "mathjax3")
+# The plugins each pre-rendering step stands in for
+STEP_PLUGINS = {"highlight": ("highlight",), "math": ("katex", "mathjax2", "mathjax3")}
+
+# Same as the monokai theme the highlight plugin is bundled with
+CODE_STYLE = "monokai"
+
+# Delimiters recognized by the reveal.js math plugins, display math first. Like in pandoc, an
+# inline `$` formula starts with a `$` followed by a non-space and ends with a `$` that follows
+# a non-space and is not followed by a digit, so amounts ("costs $5 and $10") are left alone.
+_MATH_REGEX = re.compile(r"\$\$(.+?)\$\$|\\\[(.+?)\\\]|\\\((.+?)\\\)|(?<![\\\d$])\$(?![\s$])([^$]+?)(?<![\s\\])\$(?!\d)", re.S)
+
+
+def prerender_steps(plugins):
+    """The pre-rendering steps of a deck shown with the reveal.js `plugins`: "highlight" with
+    the highlight plugin and "math" with a math plugin. Without the plugin, the deck would not
+    render that markup either, so it is left as it is."""
+    plugins = plugins or ()
+    return tuple(step for step in sorted(STEP_PLUGINS) if any(name in plugins for name in STEP_PLUGINS[step]))
+
+
+def _require(module, name):
+    if module is None:
+        raise ImportError("Pre-rendering requires %s. Install it with `pip install streamlit-reveal-slides[prerender]`." % name)
+
+
+@lru_cache(maxsize=1024)
+def render_math(latex, display=False):
+    """Convert a LaTeX formula to MathML."""
+    _require(latex_to_mathml, "latex2mathml")
+    return latex_to_mathml(latex.strip(), display="block" if display else "inline")
+
+
+def replace_math(html_text):
+    """Replace every delimited formula in an (HTML escaped) text with MathML."""
+    if "$" not in html_text and "\\" not in html_text:
+        return html_text
+
+    def convert(match):
+        display = match.group(1) is not None or match.group(2) is not None
+        latex = next(group for group in match.groups() if group is not None)
+        return render_math(unescape(latex), display)
+
+    return _MATH_REGEX.sub(convert, html_text)
+
+
+def parse_highlight_steps(line_numbers):
+    """Parse the `data-line-numbers` syntax (e.g. "1,2|3,5-10") into a list of steps.
+
+    Each step is a list of `(start, end)` line ranges. An empty step highlights nothing.
+    """
+    steps = []
+    for step in re.sub(r"\s", "", line_numbers).split("|"):
+        ranges = []
+        for highlight in step.split(","):
+            if re.match(r"^[\d-]+$", highlight):
+                bounds = highlight.split("-")
+                start = int(bounds[0]) if bounds[0] else None
+                end = int(bounds[1]) if len(bounds) > 1 and bounds[1] else start
+                if start is not None:
+                    ranges.append((start, end))
+        steps.append(ranges)
+    return steps
+
+
+@lru_cache(maxsize=1024)
+def highlight_code(code, language="", line_numbers=None):
+    """Return the highlighted markup of a code block.
+
+    `line_numbers` is the content of the ```` ```lang [...] ```` brackets (None
+    if there are none). With line numbers, the code is laid out in a table and
+    every highlight step after the first becomes a fragment.
+    """
+    _require(get_lexer_by_name, "pygments")
+    lines = _highlight_lines(code, language)
+    classes = "hljs " + escape(language) if language else "hljs"
+
+    if line_numbers is None:
+        return '<pre class="code-wrapper"><code class="%s">%s</code></pre>\n' % (classes, "\n".join(lines))
+
+    blocks = []
+    steps = parse_highlight_steps(line_numbers)
+    for i, (step, step_source) in enumerate(zip(steps, re.sub(r"\s", "", line_numbers).split("|"))):
+        highlighted = set()
+        for start, end in step:
+            highlighted.update(range(start, end + 1))
+        rows = "".join(
+            '<tr%s><td class="hljs-ln-line hljs-ln-numbers" data-line-number="%d"><div class="hljs-ln-n" data-line-number="%d">%d</div></td>'
+            '<td class="hljs-ln-line hljs-ln-code" data-line-number="%d">%s</td></tr>'
+            % (' class="highlight-line"' if n in highlighted else "", n, n, n, n, line or " ")
+            for n, line in enumerate(lines, 1)
+        )
+        block_classes = classes + (" has-highlights" if highlighted else "") + (" fragment" if i > 0 else "")
+        blocks.append('<code class="%s" data-line-numbers="%s"><table class="hljs-ln">%s</table></code>'
+                      % (block_classes, escape(step_source), rows))
+    return '<pre class="code-wrapper">%s</pre>\n' % "".join(blocks)
+
+
+@lru_cache(maxsize=None)
+def code_stylesheet():
+    """The stylesheet of pre-rendered code blocks: the colors of `CODE_STYLE` for their token
+    classes (the short class names of pygments' `HtmlFormatter`). Code blocks only carry the
+    class names, so the stylesheet is sent once instead of styles on every token."""
+    _require(get_lexer_by_name, "pygments")
+    style = get_style_by_name(CODE_STYLE)
+    rules = [
+        ".reveal .hljs{display:block;overflow-x:auto;padding:0.5em;background:%s;color:%s}"
+        % (style.background_color, _color(style.style_for_token(Token).get("color")) or "#f8f8f2"),
+        ".reveal .hljs-ln{border-collapse:collapse}",
+    ]
+    rules.extend(".reveal .hljs .%s{%s}" % (name, css) for name, css in sorted(_class_styles().items()))
+    return "\n".join(rules)
+
+
+@lru_cache(maxsize=None)
+def _class_styles():
+    # The css of every token class that does not look like plain text
+    style = get_style_by_name(CODE_STYLE)
+    default_css = _token_css(style, Token)
+    styles = {}
+    for token_type, name in STANDARD_TYPES.items():
+        css = _token_css(style, token_type)
+        if name and css != default_css:
+            styles[name] = css
+    return styles
+
+
+def _token_class(token_type):
+    # The class of the closest standard token type
+    while token_type not in STANDARD_TYPES:
+        token_type = token_type.parent
+    return STANDARD_TYPES[token_type]
+
+
+def _highlight_lines(code, language):
+    try:
+        lexer = get_lexer_by_name(language) if language else get_lexer_by_name("text")
+    except ClassNotFound:
+        lexer = get_lexer_by_name("text")
+
+    # Text in the default style is not wrapped in a span
+    styled = _class_styles()
+    lines = [[]]
+    for token_type, value in lexer.get_tokens(code):
+        name = _token_class(token_type)
+        if name not in styled:
+            name = ""
+        for i, part in enumerate(value.split("\n")):
+            if i:
+                lines.append([])
+            if part:
+                lines[-1].append('<span class="%s">%s</span>' % (name, escape(part)) if name else escape(part))
+    # The lexer always ends the code with a newline
+    if len(lines) > 1 and not lines[-1]:
+        lines.pop()
+    return ["".join(line) for line in lines]
+
+
+def _color(value):
+    return "#" + value if value and not value.startswith("#") else value
+
+
+def _token_css(style, token_type):
+    token_style = style.style_for_token(token_type)
+    css = []
+    if token_style.get("color"):
+        css.append("color:" + _color(token_style["color"]))
+    if token_style.get("bold"):
+        css.append("font-weight:bold")
+    if token_style.get("italic"):
+        css.append("font-style:italic")
+    if token_style.get("underline"):
+        css.append("text-decoration:underline")
+    return ";".join(css)
@@ -0,0 +1,105 @@
+"""Performance records of decks.
+
+With `slides(..., profile=True)` the frontend measures where time goes while
+a deck is loaded and sends the measurements back with the presentation
+state. They are combined with what Python measured (payload size, compile
+time) into a `Timings` record, returned under the "profile" key of the
+component value. `aggregate_timings` summarizes records collected across
+sessions (e.g. from logs) to find slow decks.
+"""
+import math
+import statistics
+
+# Plugins whose initialization typesets the slides (math rendering, code highlighting)
+TYPESET_PLUGINS = ("highlight", "katex", "mathjax2", "mathjax3")
+
+
+class Timings(object):
+    """Where the time went while a deck was loaded.
+
+    Durations are in milliseconds (None if not measured, e.g. the frontend has
+    not reported yet or the deck does not use the plugin involved).
+
+    - `payload_size`: bytes of component arguments (deck, notes, search index, styles, options) sent to the frontend on this run
+    - `compile_time`: time spent compiling the markdown in Python on this run
+    - `markdown_parse`: time the markdown plugin took to parse the deck in the browser
+    - `plugin_load`: time spent fetching the plugin chunks
+    - `plugin_init`: initialization time of each plugin, by plugin id
+    - `typeset`: total initialization time of the math and highlight plugins
+    - `initialize`: duration of the reveal.js initialization (including plugin initialization)
+    - `theme_load`: time spent loading the theme css
+    - `frame_height_calls`: number of times the frame height was sent to Streamlit
+    """
+
+    __slots__ = ("payload_size", "compile_time", "markdown_parse", "plugin_load", "plugin_init", "typeset", "initialize", "theme_load", "frame_height_calls")
+
+    def __init__(self, payload_size=0, compile_time=None, markdown_parse=None, plugin_load=None, plugin_init=None, typeset=None, initialize=None, theme_load=None, frame_height_calls=0):
+        self.payload_size = payload_size
+        self.compile_time = compile_time
+        self.markdown_parse = markdown_parse
+        self.plugin_load = plugin_load
+        self.plugin_init = dict(plugin_init or {})
+        self.typeset = typeset
+        self.initialize = initialize
+        self.theme_load = theme_load
+        self.frame_height_calls = frame_height_calls
+
+    @classmethod
+    def from_report(cls, report, payload_size=0, compile_time=None):
+        """Build a record from the measurements sent by the frontend."""
+        report = report or {}
+        plugin_init = report.get("plugin_init") or {}
+        typeset_times = [plugin_init[name] for name in TYPESET_PLUGINS if name in plugin_init]
+        return cls(
+            payload_size=payload_size,
+            compile_time=compile_time,
+            markdown_parse=plugin_init.get("markdown"),
+            plugin_load=report.get("plugin_load"),
+            plugin_init=plugin_init,
+            typeset=sum(typeset_times) if typeset_times else None,
+            initialize=report.get("initialize"),
+            theme_load=report.get("theme_load"),
+            frame_height_calls=report.get("frame_height_calls", 0),
+        )
+
+    def as_dict(self):
+        """Return the record as a (JSON serializable) dict."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __eq__(self, other):
+        return isinstance(other, Timings) and self.as_dict() == other.as_dict()
+
+    def __repr__(self):
+        return "Timings(%s)" % ", ".join("%s=%r" % item for item in self.as_dict().items())
+
+
+def aggregate_timings(records):
+    """Summarize `Timings` records (or their `as_dict()`) collected across sessions.
+
+    Returns a dict that maps each measurement (plugin initialization times as
+    "plugin_init.<id>") to the `count`, `mean`, `median`, `p95` and `max` of
+    the records that have it.
+    """
+    values = {}
+    for record in records:
+        if isinstance(record, Timings):
+            record = record.as_dict()
+        for name, value in record.items():
+            if name == "plugin_init":
+                for plugin, duration in (value or {}).items():
+                    if duration is not None:
+                        values.setdefault("plugin_init." + plugin, []).append(duration)
+            elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                values.setdefault(name, []).append(value)
+
+    summary = {}
+    for name, samples in values.items():
+        samples.sort()
+        summary[name] = {
+            "count": len(samples),
+            "mean": statistics.mean(samples),
+            "median": statistics.median(samples),
+            "p95": samples[min(len(samples) - 1, int(math.ceil(0.95 * len(samples))) - 1)],
+            "max": samples[-1],
+        }
+    return summary
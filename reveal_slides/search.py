@@ -0,0 +1,162 @@
+"""Full-text search over the slides of a deck.
+
+`slides(..., search_index=True)` builds an inverted index of the text of every
+slide in Python, memoized per deck, and sends it to the frontend once per
+session. There it replaces the DOM walk of the `search` plugin: Ctrl+Shift+F
+queries the index and jumps from one matching slide to the next, including
+slides of windowed decks that are not mounted. `search(deck, query)` runs the
+same query in Python.
+
+A query matches the slides that contain all of its words. The last word also
+matches as a prefix, so results follow the query as it is typed.
+"""
+import re
+from bisect import bisect_left
+from functools import lru_cache
+from html.parser import HTMLParser
+
+from . import compiler, window
+
+# Words are runs of ASCII letters, digits and underscores or of any character from
+# U+00C0 on (characters outside the BMP included). The frontend splits queries with
+# the same expression, matching code points rather than UTF-16 code units.
+_WORD_REGEX = re.compile("[0-9a-z_\u00c0-\U0010ffff]+")
+# Text of these elements is not part of what a viewer reads on a slide
+_SKIPPED_ELEMENTS = frozenset(["script", "style", "aside"])
+
+
+def tokenize(text):
+    """Return the lowercase words of `text`."""
+    return _WORD_REGEX.findall(text.lower())
+
+
+class _TextExtractor(HTMLParser):
+
+    def __init__(self):
+        HTMLParser.__init__(self, convert_charrefs=True)
+        self.parts = []
+        self.skipping = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _SKIPPED_ELEMENTS:
+            self.skipping += 1
+
+    def handle_endtag(self, tag):
+        if tag in _SKIPPED_ELEMENTS and self.skipping:
+            self.skipping -= 1
+
+    def handle_data(self, data):
+        if not self.skipping:
+            self.parts.append(data)
+
+
+def slide_text(markup):
+    """Return the text a viewer reads on a compiled slide (without its speaker notes)."""
+    extractor = _TextExtractor()
+    extractor.feed(markup)
+    extractor.close()
+    return " ".join(extractor.parts)
+
+
+class SearchIndex(object):
+    """An inverted index of the words of a deck.
+
+    `positions` lists the `(indexh, indexv)` coordinates of the slides, `tokens` the
+    words of the deck in sorted order and `postings` (parallel to `tokens`) the
+    sorted numbers of the positions each word appears on. `digest` identifies the
+    content the index was built from.
+    """
+
+    __slots__ = ("positions", "tokens", "postings", "digest")
+
+    def __init__(self, positions, tokens, postings, digest=None):
+        self.positions = positions
+        self.tokens = tokens
+        self.postings = postings
+        self.digest = digest
+
+    @classmethod
+    def from_texts(cls, texts, digest=None):
+        """Build an index from `((indexh, indexv), text)` pairs."""
+        positions = []
+        words = {}
+        for number, (position, text) in enumerate(texts):
+            positions.append(tuple(position))
+            for token in set(tokenize(text)):
+                words.setdefault(token, []).append(number)
+        tokens = sorted(words)
+        return cls(positions, tokens, [words[token] for token in tokens], digest)
+
+    def _matches(self, token, prefix):
+        start = bisect_left(self.tokens, token)
+        if not prefix:
+            return set(self.postings[start]) if start < len(self.tokens) and self.tokens[start] == token else set()
+        matches = set()
+        for index in range(start, len(self.tokens)):
+            if not self.tokens[index].startswith(token):
+                break
+            matches.update(self.postings[index])
+        return matches
+
+    def search(self, query):
+        """Return the `(indexh, indexv)` positions of the slides matching `query`, in deck order."""
+        terms = tokenize(query)
+        result = None
+        for index, term in enumerate(terms):
+            matches = self._matches(term, prefix=index == len(terms) - 1)
+            result = matches if result is None else result & matches
+            if not result:
+                return []
+        return [self.positions[number] for number in sorted(result or ())]
+
+    def serialize(self):
+        """The wire form of the index: `{"positions": ..., "tokens": ..., "postings": ...}`."""
+        return {"positions": [list(position) for position in self.positions], "tokens": self.tokens, "postings": self.postings}
+
+    def __len__(self):
+        return len(self.positions)
+
+
+def _compiled_texts(sections):
+    for indexh, section in enumerate(sections):
+        for indexv, markup in enumerate(section if isinstance(section, list) else [section]):
+            yield (indexh, indexv), slide_text(markup)
+
+
+@lru_cache(maxsize=compiler.DEFAULT_CACHE_SIZE)
+def index_deck(deck):
+    """Return the `SearchIndex` of a `CompiledDeck` (memoized per compiled deck)."""
+    return SearchIndex.from_texts(_compiled_texts(deck.sections), deck.digest)
+
+
+_item_indexes = compiler._LRUCache(compiler.DEFAULT_CACHE_SIZE)
+
+
+def index_items(items, markdown_props=None, options=None, prerender=False):
+    """Return the `SearchIndex` of the items of a windowed deck (a sequence of markdown or
+    `Slide` objects), memoized per content. Every item is compiled to build the index."""
+    digest = compiler.content_digest([item if isinstance(item, str) else _item_digest(item) for item in items], markdown_props, options, prerender)
+    index = _item_indexes.get(digest)
+    if index is None:
+        index = SearchIndex.from_texts(_compiled_texts([window.compile_item(item, markdown_props, options, prerender) for item in items]), digest)
+        _item_indexes.put(digest, index)
+    return index
+
+
+def _item_digest(item):
+    return [child.digest for child in item] if isinstance(item, list) else item.digest
+
+
+def search(deck, query, markdown_props=None, options=None):
+    """Return the `(indexh, indexv)` positions of the slides of `deck` that match `query`.
+
+    `deck` may be markdown, a `Deck` or a compiled deck, and `markdown_props` and
+    `options` (the `markdown` section of the reveal.js config) are the ones given to
+    `slides`. A position can be passed as `initial_state` to jump to it:
+
+        hits = rs.search(deck, "quarterly revenue")
+        rs.slides(deck, initial_state={"indexh": hits[0][0], "indexv": hits[0][1]})
+    """
+    if not isinstance(deck, compiler.CompiledDeck):
+        deck = compiler.compile_deck(deck, markdown_props, options)
+    return index_deck(deck).search(query)
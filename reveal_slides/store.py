@@ -0,0 +1,289 @@
+"""A persistent, content-addressed store of compiled decks.
+
+Compiled decks are cached in memory, so after a deploy or restart the first
+viewer of every deck pays for its compilation. A `DeckStore` keeps compiled
+decks on disk under their digest (the same digest `compile_deck` caches them
+under), and `compile_deck` loads a deck from the store configured with
+`compiler.set_store` before compiling it:
+
+    python -m reveal_slides.store decks/ --store build/decks --config '{"markdown": {"animateLists": true}}'
+
+    rs.compiler.set_store("build/decks")
+    rs.slides(open("decks/onboarding.md").read(), precompile=True, key="onboarding")
+
+The decks must be compiled with the same `markdown_props`, `markdown` config,
+`prerender` and `lazy_media` as they are shown with, or their digests differ
+and they are compiled again (and not stored).
+
+Each artifact is a small JSON header followed by the markup of the slides:
+the header lays out the slides (vertical stacks are nested) as byte ranges of
+the body, the speaker notes as byte ranges within them, and lists the plugins
+and theme assets the deck needs. Artifacts are read with `mmap`, so only the
+header is parsed and each slide is decoded straight from the mapped file when
+the deck first uses it.
+"""
+import argparse
+import json
+import mmap
+import os
+import re
+import sys
+import tempfile
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+
+from . import compiler, prerender as prerendering
+
+MAGIC = b"reveal-slides-deck 1\n"
+EXTENSION = ".deck"
+
+# Markup the plugins of the browser still have to process in a compiled deck (pre-rendered
+# code blocks are already highlighted and pre-rendered formulas are MathML)
+_CODE_REGEX = re.compile(r'<pre[^>]*><code(?! class="hljs)')
+_MATH_REGEX = re.compile(r"\$\$|\\\(|\\\[")
+
+
+class DeckStore(object):
+    """Compiled decks on disk, in `directory`, named after their digest."""
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def path(self, digest):
+        """The path of the artifact of the deck with `digest`."""
+        return os.path.join(self.directory, digest[:2], digest + EXTENSION)
+
+    def __contains__(self, digest):
+        return os.path.isfile(self.path(digest))
+
+    def save(self, deck, theme=None, plugins=None):
+        """Write a compiled deck to the store (replacing any artifact with the same digest).
+
+        `theme` adds the stylesheet and fonts of that theme to the artifact's assets, and
+        `plugins` (those of the `config` the deck is shown with) picks the math plugin
+        recorded for formulas (see `required_plugins`). Returns the path of the artifact.
+        """
+        body = []
+        size = [0]
+
+        def span(markup):
+            data = markup.encode("utf-8")
+            body.append(data)
+            size[0] += len(data)
+            return [size[0] - len(data), size[0]]
+
+        layout = []
+        notes = {}
+        for indexh, section in enumerate(deck.sections):
+            spans = []
+            for indexv, markup in enumerate(section if isinstance(section, list) else [section]):
+                start, end = span(markup)
+                spans.append([start, end])
+                html = deck.notes_for(indexh, indexv)
+                if html is not None:
+                    # The notes are the end of the slide's markup (see `split_notes_markup`)
+                    length = len(html.encode("utf-8")) + len(compiler._NOTES_CLOSE)
+                    notes["%d/%d" % (indexh, indexv)] = [end - length, end - len(compiler._NOTES_CLOSE)]
+            layout.append(spans if isinstance(section, list) else spans[0])
+
+        header = {
+            "digest": deck.digest,
+            "attributes": deck.attributes,
+            "layout": layout,
+            "notes": notes,
+            "plugins": required_plugins(deck, plugins),
+            "assets": theme_assets(theme) if theme else [],
+        }
+        path = self.path(deck.digest)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Written next to the artifact and renamed, so readers never see a partial file
+        fd, temporary = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(MAGIC)
+                f.write(json.dumps(header, separators=(",", ":")).encode("utf-8"))
+                f.write(b"\n")
+                f.writelines(body)
+            os.replace(temporary, path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+        return path
+
+    def header(self, digest):
+        """Return the header of a stored deck (its layout, notes, plugins and assets), or None."""
+        artifact = self._open(digest)
+        if artifact is None:
+            return None
+        with artifact as (data, header, body):
+            return header
+
+    def load(self, digest):
+        """Return the stored `CompiledDeck` with `digest`, or None if there is none.
+
+        The deck keeps the artifact mapped, and each slide is decoded when it is first used.
+        """
+        artifact = self._open(digest)
+        if artifact is None:
+            return None
+        data, header, body = artifact.map()
+        return compiler.CompiledDeck(header["digest"], _StoredSections(data, body, header["layout"]), header["attributes"])
+
+    def notes_for(self, digest, indexh, indexv=0):
+        """Return the speaker notes (html) of a slide of a stored deck, or None."""
+        artifact = self._open(digest)
+        if artifact is None:
+            return None
+        with artifact as (data, header, body):
+            span = header["notes"].get("%d/%d" % (indexh, indexv))
+            return data[body + span[0]:body + span[1]].decode("utf-8") if span else None
+
+    def _open(self, digest):
+        try:
+            f = open(self.path(digest), "rb")
+        except FileNotFoundError:
+            return None
+        return _Artifact(f)
+
+
+class _Artifact(object):
+    # The mapped file, its header and the offset of its body
+
+    def __init__(self, f):
+        self.file = f
+        self.data = None
+
+    def map(self):
+        # The mapping stays valid after the file is closed, until it is closed or dropped
+        try:
+            data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                if data[:len(MAGIC)] != MAGIC:
+                    raise ValueError("%s is not a compiled deck." % self.file.name)
+                end = data.find(b"\n", len(MAGIC))
+                header = json.loads(data[len(MAGIC):end].decode("utf-8"))
+            except BaseException:
+                data.close()
+                raise
+        finally:
+            self.file.close()
+        return data, header, end + 1
+
+    def __enter__(self):
+        self.data, header, body = self.map()
+        return self.data, header, body
+
+    def __exit__(self, *exc_info):
+        if self.data is not None:
+            self.data.close()
+
+
+class _StoredSections(Sequence):
+    """The `sections` of a stored deck: each entry is decoded from the mapped artifact
+    the first time it is used."""
+
+    def __init__(self, data, body, layout):
+        self._data = data
+        self._body = body
+        self._layout = layout
+        self._decoded = [None] * len(layout)
+
+    def _text(self, span):
+        return self._data[self._body + span[0]:self._body + span[1]].decode("utf-8")
+
+    def __len__(self):
+        return len(self._layout)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        section = self._decoded[index]
+        if section is None:
+            entry = self._layout[index]
+            section = [self._text(span) for span in entry] if isinstance(entry[0], list) else self._text(entry)
+            self._decoded[index] = section
+        return section
+
+
+def required_plugins(deck, plugins=None):
+    """The plugins the browser needs for a compiled deck: `highlight` for code blocks, a math
+    plugin for formulas that were not pre-rendered and `notes` for speaker notes.
+
+    The math plugin is the one of `plugins` (those the deck is shown with), or `katex`
+    (the default math plugin of reveal.js) if there is none.
+    """
+    html = deck.html
+    required = []
+    if _CODE_REGEX.search(html):
+        required.append("highlight")
+    if _MATH_REGEX.search(html):
+        configured = [name for name in prerendering.STEP_PLUGINS["math"] if name in (plugins or ())]
+        required.extend(configured or ["katex"])
+    if compiler._NOTES_OPEN in html:
+        required.append("notes")
+    return required
+
+
+def theme_assets(theme):
+    """The component build files (stylesheet and fonts) of `theme`."""
+    from .export import _theme_manifest
+
+    themes = _theme_manifest()["themes"]
+    if theme not in themes:
+        raise ValueError("Unknown theme: %s. Expected any of: %s." % (theme, ", ".join(sorted(themes))))
+    return [themes[theme]["css"]] + themes[theme]["fonts"]
+
+
+def _compile_file(task):
+    # Runs in a worker process: compile one deck and store it there, so only the digest travels back
+    path, directory, markdown_props, options, plugins, prerender, lazy_media, theme = task
+    with open(path, encoding="utf-8") as f:
+        content = f.read()
+    deck = compiler.compile_deck(content, markdown_props, options, prerender, lazy_media)
+    DeckStore(directory).save(deck, theme, plugins)
+    return path, deck.digest
+
+
+def compile_directory(source, directory, markdown_props=None, config=None, prerender=False, lazy_media=False, theme=None, processes=None, pattern=".md"):
+    """Compile every deck under `source` (files ending with `pattern`) into the store in `directory`.
+
+    Decks are compiled in a pool of `processes` worker processes (one per CPU by
+    default). `markdown_props`, `config`, `prerender` and `lazy_media` are the ones the
+    decks are shown with. Returns {path: digest}.
+    """
+    paths = sorted(os.path.join(root, name) for root, _, names in os.walk(source) for name in names if name.endswith(pattern))
+    options = (config or {}).get("markdown")
+    plugins = (config or {}).get("plugins", [])
+    if prerender:
+        # The same steps as `slides` runs for the plugins of `config`
+        prerender = prerendering.prerender_steps(plugins)
+    tasks = [(path, directory, markdown_props or {}, options, plugins, prerender, lazy_media, theme) for path in paths]
+    if processes == 1 or len(tasks) < 2:
+        return dict(_compile_file(task) for task in tasks)
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        return dict(pool.map(_compile_file, tasks, chunksize=max(1, len(tasks) // (4 * (processes or os.cpu_count() or 1)))))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compile a directory of markdown decks into a deck store.")
+    parser.add_argument("source", help="directory of markdown decks")
+    parser.add_argument("--store", required=True, help="directory of the deck store")
+    parser.add_argument("--markdown-props", type=json.loads, default={}, help="the markdown_props (JSON) the decks are shown with")
+    parser.add_argument("--config", type=json.loads, default={}, help="the config (JSON) the decks are shown with")
+    parser.add_argument("--prerender", action="store_true")
+    parser.add_argument("--lazy-media", action="store_true")
+    parser.add_argument("--theme", help="record the stylesheet and fonts of this theme with each deck")
+    parser.add_argument("--processes", type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument("--pattern", default=".md", help="file name ending of the decks")
+    args = parser.parse_args(argv)
+
+    digests = compile_directory(args.source, args.store, args.markdown_props, args.config, args.prerender, args.lazy_media,
+                                args.theme, args.processes, args.pattern)
+    for path, digest in sorted(digests.items()):
+        print("%s  %s" % (digest, path))
+    print("%d deck(s) compiled into %s" % (len(digests), args.store))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
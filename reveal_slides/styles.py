@@ -0,0 +1,91 @@
+"""One stylesheet per theme and custom css, served by url.
+
+By default the frontend imports the theme's stylesheet chunk and injects the
+`css` of `slides` as a global style on every render. With
+`slides(..., merge_css=True)` the theme and the custom css are merged into one
+minified stylesheet in Python instead. The stylesheet (and the theme's fonts)
+are served through Streamlit's media endpoint, whose urls are named after the
+content, so browsers cache the stylesheet across reruns and sessions and the
+frontend only swaps it (and lays the deck out again) when its url changes.
+"""
+import os
+import re
+from functools import lru_cache
+
+from . import compiler, export, media
+
+# Font types of the theme stylesheets (not all of them are known to `mimetypes`)
+FONT_TYPES = {".woff2": "font/woff2", ".woff": "font/woff", ".ttf": "font/ttf", ".otf": "font/otf", ".eot": "application/vnd.ms-fontobject", ".svg": "image/svg+xml"}
+
+# Comments and string literals, whichever starts first: quotes in a comment do not start a
+# string, and "/*" in a string does not start a comment
+_TOKEN_REGEX = re.compile(r"""(/\*.*?\*/|"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')""", re.S)
+_SPACE_REGEX = re.compile(r"\s+")
+_PUNCTUATION_REGEX = re.compile(r"\s*([{};,>])\s*")
+
+
+def minify_css(css):
+    """Strip the comments and the whitespace that does not matter from a stylesheet."""
+    # Comments are dropped. Odd parts are string literals, which are kept as they are.
+    parts = [""]
+    for index, token in enumerate(_TOKEN_REGEX.split(css)):
+        if index % 2 == 0:
+            parts[-1] += token
+        elif not token.startswith("/*"):
+            parts.extend([token, ""])
+    for index in range(0, len(parts), 2):
+        text = _SPACE_REGEX.sub(" ", parts[index])
+        parts[index] = _PUNCTUATION_REGEX.sub(r"\1", text).replace(";}", "}")
+    return "".join(parts).strip()
+
+
+@lru_cache(maxsize=None)
+def theme_css(theme):
+    """Return the stylesheet of `theme` from the component build and the build paths of its fonts."""
+    themes = export._theme_manifest()["themes"]
+    if theme not in themes:
+        raise ValueError("Unknown theme: %s. Expected any of: %s." % (theme, ", ".join(sorted(themes))))
+    text = export._SOURCE_MAP_REGEX.sub("", export._read_build_file(themes[theme]["css"]).decode("utf-8"))
+    return text, tuple(sorted(set(os.path.join("static", "media", match.group(2)) for match in export._MEDIA_URL_REGEX.finditer(text))))
+
+
+@lru_cache(maxsize=compiler.DEFAULT_CACHE_SIZE)
+def merge_css(theme, css, font_urls=()):
+    """Merge the stylesheet of `theme` with the custom `css` (which comes last, so it overrides
+    the theme) into one minified stylesheet. `font_urls` ((build path, url) pairs) point the
+    theme at where its fonts are served."""
+    text, fonts = theme_css(theme)
+    urls = dict(font_urls)
+
+    def font_url(match):
+        path = os.path.join("static", "media", match.group(2))
+        return "url(%s%s)" % (urls.get(path, "../../" + path), match.group(3))
+
+    return minify_css(export._MEDIA_URL_REGEX.sub(font_url, text) + "\n" + (css or ""))
+
+
+@lru_cache(maxsize=64)
+def _read_font(path):
+    return export._read_build_file(path)
+
+
+def serve_stylesheet(theme, css, key=None):
+    """Serve the merged stylesheet of `theme` and `css` (and the theme's fonts) for this run.
+
+    Returns the url of the stylesheet relative to the component, or None when there
+    is no Streamlit server (e.g. in bare mode).
+    """
+    from streamlit import runtime
+
+    if not runtime.exists():
+        return None
+    manager = runtime.get_instance().media_file_mgr
+    font_urls = []
+    for path in theme_css(theme)[1]:
+        url = manager.add(_read_font(path), FONT_TYPES.get(os.path.splitext(path)[1], "application/octet-stream"), "reveal_slides.%s.%s" % (key, path))
+        # The stylesheet is served from the same directory as the fonts
+        font_urls.append((path, url.rsplit("/", 1)[-1]))
+    stylesheet = merge_css(theme, css, tuple(font_urls)).encode("utf-8")
+    # Decks without a key share the coordinates, so they are told apart by their stylesheet
+    coordinates = "reveal_slides.%s.stylesheet.%s" % (key, compiler.content_digest(theme, css))
+    return media._COMPONENT_ROOT + manager.add(stylesheet, "text/css", coordinates)
@@ -0,0 +1,224 @@
+"""Presenter/follower sync across sessions.
+
+A presenting deck (`slides(..., broadcast="all-hands")`) publishes its
+position to a channel of the hub whenever it reports its state. Following
+decks (`slides(..., follow="all-hands")`) pick up the latest position of the
+channel in a fragment, so only the component is rerun (not the follower's
+script) and the frontend moves to the new position with `setState` (the
+position travels as `initial_state`) instead of rebuilding the deck. With the
+in-process backend, publishing reruns the fragments of the followers of the
+channel (see `follow_fragment`), so idle followers do not rerun at all. Other
+backends may carry positions published in other processes, which `subscribe`
+does not see, so their followers check the channel every `follow_interval`
+seconds instead. Followers never report their own navigation, so viewers do
+not cause any reruns.
+
+Rerunning the fragment of another session relies on private parts of
+Streamlit (its session manager and the sessions' fragment storage, client
+state and event loop). `push_supported` checks that they are there before
+followers rely on them. If publishing runs into a change of them anyway,
+followers check their channel every `follow_interval` seconds from their next
+run on.
+
+The hub keeps the latest message of each channel in a backend. The default
+`InProcessBackend` is shared by all the sessions of one Streamlit server
+process; `set_backend` plugs in another one (e.g. backed by Redis for several
+server processes, or a fresh in-process backend in tests). A backend has two
+methods: `publish(channel, message)` and `latest(channel)`.
+"""
+import threading
+import time
+
+# The parts of the presentation state presenters share with their followers
+SYNC_FIELDS = ("indexh", "indexv", "indexf", "overview")
+
+# Seconds between two checks for a new position of a followed channel
+DEFAULT_FOLLOW_INTERVAL = 0.5
+
+# The private attributes of Streamlit sessions and client state messages `follow_fragment` uses
+_SESSION_ATTRIBUTES = ("_fragment_storage", "_client_state", "_event_loop", "request_rerun")
+_CLIENT_STATE_FIELDS = ("fragment_id", "is_auto_rerun")
+
+# Set when a follower ran into Streamlit internals that changed: followers then check their channel
+_push_failed = False
+
+
+class InProcessBackend(object):
+    """Keeps the latest message of each channel in memory."""
+
+    def __init__(self):
+        self._messages = {}
+        self._lock = threading.Lock()
+
+    def publish(self, channel, message):
+        with self._lock:
+            self._messages[channel] = message
+
+    def latest(self, channel):
+        with self._lock:
+            return self._messages.get(channel)
+
+
+class Hub(object):
+    """Fans the state of presenting decks out to their followers.
+
+    Messages are dicts with the shared `state` (see `SYNC_FIELDS`), a `version`
+    that grows with every change and the `time` it was published.
+    """
+
+    def __init__(self, backend=None):
+        self.backend = backend if backend is not None else InProcessBackend()
+        self._subscribers = {}
+        self._lock = threading.Lock()
+
+    def publish(self, channel, state):
+        """Publish the state of a presenting deck. Returns the version of the channel.
+
+        A state that is the same as the latest one is not published again.
+        """
+        state = dict((field, state.get(field)) for field in SYNC_FIELDS)
+        with self._lock:
+            latest = self.backend.latest(channel)
+            if latest is not None and latest["state"] == state:
+                return latest["version"]
+            message = {"version": latest["version"] + 1 if latest is not None else 1, "state": state, "time": time.time()}
+            self.backend.publish(channel, message)
+            subscribers = list(self._subscribers.get(channel, ()))
+        for callback in subscribers:
+            callback(message)
+        return message["version"]
+
+    def latest(self, channel):
+        """Return the latest message of `channel` (None if nothing was published yet)."""
+        return self.backend.latest(channel)
+
+    def delivers_all(self):
+        """Whether every state published to the channels of the backend goes through this hub."""
+        return isinstance(self.backend, InProcessBackend)
+
+    def subscribe(self, channel, callback):
+        """Call `callback(message)` for every state published in this process to `channel`.
+
+        Returns a function that cancels the subscription.
+        """
+        with self._lock:
+            self._subscribers.setdefault(channel, []).append(callback)
+
+        def unsubscribe():
+            with self._lock:
+                if callback in self._subscribers.get(channel, ()):
+                    self._subscribers[channel].remove(callback)
+
+        return unsubscribe
+
+
+_hub = Hub()
+
+
+def get_hub():
+    """Return the hub shared by every deck of this process."""
+    return _hub
+
+
+def set_backend(backend):
+    """Replace the backend of the shared hub (e.g. with a fresh `InProcessBackend` in tests)."""
+    _hub.backend = backend if backend is not None else InProcessBackend()
+
+
+def _fragment_id(ctx):
+    # Streamlit has kept the id of the fragment that is running in different places
+    fragment_id = getattr(ctx, "current_fragment_id", None)
+    if fragment_id is None:
+        try:
+            from streamlit.runtime.scriptrunner_utils.script_run_context import ThreadState
+
+            fragment_id = ThreadState.get().fragment_id
+        except (ImportError, AttributeError, RuntimeError):
+            return None
+    return fragment_id
+
+
+def _session_manager():
+    from streamlit import runtime
+
+    if not runtime.exists():
+        return None
+    manager = getattr(runtime.get_instance(), "_session_mgr", None)
+    return manager if hasattr(manager, "get_active_session_info") else None
+
+
+def push_supported():
+    """Whether followers can be rerun when their channel is published to (see `follow_fragment`),
+    instead of checking it every `follow_interval` seconds."""
+    if _push_failed or not _hub.delivers_all():
+        return False
+    try:
+        from streamlit.proto.ClientState_pb2 import ClientState
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+    except ImportError:
+        return False
+    if not all(field in ClientState.DESCRIPTOR.fields_by_name for field in _CLIENT_STATE_FIELDS):
+        return False
+    ctx = get_script_run_ctx()
+    manager = _session_manager()
+    if ctx is None or manager is None:
+        return False
+    info = manager.get_active_session_info(ctx.session_id)
+    return info is not None and all(hasattr(info.session, name) for name in _SESSION_ATTRIBUTES)
+
+
+def _give_up_push(unsubscribe):
+    # Streamlit's internals are not what `follow_fragment` expects: followers check their channel instead
+    global _push_failed
+    _push_failed = True
+    unsubscribe()
+
+
+def follow_fragment(channel, subscription=None):
+    """Rerun the fragment that is running now whenever a new state is published to `channel`.
+
+    `subscription` is what the previous call returned for the same deck: it is kept
+    while the channel and the fragment are the same, and cancelled otherwise. Returns
+    the subscription, or None when the fragment cannot be rerun from other sessions.
+    """
+    from streamlit.proto.ClientState_pb2 import ClientState
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    ctx = get_script_run_ctx()
+    manager = _session_manager()
+    fragment_id = _fragment_id(ctx) if ctx is not None else None
+    if subscription is not None:
+        if subscription[:2] == (channel, fragment_id):
+            return subscription
+        subscription[2]()
+    if not fragment_id or manager is None:
+        return None
+    session_id = ctx.session_id
+
+    def rerun(session):
+        # Runs on the event loop of the follower's session, like the reruns its browser asks for
+        try:
+            if not session._fragment_storage.contains(fragment_id):
+                # A full run of the script dropped the fragment (e.g. the deck is no longer shown)
+                unsubscribe()
+                return
+            client_state = ClientState()
+            client_state.CopyFrom(session._client_state)
+            client_state.fragment_id = fragment_id
+            client_state.is_auto_rerun = True
+            session.request_rerun(client_state)
+        except (AttributeError, TypeError, ValueError):
+            _give_up_push(unsubscribe)
+
+    def on_publish(message):
+        try:
+            info = manager.get_active_session_info(session_id)
+            if info is None:
+                unsubscribe()
+                return
+            info.session._event_loop.call_soon_threadsafe(rerun, info.session)
+        except (AttributeError, TypeError):
+            _give_up_push(unsubscribe)
+
+    unsubscribe = _hub.subscribe(channel, on_publish)
+    return (channel, fragment_id, unsubscribe)
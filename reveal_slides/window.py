@@ -0,0 +1,126 @@
+"""Windowed rendering of very large decks.
+
+Only the current slide and a few of its neighbours are compiled, sent and
+mounted in the frontend. When the viewer navigates close to the edge of the
+mounted slides, the frontend asks for the window around its new position
+(see the `window` argument of `slides`).
+"""
+from . import compiler
+
+
+class SlideSource(object):
+    """Random access to the slides of a windowed deck.
+
+    `slides` may be a sequence of markdown strings, any other iterable
+    (e.g. a generator, consumed only as far as needed) or a callable that
+    takes a slide index and returns the markdown of that slide.
+    """
+
+    __slots__ = ("total", "_get", "_iterator", "_items")
+
+    def __init__(self, slides, total=None):
+        self._iterator = None
+        self._items = None
+        if isinstance(slides, str):
+            raise TypeError("Windowed decks take a sequence, iterable or callable of slides, not a single string.")
+        if callable(slides):
+            self._get = slides
+        elif hasattr(slides, "__getitem__") and hasattr(slides, "__len__"):
+            self._get = slides.__getitem__
+            if total is None:
+                total = len(slides)
+        else:
+            self._iterator = iter(slides)
+            self._items = []
+            self._get = self._from_iterator
+        if total is None:
+            raise ValueError("`total` is required when the slides are given as a callable or an iterator.")
+        self.total = int(total)
+
+    def __len__(self):
+        return self.total
+
+    def __getitem__(self, index):
+        if not 0 <= index < self.total:
+            raise IndexError("Slide index %d is out of range (total %d)." % (index, self.total))
+        return self._get(index)
+
+    def _from_iterator(self, index):
+        while len(self._items) <= index:
+            try:
+                self._items.append(next(self._iterator))
+            except StopIteration:
+                raise IndexError("The slides ran out before index %d." % index)
+        return self._items[index]
+
+
+def window_range(center, total, size):
+    """Return the `(start, stop)` range of slides mounted around `center`."""
+    center = max(0, min(center, total - 1))
+    return max(0, center - size), min(total, center + size + 1)
+
+
+def compile_item(markdown, markdown_props=None, options=None, prerender=False, lazy_media=False):
+    """Compile one item of a windowed deck.
+
+    Returns the `<section>` markup of the slide, or a list with the markup of
+    each slide when the item is split into a vertical stack. Items of a `Deck`
+    (a `Slide` or a list of them) are compiled as they are.
+
+    Items are compiled through the per-slide cache of the compiler, not the cache of
+    compiled decks, so the mounted window does not evict the decks of other components.
+    """
+    options = compiler._compile_options(options, prerender, lazy_media)
+    if not isinstance(markdown, str):
+        return compiler._slide_object_sections([markdown], markdown_props or {}, options)[0]
+    # Every markdown item is exactly one horizontal slide (optionally split into a vertical stack)
+    markdown_props = dict(markdown_props or {})
+    markdown_props["data-separator"] = compiler.NO_SEPARATOR
+    return compiler._markdown_sections(markdown, markdown_props, options)[0]
+
+
+def item_notes(source, indexh, indexv=0, markdown_props=None, options=None, prerender=False, lazy_media=False):
+    """Return the speaker notes (html) of the slide at `(indexh, indexv)` of a windowed deck, or None."""
+    if not 0 <= indexh < len(source):
+        return None
+    item = compile_item(source[indexh], markdown_props, options, prerender, lazy_media)
+    if isinstance(item, list):
+        item = item[indexv] if 0 <= indexv < len(item) else None
+    elif indexv != 0:
+        item = None
+    return compiler.split_notes_markup(item)[1] if item is not None else None
+
+
+def window_patch(source, center, size, markdown_props=None, options=None, known_ids=(), prerender=False, lazy_media=False):
+    """Build the patch that mounts the window of `size` slides on each side of `center`.
+
+    The patch has the same shape as `diff.deck_patch` plus the `offset` of the
+    first mounted slide, the `total` number of slides and the window `size`.
+    Slide ids include the slide index, so the frontend keeps mounted slides
+    that are still in the window.
+    """
+    known_ids = set(known_ids)
+    start, stop = window_range(center, len(source), size)
+    layout = []
+    slides = {}
+    for index in range(start, stop):
+        item = compile_item(source[index], markdown_props, options, prerender, lazy_media)
+        if isinstance(item, list):
+            ids = ["%d-%d-%s" % (index, v, compiler.content_digest(markup)) for v, markup in enumerate(item)]
+            slides.update((slide_id, markup) for slide_id, markup in zip(ids, item) if slide_id not in known_ids)
+            layout.append(ids)
+        else:
+            slide_id = "%d-%s" % (index, compiler.content_digest(item))
+            if slide_id not in known_ids:
+                slides[slide_id] = item
+            layout.append(slide_id)
+
+    return {
+        "digest": compiler.content_digest(layout),
+        "layout": layout,
+        "attributes": compiler.forwarded_attributes(markdown_props),
+        "slides": slides,
+        "offset": start,
+        "total": len(source),
+        "size": size,
+    }
@@ -9,7 +9,7 @@ setuptools.setup(
     long_description="create and add reveal.js HTML presentations to your streamlit app",
     long_description_content_type="text/plain",
     url="https://github.com/bouzidanas/streamlit.io/tree/master/streamlit-reveal-slides",
-    packages=setuptools.find_packages(),
+    packages=setuptools.find_packages(exclude=["benchmarks", "benchmarks.*"]),
     include_package_data=True,
     classifiers=[],
     python_requires=">=3.6",
@@ -18,5 +18,12 @@ setuptools.setup(
         # If your component has other Python dependencies, list
         # them here.
         "streamlit >= 0.63",
+        "markdown-it-py >= 2.0",
     ],
+    extras_require={
+        # Pre-rendering of math and code blocks in python (`slides(..., prerender=True)`)
+        "prerender": ["pygments", "latex2mathml"],
+        # PDF and image export in headless Chromium (`export_pdf`, `export_images`, `export_batch`)
+        "export": ["playwright"],
+    },
 )
@@ -0,0 +1,53 @@
+import json
+import textwrap
+
+import pytest
+
+import reveal_slides
+
+
+def _component_args(node):
+    proto = getattr(node, "proto", None)
+    if proto is not None and getattr(proto, "json_args", None):
+        yield json.loads(proto.json_args)
+    children = getattr(node, "children", None)
+    for child in (children.values() if isinstance(children, dict) else ()):
+        yield from _component_args(child)
+
+
+@pytest.fixture
+def deck_app():
+    """Run a script that calls `slides` with a frontend build speaking `protocol`
+    (the current one by default). Returns the `AppTest` and a function that lists
+    the arguments each component received on its last run."""
+    from streamlit.testing.v1 import AppTest
+
+    def run(script, protocol=reveal_slides.FRONTEND_PROTOCOL):
+        header = "import streamlit as st\nimport reveal_slides as rs\nrs._PROTOCOL = %d\n" % protocol
+        app = AppTest.from_string(header + textwrap.dedent(script))
+        return app.run(), lambda: list(_component_args(app._tree))
+
+    return run
+
+
+@pytest.fixture
+def bare_slides(monkeypatch):
+    """Call `slides` without a Streamlit server, with a frontend build speaking `protocol`.
+    Returns the value of `slides` and the arguments the component was called with."""
+    import streamlit as st
+
+    st.session_state.pop("_reveal_slides", None)
+    sent = {}
+
+    def component(**arguments):
+        sent.clear()
+        sent.update(arguments)
+        return arguments["default"]
+
+    monkeypatch.setattr(reveal_slides, "_component_func", component)
+
+    def run(*args, protocol=reveal_slides.FRONTEND_PROTOCOL, **kwargs):
+        monkeypatch.setattr(reveal_slides, "_PROTOCOL", protocol)
+        return reveal_slides.slides(*args, **kwargs), dict(sent)
+
+    return run
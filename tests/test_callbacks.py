@@ -0,0 +1,99 @@
+import pytest
+import streamlit as st
+
+import reveal_slides as rs
+from reveal_slides import callbacks, sync
+
+
+@pytest.fixture
+def session_state(monkeypatch):
+    # A plain dict stands in for the session state of a script run
+    state = {}
+    monkeypatch.setattr(st, "session_state", state)
+    return state
+
+
+@pytest.fixture
+def fragments(monkeypatch):
+    # Runs fragments right away, recording the name Streamlit would derive their id from
+    names = []
+
+    def fragment(run_every=None):
+        def decorator(fn):
+            names.append((fn.__qualname__, run_every))
+            return fn
+
+        return decorator
+
+    monkeypatch.setattr(st, "fragment", fragment, raising=False)
+    return names
+
+
+def test_callbacks_are_registered_for_a_deck(session_state):
+    @rs.on_slide(1, key="deck")
+    def panel(state):
+        pass
+
+    assert panel.__name__ == "panel"
+    rs.on_fragment(1, 0, 2, print, key="deck")
+    assert session_state["_reveal_slides_callbacks"]["deck"]["registered"] == [(1, None, None, panel), (1, 0, 2, print)]
+    with pytest.raises(ValueError, match="key"):
+        rs.on_slide(1, fn=print)
+    with pytest.raises(TypeError):
+        rs.on_slide(1, fn="panel", key="deck")
+
+
+def test_activate_replaces_the_callbacks_of_the_previous_run(session_state):
+    rs.on_slide(0, fn=print, key="deck")
+    assert callbacks.activate("deck") == [(0, None, None, print)]
+    assert callbacks.activate("deck") == []
+
+
+def test_dispatch_calls_the_callbacks_of_the_position(session_state):
+    called = []
+    rs.on_slide(1, fn=lambda state: called.append("stack"), key="deck")
+    rs.on_slide(1, 1, fn=lambda state: called.append("slide"), key="deck")
+    rs.on_fragment(1, 1, 0, lambda state: called.append("fragment"), key="deck")
+    callbacks.activate("deck")
+    callbacks.dispatch("deck", {"indexh": 1, "indexv": 1, "indexf": -1})
+    assert called == ["stack", "slide"]
+    callbacks.dispatch("deck", {"indexh": 1, "indexv": 1, "indexf": 0})
+    callbacks.dispatch("deck", {"indexh": 2, "indexv": 0, "indexf": -1})
+    assert called == ["stack", "slide", "stack", "slide", "fragment"]
+
+
+def test_position_before_the_first_report(monkeypatch):
+    unreported = {"indexh": -1, "indexv": -1, "indexf": -1}
+    assert callbacks.position(unreported) == {"indexh": 0, "indexv": 0, "indexf": -1}
+    assert callbacks.position(unreported, {"indexh": 3}) == {"indexh": 3, "indexv": 0, "indexf": -1}
+    assert callbacks.position({"indexh": 2, "indexv": 1, "indexf": 0}, {"indexh": 3}) == {"indexh": 2, "indexv": 1, "indexf": 0}
+    hub = sync.Hub()
+    monkeypatch.setattr(sync, "_hub", hub)
+    hub.publish("talk", {"indexh": 5, "indexv": 0, "indexf": 1, "overview": False})
+    assert callbacks.position(unreported, follow="talk")["indexh"] == 5
+
+
+def test_decks_with_callbacks_run_in_a_fragment_of_their_own(session_state, bare_slides, fragments):
+    called = []
+    rs.on_slide(0, fn=called.append, key="sales")
+    rs.on_slide(0, fn=called.append, key="costs")
+    bare_slides("# A", key="sales")
+    bare_slides("# B", key="costs")
+    assert fragments == [("slides.fragment.sales", None), ("slides.fragment.costs", None)]
+    assert [state["indexh"] for state in called] == [0, 0]
+
+
+def test_decks_without_callbacks_are_not_fragments(session_state, bare_slides, fragments):
+    bare_slides("# A", key="deck")
+    assert fragments == []
+
+
+def test_callbacks_run_with_the_script_without_fragments(session_state, bare_slides, monkeypatch):
+    monkeypatch.delattr(st, "fragment", raising=False)
+    called = []
+    rs.on_slide(0, fn=called.append, key="deck")
+    bare_slides("# A", key="deck")
+    assert len(called) == 1
+    # Callbacks are registered again on every run
+    bare_slides("# A", key="deck")
+    assert len(called) == 1
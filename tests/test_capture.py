@@ -0,0 +1,88 @@
+import asyncio
+import json
+import os
+
+from reveal_slides import capture
+
+DECK = "# One\n---\n# Two\n--\n# Three"
+
+
+class FakePage(object):
+    """Takes the screenshots of a deck without a browser: one per slide of the staged index.html."""
+
+    def __init__(self, pool, path):
+        self.pool = pool
+        with open(path, encoding="utf-8") as f:
+            html = f.read()
+        self.positions = [{"h": 0}, {"h": 1, "v": 0}, {"h": 1, "v": 1}][:html.count("<h1>")]
+
+    async def evaluate(self, script, arg=None):
+        return self.positions if "getSlides" in script else None
+
+    async def screenshot(self, path):
+        self.pool.screenshots.append(os.path.basename(path))
+        with open(path, "wb") as f:
+            f.write(b"\x89PNG")
+
+    async def pdf(self, path, **options):
+        self.pool.pdfs.append(os.path.basename(path))
+        with open(path, "wb") as f:
+            f.write(b"%PDF")
+
+
+class FakePool(object):
+    def __init__(self, size=1, launch_options=None):
+        self.screenshots = []
+        self.pdfs = []
+        FakePool.last = self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+    async def open(self, path, query="", viewport=None, timeout=None):
+        return FakePage(self, path)
+
+    def release(self, page):
+        pass
+
+
+def test_export_images_only_replaces_slide_images(tmp_path, monkeypatch):
+    monkeypatch.setattr(capture, "BrowserPool", FakePool)
+    target = tmp_path / "out" / "slides"
+    target.mkdir(parents=True)
+    (target / "notes.txt").write_text("keep me")
+    (tmp_path / "out" / "other.png").write_bytes(b"keep me")
+
+    paths = capture.export_images(DECK, str(target))
+    assert [os.path.basename(path) for path in paths] == ["slide-000-00.png", "slide-001-00.png", "slide-001-01.png"]
+    assert (target / "notes.txt").read_text() == "keep me" and (tmp_path / "out" / "other.png").exists()
+    # The manifest stays in the target directory
+    assert "images" in json.loads((target / capture.MANIFEST).read_text())
+    assert not (tmp_path / "out" / capture.MANIFEST).exists()
+
+    # An unchanged deck is not rendered again
+    assert capture.export_images(DECK, str(target)) == paths
+    assert FakePool.last.screenshots == []
+
+    # A shorter deck leaves no stale images behind
+    paths = capture.export_images("# One", str(target))
+    assert [os.path.basename(path) for path in paths] == ["slide-000-00.png"]
+    assert sorted(os.listdir(str(target))) == [capture.MANIFEST, "notes.txt", "slide-000-00.png"]
+
+
+def test_export_batch_skips_unchanged_decks(tmp_path):
+    decks = {"intro": DECK, "outro": "# Bye"}
+    pool = FakePool()
+    results = asyncio.run(capture.export_batch_async(decks, str(tmp_path), images=True, pool=pool))
+    assert results["intro"]["pdf"] == str(tmp_path / "intro.pdf")
+    assert len(results["intro"]["images"]) == 3 and len(results["outro"]["images"]) == 1
+    assert sorted(pool.pdfs) == ["intro.pdf", "outro.pdf"]
+
+    decks["outro"] = "# See you"
+    pool = FakePool()
+    asyncio.run(capture.export_batch_async(decks, str(tmp_path), images=True, pool=pool))
+    assert pool.pdfs == ["outro.pdf"] and pool.screenshots == ["slide-000-00.png"]
+    assert set(json.loads((tmp_path / capture.MANIFEST).read_text())) == {"intro.pdf", "intro/", "outro.pdf", "outro/"}
@@ -0,0 +1,26 @@
+from reveal_slides import compiler
+
+DECK = "# One\n---\n# Two\n---\n# Three"
+
+
+def test_digest_is_stable_and_follows_the_content():
+    assert compiler.compile_deck(DECK).digest == compiler.compile_deck(DECK).digest
+    assert compiler.compile_deck(DECK).digest != compiler.compile_deck(DECK + "!").digest
+    assert compiler.compile_deck(DECK).digest != compiler.compile_deck(DECK, {"data-separator": "^===$"}).digest
+
+
+def test_compiled_decks_are_cached():
+    compiler.clear_cache()
+    deck = compiler.compile_deck(DECK)
+    assert compiler.compile_deck(DECK) is deck
+    assert len(compiler._cache) == 1
+
+
+def test_cache_size_can_be_changed():
+    compiler.set_cache_size(1)
+    try:
+        compiler.compile_deck(DECK)
+        compiler.compile_deck(DECK + "!")
+        assert len(compiler._cache) == 1
+    finally:
+        compiler.set_cache_size(compiler.DEFAULT_CACHE_SIZE)
@@ -0,0 +1,70 @@
+import pytest
+
+from reveal_slides import Deck, Slide, compiler
+
+
+def test_attributes_are_a_read_only_copy():
+    attributes = {"data-background-color": "#283747"}
+    slide = Slide("# A", attributes=attributes)
+    attributes["data-background-color"] = "red"
+    assert slide.attributes["data-background-color"] == "#283747"
+    with pytest.raises(TypeError):
+        slide.attributes["data-auto-animate"] = None
+    assert Slide("# A", attributes={}).attributes is None
+
+
+def test_digest_changes_with_every_part_of_the_slide():
+    slide = Slide("# A")
+    digests = {slide.digest}
+    slide.content = "# B"
+    digests.add(slide.digest)
+    slide.notes = "Psst"
+    digests.add(slide.digest)
+    slide.attributes = {"data-auto-animate": None}
+    digests.add(slide.digest)
+    slide.fragments = ("One",)
+    digests.add(slide.digest)
+    assert len(digests) == 5
+    assert Slide("# B", "Psst", {"data-auto-animate": None}, ["One"]).digest == slide.digest
+
+
+def test_deck_digest_follows_its_slides():
+    deck = Deck(["# A", ["# B", "# C"]])
+    digest = deck.digest
+    assert Deck([Slide("# A"), [Slide("# B"), Slide("# C")]]).digest == digest
+    assert Deck(["# A", "# B", "# C"]).digest != digest
+    deck[1][0].content = "# Changed"
+    assert deck.digest != digest
+
+
+def test_serialize_drops_trailing_empty_parts():
+    deck = Deck()
+    deck.add("# A")
+    deck.add("# B", notes="Psst")
+    deck.add_stack(Slide("# C", attributes={"data-state": "x"}), "# D")
+    deck.add("# E", fragments=["One", "Two"])
+    assert deck.serialize() == [
+        ["# A"],
+        ["# B", "Psst"],
+        [["# C", None, {"data-state": "x"}], ["# D"]],
+        ['# E\n\nOne <!-- .element: class="fragment" -->\n\nTwo <!-- .element: class="fragment" -->'],
+    ]
+
+
+def test_notes_for():
+    deck = Deck([Slide("# A", notes="First"), [Slide("# B"), Slide("# C", notes="Third")]])
+    assert deck.notes_for(0) == "First"
+    assert deck.notes_for(0, 1) is None
+    assert deck.notes_for(1) is None
+    assert deck.notes_for(1, 1) == "Third"
+    assert deck.notes_for(1, 2) is None
+    assert deck.notes_for(2) is None and deck.notes_for(-1) is None
+
+
+def test_slide_objects_compile_like_markdown_slides():
+    deck = Deck([Slide("# One"), [Slide("# Two"), Slide("# Three", notes="Psst")]])
+    compiled = compiler.compile_deck(deck)
+    assert len(compiled) == 2 and len(compiled.sections[1]) == 2
+    assert compiled.notes_for(1, 1) == "<p>Psst</p>\n"
+    assert compiled.without_notes().sections[1][1].count("Psst") == 0
+    assert compiler.compile_deck(deck).digest == compiled.digest
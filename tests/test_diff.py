@@ -0,0 +1,56 @@
+import pytest
+
+from reveal_slides import compiler, diff
+
+DECK = "# One\n---\n# Two\n---\n# Three"
+
+
+def test_slide_ids_survive_edits_of_other_slides():
+    before = compiler.compile_deck(DECK).slide_ids
+    after = compiler.compile_deck("# One\n---\n# Two, edited\n---\n# Three").slide_ids
+    assert before[0] == after[0] and before[2] == after[2]
+    assert before[1] != after[1]
+
+
+def test_duplicate_slides_get_distinct_ids():
+    ids = compiler.compile_deck("# Same\n---\n# Same").slide_ids
+    assert len(set(ids)) == 2
+
+
+def test_per_slide_cache_gives_the_same_markup():
+    compiler.clear_cache()
+    first = compiler.compile_deck(DECK + "\n---\n# Four")
+    compiler._cache.clear()
+    second = compiler.compile_deck(DECK + "\n---\n# Four")
+    assert first.html == second.html and first.digest == second.digest
+
+
+def test_diff_reports_added_removed_and_changed_slides():
+    old = compiler.compile_deck(DECK)
+    new = compiler.compile_deck("# One\n---\n# Three\n---\n# Four")
+    changes = diff.diff_decks(old, new)
+    assert changes["added"] == [new.slide_ids[2]]
+    assert changes["removed"] == [old.slide_ids[1]]
+    assert changes["changed"] == [(1, 0), (2, 0)]
+
+
+def test_patch_only_carries_the_slides_the_frontend_lacks():
+    old = compiler.compile_deck(DECK)
+    new = compiler.compile_deck(DECK + "\n---\n# Four")
+    patch = diff.deck_patch(new, diff.flatten_ids(old.slide_ids))
+    assert patch["digest"] == new.digest
+    assert patch["layout"] == new.slide_ids
+    assert list(patch["slides"]) == [new.slide_ids[3]]
+
+
+def test_incremental_reruns_send_patches(bare_slides):
+    _, first = bare_slides(DECK, incremental=True, key="report")
+    assert first["content"] == "" and len(first["patch"]["slides"]) == 3
+    _, second = bare_slides(DECK + "\n---\n# Four", incremental=True, key="report")
+    assert list(second["patch"]["slides"]) == [compiler.compile_deck(DECK + "\n---\n# Four").slide_ids[3]]
+
+
+def test_incremental_decks_are_sent_whole_to_a_legacy_build(bare_slides):
+    with pytest.warns(RuntimeWarning, match="incremental"):
+        _, sent = bare_slides(DECK, incremental=True, key="legacy", protocol=0)
+    assert sent["patch"] is None and "<h1>Three</h1>" in sent["content"]
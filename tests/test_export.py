@@ -0,0 +1,70 @@
+import os
+import re
+
+import pytest
+
+from reveal_slides import export
+
+DECK = "# A\n---\n# B"
+
+
+def read(path):
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def test_writes_the_deck_and_its_assets(tmp_path):
+    path = export.export_html(DECK, str(tmp_path), theme="white", css=".reveal h1 { color: red; }", config={"plugins": ["markdown", "zoom"]}, title="A & B")
+    assert path == os.path.join(str(tmp_path), "index.html")
+    html = read(path)
+    assert "<h1>A</h1>" in html and "<h1>B</h1>" in html
+    assert "<title>A &amp; B</title>" in html
+
+    stylesheets = re.findall(r'<link rel="stylesheet" href="([^"]+)" />', html)
+    scripts = re.findall(r'<script src="([^"]+)"></script>', html)
+    assert [os.path.basename(href).split(".")[0] for href in stylesheets] == ["reveal", "white", "deck"]
+    assert [os.path.basename(src).split(".")[0] for src in scripts] == ["reveal", "zoom"]
+    for url in stylesheets + scripts:
+        assert re.fullmatch(r"assets/[\w-]+\.[0-9a-f]{16}\.(css|js)", url)
+        assert (tmp_path / url).is_file()
+    # The markdown is compiled in Python, so only the zoom plugin is loaded
+    assert "plugins: [RevealZoom]" in html
+    assert "markdown" not in " ".join(scripts)
+
+
+def test_theme_fonts_are_copied_next_to_the_stylesheets(tmp_path):
+    html = read(export.export_html(DECK, str(tmp_path), theme="black"))
+    theme = re.findall(r'href="(assets/black\.[^"]+)"', html)[0]
+    css = read(str(tmp_path / theme))
+    assert "static/media" not in css and "sourceMappingURL" not in css
+    for font in re.findall(r"url\(([^)'\"?#]+)", css):
+        assert (tmp_path / "assets" / font).is_file()
+
+
+def test_plugins_sharing_a_script_load_it_once(tmp_path):
+    html = read(export.export_html(DECK, str(tmp_path), config={"plugins": ["katex", "mathjax3"]}))
+    assert len(re.findall(r'src="assets/math\.', html)) == 1
+    assert "plugins: [RevealMath.KaTeX, RevealMath.MathJax3]" in html
+
+
+def test_exporting_again_reuses_the_assets(tmp_path):
+    export.export_html(DECK, str(tmp_path))
+    assets = sorted(os.listdir(str(tmp_path / "assets")))
+    export.export_html(DECK, str(tmp_path))
+    assert sorted(os.listdir(str(tmp_path / "assets"))) == assets
+
+
+def test_unknown_themes_and_plugins_are_rejected(tmp_path):
+    with pytest.raises(ValueError, match="Unknown theme"):
+        export.export_html(DECK, str(tmp_path), theme="nope")
+    with pytest.raises(ValueError, match="Unknown plugin"):
+        export.export_html(DECK, str(tmp_path), config={"plugins": ["nope"]})
+
+
+def test_theme_manifest_lists_every_theme_with_its_fonts():
+    manifest = export._theme_manifest()
+    assert {"black", "white", "league"} <= set(manifest["themes"])
+    for entry in [manifest["base"]] + list(manifest["themes"].values()):
+        assert os.path.isfile(os.path.join(export.BUILD_DIR, entry["css"]))
+        assert all(os.path.isfile(os.path.join(export.BUILD_DIR, font)) for font in entry["fonts"])
+    assert manifest["themes"]["black"]["fonts"]
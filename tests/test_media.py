@@ -0,0 +1,73 @@
+import os
+
+import pytest
+
+from reveal_slides import media
+
+
+@pytest.fixture
+def root(tmp_path):
+    (tmp_path / "images").mkdir()
+    (tmp_path / "images" / "chart.png").write_bytes(b"\x89PNG")
+    (tmp_path / "notes.txt").write_text("secret")
+    media.set_media_root(str(tmp_path))
+    yield tmp_path
+    media.set_media_root(None)
+
+
+def test_media_files_under_the_root_are_local(root):
+    assert media.is_local(str(root / "images" / "chart.png"))
+
+
+def test_relative_paths_resolve_from_the_working_directory(root, monkeypatch):
+    monkeypatch.chdir(root)
+    assert media.is_local("images/chart.png")
+    assert media.local_media('<img src="images/chart.png"><img src="https://example.com/a.png">') == ("images/chart.png",)
+
+
+def test_relative_paths_resolve_from_the_media_root(root, tmp_path_factory, monkeypatch):
+    monkeypatch.chdir(str(tmp_path_factory.mktemp("elsewhere")))
+    assert media.is_local("images/chart.png")
+    assert media.local_media('<img src="images/chart.png">') == ("images/chart.png",)
+
+
+def test_files_are_checked_on_every_call(root):
+    markup = '<img src="images/new.png"><img src="images/chart.png">'
+    assert media.local_media(markup) == ("images/chart.png",)
+    (root / "images" / "new.png").write_bytes(b"\x89PNG")
+    assert media.local_media(markup) == ("images/new.png", "images/chart.png")
+    (root / "images" / "chart.png").unlink()
+    assert media.local_media(markup) == ("images/new.png",)
+
+
+def test_files_outside_the_root_are_not_served(root, tmp_path_factory):
+    outside = tmp_path_factory.mktemp("outside") / "photo.png"
+    outside.write_bytes(b"\x89PNG")
+    assert not media.is_local(str(outside))
+    assert not media.is_local("/etc/passwd")
+    assert not media.is_local(str(root / "images" / ".." / ".." / outside.parent.name / "photo.png"))
+
+
+def test_only_media_extensions_are_served(root):
+    assert not media.is_local(str(root / "notes.txt"))
+    assert not media.is_local(str(root / "images" / "missing.png"))
+
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="needs symbolic links")
+def test_symbolic_links_are_resolved_before_the_check(root, tmp_path_factory):
+    secret = tmp_path_factory.mktemp("outside") / "key.pem"
+    secret.write_text("secret")
+    (root / "logo.png").symlink_to(secret)
+    (root / "real.png").symlink_to(root / "images" / "chart.png")
+    assert not media.is_local(str(root / "logo.png"))
+    assert media.is_local(str(root / "real.png"))
+
+
+def test_rejected_references_are_left_as_they_are(root, monkeypatch):
+    monkeypatch.chdir(root)
+    markup = '<img src="/etc/passwd"><img src="images/chart.png">'
+    assert media.rewrite(markup, {"images/chart.png": "../../media/abc.png"}) == '<img src="/etc/passwd"><img src="../../media/abc.png">'
+
+
+def test_serving_needs_a_streamlit_server(root):
+    assert media.serve([str(root / "images" / "chart.png")]) == {}
@@ -0,0 +1,68 @@
+import pytest
+
+from reveal_slides import compiler, prerender
+
+pytest.importorskip("pygments")
+pytest.importorskip("latex2mathml")
+
+DECK = "# Math\n\nArea $\\pi r^2$ for $5 and $10.\n---\n```python\nx = 1\n```"
+
+
+def test_steps_follow_the_plugins():
+    assert prerender.prerender_steps([]) == ()
+    assert prerender.prerender_steps(["zoom"]) == ()
+    assert prerender.prerender_steps(["katex"]) == ("math",)
+    assert prerender.prerender_steps(["highlight", "mathjax3"]) == ("highlight", "math")
+
+
+def test_math_step_only_renders_math():
+    deck = compiler.compile_deck(DECK, prerender=["math"])
+    assert "<math" in deck.html
+    assert 'class="hljs' not in deck.html
+
+
+def test_highlight_step_only_highlights_code():
+    deck = compiler.compile_deck(DECK, prerender=["highlight"])
+    assert "<math" not in deck.html and "$\\pi r^2$" in deck.html
+    assert 'class="hljs' in deck.html
+
+
+def test_no_steps_leaves_the_deck_alone():
+    assert compiler.compile_deck(DECK, prerender=()).html == compiler.compile_deck(DECK).html
+
+
+def test_true_runs_every_step():
+    assert compiler.compile_deck(DECK, prerender=True).html == compiler.compile_deck(DECK, prerender=["highlight", "math"]).html
+
+
+@pytest.mark.parametrize("text", ["$5 and $10", "costs $5, or $ 10", "$x $", "\\$x$"])
+def test_dollar_amounts_are_not_math(text):
+    assert prerender.replace_math(text) == text
+
+
+@pytest.mark.parametrize("text", ["$x$", "$$x^2$$", "\\(x\\)", "\\[x\\]", "area $\\pi r^2$."])
+def test_delimited_formulas_are_math(text):
+    assert "<math" in prerender.replace_math(text)
+
+
+def test_code_carries_class_names_and_the_colors_come_in_one_stylesheet():
+    html = prerender.highlight_code("x = 1", "python")
+    assert "style=" not in html
+    assert '<span class="o">=</span>' in html and '<span class="mi">1</span>' in html
+    stylesheet = prerender.code_stylesheet()
+    assert ".reveal .hljs .o{" in stylesheet and ".reveal .hljs .mi{" in stylesheet
+
+
+def test_slides_drops_the_prerendered_plugins_and_sends_the_code_colors_once(bare_slides):
+    config = {"plugins": ["highlight", "zoom"]}
+    _, sent = bare_slides(DECK, prerender=True, config=config, key="code")
+    assert sent["config"]["plugins"] == ["zoom"]
+    assert "<math" not in sent["content"] and 'class="hljs' in sent["content"]
+    assert sent["code_style"]["css"] == prerender.code_stylesheet()
+    _, again = bare_slides(DECK, prerender=True, config=config, key="code")
+    assert again["code_style"] == {"digest": sent["code_style"]["digest"], "css": None}
+
+
+def test_legacy_build_gets_the_code_colors_with_the_css(bare_slides):
+    _, sent = bare_slides(DECK, prerender=True, config={"plugins": ["highlight"]}, key="legacy-code", protocol=0)
+    assert sent["code_style"] is None and prerender.code_stylesheet() in sent["css"]
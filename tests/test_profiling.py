@@ -0,0 +1,45 @@
+import json
+
+import reveal_slides
+from reveal_slides import Timings, aggregate_timings
+
+DECK = "# One\n---\n# Two\nNote: Psst"
+
+
+def test_from_report_sums_the_typesetting_plugins():
+    report = {"plugin_load": 12.0, "plugin_init": {"markdown": 3.0, "highlight": 5.0, "katex": 7.0, "zoom": 1.0}, "initialize": 40.0, "theme_load": 8.0, "frame_height_calls": 2}
+    timings = Timings.from_report(report, payload_size=100, compile_time=1.5)
+    assert timings.markdown_parse == 3.0
+    assert timings.typeset == 12.0
+    assert timings.plugin_init == report["plugin_init"]
+    assert (timings.payload_size, timings.compile_time, timings.plugin_load, timings.initialize, timings.theme_load, timings.frame_height_calls) == (100, 1.5, 12.0, 40.0, 8.0, 2)
+
+
+def test_from_report_without_measurements():
+    assert Timings.from_report(None, payload_size=10) == Timings(payload_size=10)
+    timings = Timings.from_report({"plugin_init": {"zoom": 1.0}})
+    assert timings.typeset is None and timings.markdown_parse is None and timings.frame_height_calls == 0
+
+
+def test_aggregate_timings():
+    records = [Timings(payload_size=size, initialize=size / 10, plugin_init={"zoom": 1.0}) for size in range(1, 101)]
+    records.append({"payload_size": 0, "initialize": None, "plugin_init": {"zoom": None, "katex": 4.0}, "frame_height_calls": True})
+    summary = aggregate_timings(records)
+    assert summary["payload_size"] == {"count": 101, "mean": 50, "median": 50, "p95": 95, "max": 100}
+    assert summary["initialize"]["count"] == 100
+    assert summary["plugin_init.zoom"]["count"] == 100
+    assert summary["plugin_init.katex"] == {"count": 1, "mean": 4.0, "median": 4.0, "p95": 4.0, "max": 4.0}
+    # Booleans and missing measurements are not samples
+    assert summary["frame_height_calls"]["count"] == 100
+    assert "compile_time" not in summary
+
+
+def test_payload_size_counts_every_argument_sent(bare_slides, monkeypatch):
+    # The speaker view asks for the notes of the second slide
+    monkeypatch.setattr(reveal_slides, "_pending_request", lambda store, value: {"id": "1", "type": "notes", "indexh": 1, "indexv": 0})
+    value, sent = bare_slides(DECK, search_index=True, private_notes=True, presenter=True, profile=True, key="deck")
+    args = {name: arg for name, arg in sent.items() if name not in ("key", "default")}
+    assert value["profile"].payload_size == len(json.dumps(args).encode("utf-8"))
+    assert sent["search_index"] and sent["notes"]
+    plain, _ = bare_slides(DECK, profile=True, key="plain")
+    assert value["profile"].payload_size > plain["profile"].payload_size
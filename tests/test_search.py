@@ -0,0 +1,44 @@
+from reveal_slides import compiler, window
+from reveal_slides.search import index_deck, index_items, search, tokenize
+
+DECK = "# Expense policy\n\nMeals are covered.\n---\n# Travel\n\nBook trains early.\n---\n# Expenses\n\n<!-- .slide: data-state=\"x\" -->\nReceipts for trains."
+
+
+def test_tokenize_lowercases_and_keeps_non_ascii_words():
+    assert tokenize("Grüße, naïve CAFÉ!") == ["grüße", "naïve", "café"]
+
+
+def test_tokenize_treats_characters_outside_the_bmp_as_word_characters():
+    # The frontend splits queries with the same code point ranges (the "u" flag)
+    assert tokenize("a\U0001d4b3b \U0001f600x") == ["a\U0001d4b3b", "\U0001f600x"]
+
+
+def test_index_finds_slides_with_every_word_and_a_prefix_of_the_last():
+    index = index_deck(compiler.compile_deck(DECK))
+    assert index.search("trains") == [(1, 0), (2, 0)]
+    assert index.search("receipts trains") == [(2, 0)]
+    assert index.search("expense") == [(0, 0), (2, 0)]
+    assert index.search("expense polic") == [(0, 0)]
+    assert index.search("unknown") == []
+    assert index.search("") == []
+
+
+def test_index_leaves_out_comments_and_markup():
+    index = index_deck(compiler.compile_deck(DECK))
+    assert index.search("slide") == [] and index.search("data") == []
+
+
+def test_serialized_index_is_parallel_lists():
+    index = index_deck(compiler.compile_deck(DECK))
+    data = index.serialize()
+    assert len(data["tokens"]) == len(data["postings"])
+    assert data["positions"] == [[0, 0], [1, 0], [2, 0]]
+    assert data["tokens"] == sorted(data["tokens"])
+
+
+def test_search_accepts_markdown_and_windowed_items():
+    assert search(DECK, "travel") == [(1, 0)]
+    items = ["# Intro", "# Travel\n\nTrains", "# Outro"]
+    assert index_items(items).search("trains") == [(1, 0)]
+    assert index_items(items).digest == index_items(list(items)).digest
+    assert window.compile_item(items[1]) in compiler.compile_deck("\n---\n".join(items)).sections
@@ -0,0 +1,128 @@
+import pytest
+
+import reveal_slides as rs
+
+DECK_SCRIPT = """
+rs.slides("# One\\n---\\n# Two", precompile=True, key="deck")
+"""
+
+
+def test_precompiled_deck_is_sent_once_then_by_digest(deck_app):
+    app, args = deck_app(DECK_SCRIPT)
+    first = args()[0]
+    assert first["digest"] and "<h1>One</h1>" in first["content"]
+    assert not first["allow_unsafe_html"]
+    app.run()
+    second = args()[0]
+    assert second["digest"] == first["digest"] and second["content"] == ""
+
+
+def test_legacy_build_gets_the_whole_deck_as_markup_on_every_run(deck_app):
+    app, args = deck_app(DECK_SCRIPT, protocol=0)
+    for _ in range(2):
+        sent = args()[0]
+        assert "<h1>One</h1>" in sent["content"] and sent["allow_unsafe_html"]
+        app.run()
+
+
+def test_build_protocol_is_read_from_the_build(tmp_path, monkeypatch):
+    monkeypatch.setattr(rs, "_RELEASE", True)
+    monkeypatch.setattr(rs, "build_dir", str(tmp_path), raising=False)
+    assert rs._build_protocol() == 0
+    (tmp_path / "protocol.json").write_text('{"protocol": 1}')
+    assert rs._build_protocol() == 1
+
+
+def test_report_on_only_takes_reveal_events(bare_slides):
+    _, sent = bare_slides("# A", report_on=("slidechanged", "paused"))
+    assert sent["report_on"] == ["slidechanged", "paused"]
+    with pytest.raises(ValueError, match="slidechange"):
+        bare_slides("# A", report_on=["slidechange"])
+
+
+@pytest.mark.parametrize("debounce", [-1, "300", None, True])
+def test_debounce_is_a_number_of_milliseconds(bare_slides, debounce):
+    with pytest.raises(ValueError, match="debounce"):
+        bare_slides("# A", debounce=debounce)
+
+
+def test_legacy_build_ignores_report_on_with_a_warning(bare_slides):
+    with pytest.warns(RuntimeWarning, match="report_on"):
+        bare_slides("# A", report_on=["slidechanged"], protocol=0)
+
+
+def test_arguments_keep_their_positions(bare_slides):
+    _, sent = bare_slides("# A", 500, "white", ".x {}", {}, {}, {}, False, True, "deck")
+    assert (sent["height"], sent["theme"], sent["css"], sent["display_only"], sent["key"]) == (500, "white", ".x {}", True, "deck")
+    with pytest.raises(TypeError):
+        bare_slides("# A", 500, "white", ".x {}", {}, {}, {}, False, True, "deck", 400)
+
+
+@pytest.mark.parametrize("height_hint, sent_hint", [(400, {"height": 400}), (1.5, {"aspect_ratio": 1.5}), ("16:9", {"aspect_ratio": 16 / 9}), (None, None)])
+def test_height_hint_is_sent_as_a_height_or_an_aspect_ratio(bare_slides, height_hint, sent_hint):
+    _, sent = bare_slides("# A", height_hint=height_hint)
+    assert sent["height_hint"] == sent_hint
+    with pytest.raises(ValueError, match="height_hint"):
+        bare_slides("# A", height_hint="tall")
+
+
+def test_legacy_build_ignores_height_hint_with_a_warning(bare_slides):
+    with pytest.warns(RuntimeWarning, match="height_hint"):
+        bare_slides("# A", height_hint="16:9", protocol=0)
+
+
+NOTES_DECK = "# One\nNote: Psst\n---\n# Two"
+
+
+def notes_request(monkeypatch, indexh):
+    monkeypatch.setattr(rs, "_pending_request", lambda store, value: {"id": "notes-%d" % indexh, "type": "notes", "indexh": indexh, "indexv": 0})
+
+
+def test_private_notes_are_only_sent_to_the_presenter(bare_slides, monkeypatch):
+    notes_request(monkeypatch, 0)
+    _, sent = bare_slides(NOTES_DECK, private_notes=True, key="viewer")
+    assert "Psst" not in sent["content"] and sent["notes"] is None
+    _, sent = bare_slides(NOTES_DECK, private_notes=True, presenter=True, key="presenter")
+    assert "Psst" not in sent["content"]
+    assert sent["notes"] == {"indexh": 0, "indexv": 0, "html": "<p>Psst</p>\n", "request": "notes-0"}
+
+
+def test_private_notes_of_windowed_decks(bare_slides, monkeypatch):
+    notes_request(monkeypatch, 0)
+    _, sent = bare_slides(NOTES_DECK.split("\n---\n"), window=1, private_notes=True, presenter=True, key="deck")
+    assert all("Psst" not in markup for markup in sent["patch"]["slides"].values())
+    assert sent["notes"]["html"] == "<p>Psst</p>\n"
+
+
+def test_private_notes_need_markdown(bare_slides):
+    with pytest.raises(ValueError, match="private_notes"):
+        bare_slides("<section>One<aside class=\"notes\">Psst</aside></section>", allow_unsafe_html=True, private_notes=True, key="deck")
+
+
+def test_legacy_build_keeps_private_notes_out_with_a_warning(bare_slides):
+    with pytest.warns(RuntimeWarning, match="private_notes"):
+        _, sent = bare_slides(NOTES_DECK, private_notes=True, presenter=True, key="deck", protocol=0)
+    assert "Psst" not in sent["content"]
+
+
+def test_performance_mode_is_validated(bare_slides):
+    _, sent = bare_slides("# A", performance_mode="auto")
+    assert sent["performance_mode"] == "auto"
+    with pytest.raises(ValueError, match="performance_mode"):
+        bare_slides("# A", performance_mode="fast")
+
+
+def test_legacy_build_gets_the_low_power_options_in_the_config(bare_slides):
+    config = {"transition": "zoom", "backgroundTransition": "slide", "parallaxBackgroundImage": "bg.png", "plugins": ["zoom"]}
+    with pytest.warns(RuntimeWarning, match="performance_mode"):
+        _, sent = bare_slides("# A", config=config, preload=4, performance_mode="low_power", protocol=0)
+    assert sent["config"] == {"transition": "none", "backgroundTransition": "slide", "parallaxBackgroundImage": "", "plugins": ["zoom"],
+                              "viewDistance": 1, "mobileViewDistance": 1, "autoAnimate": False}
+    _, sent = bare_slides("# A", config=config, performance_mode="low_power")
+    assert sent["config"] == config
+
+
+def test_legacy_build_renders_auto_mode_as_configured_with_a_warning(bare_slides):
+    with pytest.warns(RuntimeWarning, match="performance_mode"):
+        _, sent = bare_slides("# A", config={"transition": "zoom"}, performance_mode="auto", protocol=0)
+    assert sent["config"] == {"transition": "zoom"}
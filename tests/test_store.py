@@ -0,0 +1,77 @@
+import pytest
+
+from reveal_slides import compiler, store
+
+DECK = "# Intro\n\n$$x^2$$\n---\n# Code\n\n```python\nx = 1\n```\n\nNote: Say hi"
+VERTICAL = "# One\n---\n# Two\n--\n# Three\nNote: Last"
+
+
+@pytest.fixture
+def deck_store(tmp_path):
+    return store.DeckStore(str(tmp_path))
+
+
+def test_round_trip_keeps_the_deck(deck_store):
+    for content, props in ((DECK, {}), (VERTICAL, {"data-separator-vertical": "^--$"})):
+        deck = compiler.compile_deck(content, props)
+        deck_store.save(deck)
+        assert deck.digest in deck_store
+        loaded = deck_store.load(deck.digest)
+        assert loaded.digest == deck.digest
+        assert loaded.html == deck.html
+        assert loaded.slide_ids == deck.slide_ids
+        assert list(loaded.sections) == list(deck.sections)
+
+
+def test_notes_are_read_from_the_artifact(deck_store):
+    deck = compiler.compile_deck(VERTICAL, {"data-separator-vertical": "^--$"})
+    deck_store.save(deck)
+    assert deck_store.notes_for(deck.digest, 1, 1) == deck.notes_for(1, 1) == "<p>Last</p>\n"
+    assert deck_store.notes_for(deck.digest, 0) is None
+    assert deck_store.load(deck.digest).notes_for(1, 1) == deck.notes_for(1, 1)
+
+
+def test_load_decodes_slides_when_they_are_used(deck_store):
+    deck = compiler.compile_deck(VERTICAL, {"data-separator-vertical": "^--$"})
+    deck_store.save(deck)
+    loaded = deck_store.load(deck.digest)
+    assert loaded.sections._decoded == [None, None]
+    assert loaded.sections[1] == deck.sections[1]
+    assert loaded.sections._decoded[0] is None
+
+
+def test_missing_decks(deck_store):
+    assert "0" * 16 not in deck_store
+    assert deck_store.load("0" * 16) is None
+    assert deck_store.header("0" * 16) is None
+
+
+def test_header_lists_the_plugins_the_browser_needs(deck_store):
+    deck = compiler.compile_deck(DECK)
+    deck_store.save(deck, plugins=["mathjax3"])
+    assert deck_store.header(deck.digest)["plugins"] == ["highlight", "mathjax3", "notes"]
+    assert store.required_plugins(deck) == ["highlight", "katex", "notes"]
+
+
+def test_compile_deck_loads_from_the_store(deck_store):
+    deck = compiler.compile_deck(DECK)
+    deck_store.save(deck)
+    compiler._cache.clear()
+    compiler.set_store(deck_store)
+    try:
+        loaded = compiler.compile_deck(DECK)
+    finally:
+        compiler.set_store(None)
+    assert isinstance(loaded.sections, store._StoredSections)
+    assert loaded.html == deck.html
+
+
+def test_compile_directory(tmp_path):
+    source = tmp_path / "decks"
+    source.mkdir()
+    (source / "a.md").write_text("# A")
+    (source / "b.md").write_text("# B\n---\n# C")
+    directory = str(tmp_path / "store")
+    digests = store.compile_directory(str(source), directory, processes=1)
+    assert sorted(digests.values()) == sorted(compiler.compile_deck(text).digest for text in ("# A", "# B\n---\n# C"))
+    assert all(digest in store.DeckStore(directory) for digest in digests.values())
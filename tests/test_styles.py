@@ -0,0 +1,48 @@
+import pytest
+
+from reveal_slides import styles
+
+
+def test_minify_css_drops_comments_and_spaces():
+    assert styles.minify_css("a { color: red; }\n/* b { color: blue; } */\nc > d , e { margin: 0 ; }") == "a{color: red}c>d,e{margin: 0}"
+
+
+def test_minify_css_keeps_strings_as_they_are():
+    assert styles.minify_css('a::before { content: "/* ; } */"; }') == 'a::before{content: "/* ; } */"}'
+    assert styles.minify_css("a::before { content: '  {  }  '; }") == "a::before{content: '  {  }  '}"
+
+
+def test_minify_css_ignores_quotes_in_comments():
+    css = "/* don't */ a { color: red; } /* \"unbalanced */ b { content: 'x'; }"
+    assert styles.minify_css(css) == "a{color: red}b{content: 'x'}"
+
+
+def test_merge_css_puts_the_custom_css_after_the_theme():
+    merged = styles.merge_css("black", ".reveal h1 { color: red; }")
+    assert merged.endswith(".reveal h1{color: red}")
+    assert merged.startswith(styles.minify_css(styles.theme_css("black")[0])[:40])
+    assert "sourceMappingURL" not in merged
+
+
+def test_merge_css_points_the_theme_at_its_fonts():
+    text, fonts = styles.theme_css("black")
+    assert fonts and all(font.startswith("static/media/") for font in fonts)
+    assert "url(../../%s" % fonts[0] in styles.merge_css("black", "")
+    merged = styles.merge_css("black", "", tuple((font, "font-%d" % index) for index, font in enumerate(fonts)))
+    assert "static/media" not in merged and "url(font-0" in merged
+
+
+def test_unknown_themes_are_rejected():
+    with pytest.raises(ValueError, match="Unknown theme"):
+        styles.theme_css("nope")
+
+
+def test_legacy_build_ignores_merge_css_with_a_warning(bare_slides):
+    with pytest.warns(RuntimeWarning, match="merge_css"):
+        _, sent = bare_slides("# A", css=".x {}", merge_css=True, protocol=0)
+    assert sent["stylesheet"] is None and sent["css"] == ".x {}"
+
+
+def test_merge_css_needs_a_streamlit_server(bare_slides):
+    _, sent = bare_slides("# A", css=".x {}", merge_css=True)
+    assert sent["stylesheet"] is None and sent["css"] == ".x {}"
@@ -0,0 +1,116 @@
+import types
+
+import pytest
+
+from reveal_slides import sync
+
+STATE = {"indexh": 1, "indexv": 0, "indexf": -1, "overview": False, "paused": True}
+
+
+@pytest.fixture
+def hub(monkeypatch):
+    hub = sync.Hub()
+    monkeypatch.setattr(sync, "_hub", hub)
+    monkeypatch.setattr(sync, "_push_failed", False)
+    return hub
+
+
+def test_publish_shares_the_sync_fields_with_a_growing_version(hub):
+    assert hub.latest("talk") is None
+    assert hub.publish("talk", STATE) == 1
+    assert hub.latest("talk")["state"] == {"indexh": 1, "indexv": 0, "indexf": -1, "overview": False}
+    assert hub.publish("talk", dict(STATE, paused=False)) == 1
+    assert hub.publish("talk", dict(STATE, indexh=2)) == 2
+    assert hub.latest("other") is None
+
+
+def test_subscribers_get_every_new_state_until_they_unsubscribe(hub):
+    received = []
+    unsubscribe = hub.subscribe("talk", received.append)
+    hub.publish("talk", STATE)
+    hub.publish("talk", STATE)
+    hub.publish("other", STATE)
+    assert [message["version"] for message in received] == [1]
+    unsubscribe()
+    unsubscribe()
+    hub.publish("talk", dict(STATE, indexh=2))
+    assert len(received) == 1
+
+
+def test_set_backend_replaces_the_shared_backend(hub):
+    class Backend(object):
+        def __init__(self):
+            self.messages = {}
+
+        def publish(self, channel, message):
+            self.messages[channel] = message
+
+        def latest(self, channel):
+            return self.messages.get(channel)
+
+    backend = Backend()
+    sync.set_backend(backend)
+    assert sync.get_hub() is hub and hub.backend is backend
+    hub.publish("talk", STATE)
+    assert backend.messages["talk"]["version"] == 1
+    # Positions may be published in other processes: followers check their channel
+    assert not hub.delivers_all() and not sync.push_supported()
+    sync.set_backend(None)
+    assert isinstance(hub.backend, sync.InProcessBackend) and hub.delivers_all()
+
+
+def test_push_needs_a_streamlit_server(hub):
+    assert not sync.push_supported()
+
+
+class Loop(object):
+    def call_soon_threadsafe(self, callback, *args):
+        callback(*args)
+
+
+class Session(object):
+    def __init__(self):
+        from streamlit.proto.ClientState_pb2 import ClientState
+
+        self._fragment_storage = types.SimpleNamespace(contains=lambda fragment_id: fragment_id == "fragment")
+        self._client_state = ClientState(page_name="deck")
+        self._event_loop = Loop()
+        self.reruns = []
+
+    def request_rerun(self, client_state):
+        self.reruns.append(client_state)
+
+
+@pytest.fixture
+def follower(hub, monkeypatch):
+    # A follower session without a Streamlit server: the session manager and the running fragment are stand-ins
+    from streamlit.runtime import scriptrunner
+
+    session = Session()
+    manager = types.SimpleNamespace(get_active_session_info=lambda session_id: types.SimpleNamespace(session=session))
+    monkeypatch.setattr(scriptrunner, "get_script_run_ctx", lambda: types.SimpleNamespace(session_id="session"))
+    monkeypatch.setattr(sync, "_session_manager", lambda: manager)
+    monkeypatch.setattr(sync, "_fragment_id", lambda ctx: "fragment")
+    return session
+
+
+def test_publishing_reruns_the_fragment_of_followers(hub, follower):
+    assert sync.push_supported()
+    subscription = sync.follow_fragment("talk")
+    assert sync.follow_fragment("talk", subscription) is subscription
+    hub.publish("talk", STATE)
+    assert [(state.fragment_id, state.is_auto_rerun, state.page_name) for state in follower.reruns] == [("fragment", True, "deck")]
+    # Following another channel cancels the subscription
+    sync.follow_fragment("other", subscription)
+    hub.publish("talk", dict(STATE, indexh=2))
+    assert len(follower.reruns) == 1
+
+
+def test_followers_check_their_channel_when_streamlit_internals_changed(hub, follower):
+    del follower._event_loop
+    assert not sync.push_supported()
+    sync.follow_fragment("talk")
+    hub.publish("talk", STATE)
+    assert follower.reruns == [] and not hub._subscribers["talk"]
+    assert sync._push_failed
+    assert not sync.push_supported()
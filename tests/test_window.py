@@ -0,0 +1,70 @@
+import pytest
+
+from reveal_slides import compiler, diff, window
+
+SLIDES = ["# Slide %d" % index for index in range(20)]
+
+
+def test_window_is_clamped_to_the_deck():
+    assert window.window_range(0, 20, 3) == (0, 4)
+    assert window.window_range(10, 20, 3) == (7, 14)
+    assert window.window_range(25, 20, 3) == (16, 20)
+
+
+def test_window_patch_mounts_the_slides_around_the_center():
+    patch = window.window_patch(window.SlideSource(SLIDES), 10, 2)
+    assert patch["offset"] == 8 and patch["total"] == 20 and patch["size"] == 2
+    assert len(patch["layout"]) == 5
+    assert "Slide 8" in patch["slides"][patch["layout"][0]]
+    assert set(patch["slides"]) == set(patch["layout"])
+
+
+def test_moving_the_window_only_sends_new_slides():
+    source = window.SlideSource(SLIDES)
+    first = window.window_patch(source, 10, 2)
+    second = window.window_patch(source, 11, 2, known_ids=diff.flatten_ids(first["layout"]))
+    assert list(second["slides"]) == [second["layout"][-1]]
+    assert "Slide 13" in second["slides"][second["layout"][-1]]
+    assert second["digest"] != first["digest"]
+
+
+def test_window_items_do_not_go_through_the_deck_cache():
+    compiler._cache.clear()
+    window.window_patch(window.SlideSource(SLIDES), 5, 3)
+    assert len(compiler._cache) == 0
+
+
+def test_sources_from_callables_and_iterators():
+    assert window.SlideSource(lambda index: "# %d" % index, total=3)[2] == "# 2"
+    source = window.SlideSource(iter(SLIDES), total=20)
+    assert source[4] == "# Slide 4"
+    with pytest.raises(ValueError):
+        window.SlideSource(iter(SLIDES))
+    with pytest.raises(IndexError):
+        source[20]
+
+
+def test_slides_sends_the_window_around_the_initial_slide(bare_slides):
+    _, sent = bare_slides(SLIDES, window=2, initial_state={"indexh": 10}, key="windowed")
+    patch = sent["patch"]
+    assert sent["content"] == "" and sent["digest"] == patch["digest"]
+    assert patch["offset"] == 8 and patch["total"] == 20 and len(patch["layout"]) == 5
+    _, again = bare_slides(SLIDES, window=2, initial_state={"indexh": 10}, key="windowed")
+    assert again["patch"]["slides"] == {} and again["patch"]["layout"] == patch["layout"]
+
+
+def test_slides_moves_the_window_when_the_frontend_asks(bare_slides, monkeypatch):
+    import reveal_slides
+
+    bare_slides(SLIDES, window=2, key="asked")
+    monkeypatch.setattr(reveal_slides, "_pending_request", lambda store, value: {"id": "1", "type": "window", "index": 15})
+    _, sent = bare_slides(SLIDES, window=2, key="asked")
+    assert sent["patch"]["offset"] == 13
+    assert "Slide 17" in sent["patch"]["slides"][sent["patch"]["layout"][-1]]
+
+
+def test_windowed_decks_need_a_key_and_a_current_build(bare_slides):
+    with pytest.raises(ValueError, match="key"):
+        bare_slides(SLIDES, window=2)
+    with pytest.raises(RuntimeError, match="npm run build"):
+        bare_slides(SLIDES, window=2, key="legacy", protocol=0)